@@ -6,11 +6,16 @@ design patterns and detect anti-patterns in existing code.
 """
 
 import ast
+import heapq
+import os
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice, takewhile
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from .pattern_knowledge import (
     PATTERN_KNOWLEDGE,
@@ -29,7 +34,30 @@ class OpportunityType(Enum):
     COMPLEXITY_REDUCTION = "complexity_reduction"
 
 
-@dataclass
+# Weights combined by PatternOpportunity.priority_score
+_CONFIDENCE_WEIGHT: Dict[PatternConfidence, float] = {
+    PatternConfidence.LOW: 0.2,
+    PatternConfidence.MEDIUM: 0.5,
+    PatternConfidence.HIGH: 0.8,
+    PatternConfidence.CRITICAL: 1.0,
+}
+_EFFORT_WEIGHT: Dict[str, float] = {"Low": 1.0, "Medium": 0.7, "High": 0.4}
+_IMPACT_WEIGHT: Dict[str, float] = {"Low": 0.3, "Medium": 0.6, "High": 1.0}
+
+# Name keywords the detectors look for, matched against lower-cased names
+_DATA_MODEL_RE = re.compile(
+    r"user|product|order|customer|item|model|entity|record|data|person|account|invoice"
+)
+_SINGLETON_RE = re.compile(
+    r"database|connection|config|settings|logger|cache|registry|manager|service|client"
+)
+_FACTORY_NAME_RE = re.compile(r"create|factory")
+_COMMAND_NAME_RE = re.compile(r"execute|run|perform|do")
+_NOTIFY_ITER_RE = re.compile(r"observer|listener|subscriber|notification")
+_NOTIFY_METHOD_RE = re.compile(r"update|notify|on_|handle")
+
+
+@dataclass(slots=True, frozen=True)
 class PatternOpportunity:
     """Represents a pattern implementation opportunity in code"""
 
@@ -45,25 +73,38 @@ class PatternOpportunity:
     reasoning: str
     effort_estimate: str  # "Low", "Medium", "High"
     impact_estimate: str  # "Low", "Medium", "High"
+    # Derived from confidence, effort, and impact once, since sorting and
+    # reporting read it many times
+    priority_score: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def priority_score(self) -> float:
+    def __post_init__(self) -> None:
         """Calculate priority score based on confidence, effort, and impact"""
-        confidence_weight = {
-            PatternConfidence.LOW: 0.2,
-            PatternConfidence.MEDIUM: 0.5,
-            PatternConfidence.HIGH: 0.8,
-            PatternConfidence.CRITICAL: 1.0,
-        }
+        object.__setattr__(
+            self,
+            "priority_score",
+            _CONFIDENCE_WEIGHT[self.confidence] * 0.4
+            + _EFFORT_WEIGHT[self.effort_estimate] * 0.3
+            + _IMPACT_WEIGHT[self.impact_estimate] * 0.3,
+        )
 
-        effort_weight = {"Low": 1.0, "Medium": 0.7, "High": 0.4}
-        impact_weight = {"Low": 0.3, "Medium": 0.6, "High": 1.0}
 
-        return (
-            confidence_weight[self.confidence] * 0.4
-            + effort_weight[self.effort_estimate] * 0.3
-            + impact_weight[self.impact_estimate] * 0.3
-        )
+@dataclass
+class _SubtreeFacts:
+    """Facts gathered from a node's subtree during the single visitor pass"""
+
+    call_names: Set[str] = field(default_factory=set)
+    call_returns: int = 0
+    assigns_self_attribute: bool = False
+    reads_external_attribute: bool = False
+    has_notification_call: bool = False
+
+    def merge(self, other: "_SubtreeFacts") -> None:
+        """Fold a finished child subtree into this one"""
+        self.call_names |= other.call_names
+        self.call_returns += other.call_returns
+        self.assigns_self_attribute |= other.assigns_self_attribute
+        self.reads_external_attribute |= other.reads_external_attribute
+        self.has_notification_call |= other.has_notification_call
 
 
 class CodeAnalyzer(ast.NodeVisitor):
@@ -87,12 +128,31 @@ class CodeAnalyzer(ast.NodeVisitor):
         self.singleton_patterns: List[Tuple[int, str]] = []  # (line, class_name)
         self.factory_patterns: List[Tuple[int, str]] = []  # (line, pattern_description)
 
+        # Subtree facts for the enclosing class/function/if/for nodes, so each
+        # node is visited once instead of re-walked by every detector
+        self._facts_stack: List[_SubtreeFacts] = []
+        self._delegating_functions: Set[ast.FunctionDef] = set()
+
+        # Node type -> visitor method, so visiting a node is one dict lookup
+        # rather than building a "visit_<name>" string and calling getattr
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.If: self.visit_If,
+            ast.For: self.visit_For,
+            ast.Call: self.visit_Call,
+            ast.Return: self.visit_Return,
+            ast.Assign: self.visit_Assign,
+            ast.Attribute: self.visit_Attribute,
+        }
+
     def analyze_file(self, source_code: str) -> List[PatternOpportunity]:
         """Analyze source code and return pattern opportunities"""
         try:
             tree = ast.parse(source_code)
             self.visit(tree)
-            self._detect_patterns()
             return sorted(
                 self.opportunities, key=lambda x: x.priority_score, reverse=True
             )
@@ -100,6 +160,24 @@ class CodeAnalyzer(ast.NodeVisitor):
             # Return empty list for files with syntax errors
             return []
 
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch a node to its visitor method by type"""
+        visitor = self._dispatch.get(type(node))
+        if visitor is None:
+            self.generic_visit(node)
+        else:
+            visitor(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit each child node in field order"""
+        dispatch = self._dispatch
+        for child in ast.iter_child_nodes(node):
+            visitor = dispatch.get(type(child))
+            if visitor is None:
+                self.generic_visit(child)
+            else:
+                visitor(child)
+
     def visit_Import(self, node: ast.Import) -> None:
         """Track imports for context"""
         for alias in node.names:
@@ -124,10 +202,12 @@ class CodeAnalyzer(ast.NodeVisitor):
         # Analyze constructor for builder pattern opportunities
         self._analyze_constructor(node)
 
+        mark = len(self.opportunities)
+        self._visit_subtree(node)
+
         # Check for adapter pattern opportunities
-        self._check_adapter_pattern(node)
+        self._insert_opportunities(mark, self._check_adapter_pattern(node))
 
-        self.generic_visit(node)
         self.current_class = old_class
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
@@ -135,37 +215,105 @@ class CodeAnalyzer(ast.NodeVisitor):
         old_function = self.current_function
         self.current_function = node.name
 
+        mark = len(self.opportunities)
+        facts = self._visit_subtree(node)
+        if facts.reads_external_attribute:
+            self._delegating_functions.add(node)
+
+        found = []
         # Check for factory method patterns
-        if "create" in node.name.lower() or "factory" in node.name.lower():
-            self._check_factory_pattern(node)
+        if _FACTORY_NAME_RE.search(node.name.lower()):
+            found.extend(self._check_factory_pattern(node, facts))
 
         # Analyze function body for patterns
-        self._analyze_function_body(node)
+        found.extend(self._analyze_function_body(node, facts))
+        self._insert_opportunities(mark, found)
 
-        self.generic_visit(node)
         self.current_function = old_function
 
     def visit_If(self, node: ast.If) -> None:
         """Analyze if/elif chains for strategy pattern opportunities"""
-        self._analyze_if_elif_chain(node)
-        self.generic_visit(node)
+        mark = len(self.opportunities)
+        facts = self._visit_subtree(node)
+        self._insert_opportunities(mark, self._analyze_if_elif_chain(node, facts))
 
     def visit_For(self, node: ast.For) -> None:
         """Analyze for loops for observer pattern opportunities"""
-        self._check_observer_pattern_in_loop(node)
+        mark = len(self.opportunities)
+        facts = self._visit_subtree(node)
+        self._insert_opportunities(
+            mark, self._check_observer_pattern_in_loop(node, facts)
+        )
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Record called names and notification-style method calls"""
+        if self._facts_stack:
+            facts = self._facts_stack[-1]
+            if type(node.func) is ast.Name:
+                facts.call_names.add(node.func.id)
+            elif type(node.func) is ast.Attribute:
+                facts.call_names.add(node.func.attr)
+                if _NOTIFY_METHOD_RE.search(node.func.attr.lower()):
+                    facts.has_notification_call = True
+        self.generic_visit(node)
+
+    def visit_Return(self, node: ast.Return) -> None:
+        """Record returns of freshly constructed objects"""
+        if self._facts_stack and type(node.value) is ast.Call:
+            self._facts_stack[-1].call_returns += 1
         self.generic_visit(node)
 
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Record assignments to attributes of self"""
+        if self._facts_stack:
+            for target in node.targets:
+                if (
+                    type(target) is ast.Attribute
+                    and type(target.value) is ast.Name
+                    and target.value.id == "self"
+                ):
+                    self._facts_stack[-1].assigns_self_attribute = True
+                    break
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Record attribute access on objects other than self"""
+        if (
+            self._facts_stack
+            and type(node.value) is ast.Name
+            and node.value.id != "self"
+        ):
+            self._facts_stack[-1].reads_external_attribute = True
+        self.generic_visit(node)
+
+    def _visit_subtree(self, node: ast.AST) -> _SubtreeFacts:
+        """Visit a node's children once and return the facts found beneath it"""
+        facts = _SubtreeFacts()
+        self._facts_stack.append(facts)
+        try:
+            self.generic_visit(node)
+        finally:
+            self._facts_stack.pop()
+        if self._facts_stack:
+            self._facts_stack[-1].merge(facts)
+        return facts
+
+    def _insert_opportunities(self, mark: int, found: List[PatternOpportunity]) -> None:
+        """Place a node's opportunities ahead of those found in its subtree"""
+        if found:
+            self.opportunities[mark:mark] = found
+
     def _check_singleton_pattern(self, node: ast.ClassDef) -> None:
         """Check for singleton pattern usage and anti-patterns"""
         has_new_method = False
         has_instance_variable = False
 
         for item in node.body:
-            if isinstance(item, ast.FunctionDef) and item.name == "__new__":
+            if type(item) is ast.FunctionDef and item.name == "__new__":
                 has_new_method = True
-            elif isinstance(item, ast.Assign):
+            elif type(item) is ast.Assign:
                 for target in item.targets:
-                    if isinstance(target, ast.Name) and target.id == "_instance":
+                    if type(target) is ast.Name and target.id == "_instance":
                         has_instance_variable = True
 
         # Check for singleton implementation
@@ -179,7 +327,7 @@ class CodeAnalyzer(ast.NodeVisitor):
                         confidence=PatternConfidence.CRITICAL,
                         file_path=self.file_path,
                         line_number=node.lineno,
-                        line_end=getattr(node, "end_lineno", None),
+                        line_end=node.end_lineno,
                         description=f"Anti-pattern: {node.name} should not be a singleton",
                         current_code_snippet=f"class {node.name} with singleton implementation",
                         suggested_improvement="Convert to regular class - data models should have multiple instances",
@@ -198,7 +346,7 @@ class CodeAnalyzer(ast.NodeVisitor):
                     confidence=PatternConfidence.MEDIUM,
                     file_path=self.file_path,
                     line_number=node.lineno,
-                    line_end=getattr(node, "end_lineno", None),
+                    line_end=node.end_lineno,
                     description=f"{node.name} could benefit from singleton pattern",
                     current_code_snippet=f"class {node.name}",
                     suggested_improvement="Implement singleton pattern with thread-safe instance control",
@@ -211,7 +359,7 @@ class CodeAnalyzer(ast.NodeVisitor):
     def _analyze_constructor(self, node: ast.ClassDef) -> None:
         """Analyze __init__ method for builder pattern opportunities"""
         for item in node.body:
-            if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+            if type(item) is ast.FunctionDef and item.name == "__init__":
                 param_count = len(item.args.args) - 1  # Exclude 'self'
 
                 # Check for builder pattern opportunity
@@ -231,7 +379,7 @@ class CodeAnalyzer(ast.NodeVisitor):
                             confidence=confidence,
                             file_path=self.file_path,
                             line_number=item.lineno,
-                            line_end=getattr(item, "end_lineno", None),
+                            line_end=item.end_lineno,
                             description=f"Constructor with {param_count} parameters could benefit from Builder pattern",
                             current_code_snippet=f"def __init__(self, {param_count} parameters)",
                             suggested_improvement="Implement Builder pattern for more readable object construction",
@@ -242,19 +390,22 @@ class CodeAnalyzer(ast.NodeVisitor):
                     )
                 break
 
-    def _analyze_if_elif_chain(self, node: ast.If) -> None:
+    def _analyze_if_elif_chain(
+        self, node: ast.If, facts: _SubtreeFacts
+    ) -> List[PatternOpportunity]:
         """Analyze if/elif chains for strategy or factory pattern opportunities"""
+        found = []
         chain_length = 1
         conditions = []
         current = node
 
         # Count the chain length
         while current:
-            if isinstance(current.test, ast.Compare):
+            if type(current.test) is ast.Compare:
                 # Extract comparison for analysis
                 if hasattr(current.test.left, "id"):
                     conditions.append(current.test.left.id)
-            elif isinstance(current.test, ast.Call):
+            elif type(current.test) is ast.Call:
                 # isinstance() calls might indicate factory pattern
                 if (
                     hasattr(current.test.func, "id")
@@ -265,7 +416,7 @@ class CodeAnalyzer(ast.NodeVisitor):
             if (
                 current.orelse
                 and len(current.orelse) == 1
-                and isinstance(current.orelse[0], ast.If)
+                and type(current.orelse[0]) is ast.If
             ):
                 current = current.orelse[0]
                 chain_length += 1
@@ -275,8 +426,8 @@ class CodeAnalyzer(ast.NodeVisitor):
         # Strategy pattern opportunity
         if chain_length >= 3:
             # Check if it's algorithm selection
-            if self._looks_like_algorithm_selection(node):
-                self.opportunities.append(
+            if self._looks_like_algorithm_selection(chain_length, facts):
+                found.append(
                     PatternOpportunity(
                         pattern_name="strategy",
                         opportunity_type=OpportunityType.REFACTOR_TO_PATTERN,
@@ -287,7 +438,7 @@ class CodeAnalyzer(ast.NodeVisitor):
                         ),
                         file_path=self.file_path,
                         line_number=node.lineno,
-                        line_end=getattr(node, "end_lineno", None),
+                        line_end=node.end_lineno,
                         description=f"Long if/elif chain ({chain_length} conditions) suggests Strategy pattern",
                         current_code_snippet=f"if/elif chain with {chain_length} conditions",
                         suggested_improvement="Replace with Strategy pattern for better maintainability",
@@ -299,14 +450,14 @@ class CodeAnalyzer(ast.NodeVisitor):
 
         # Factory pattern opportunity
         if "isinstance" in conditions and chain_length >= 2:
-            self.opportunities.append(
+            found.append(
                 PatternOpportunity(
                     pattern_name="factory",
                     opportunity_type=OpportunityType.REFACTOR_TO_PATTERN,
                     confidence=PatternConfidence.MEDIUM,
                     file_path=self.file_path,
                     line_number=node.lineno,
-                    line_end=getattr(node, "end_lineno", None),
+                    line_end=node.end_lineno,
                     description="Type-based conditionals suggest Factory pattern",
                     current_code_snippet="if/elif with isinstance() checks",
                     suggested_improvement="Use Factory pattern to encapsulate object creation logic",
@@ -316,101 +467,88 @@ class CodeAnalyzer(ast.NodeVisitor):
                 )
             )
 
-    def _check_observer_pattern_in_loop(self, node: ast.For) -> None:
+        return found
+
+    def _check_observer_pattern_in_loop(
+        self, node: ast.For, facts: _SubtreeFacts
+    ) -> List[PatternOpportunity]:
         """Check for manual observer pattern implementation in loops"""
         # Look for notification loops
-        if isinstance(node.iter, ast.Name):
+        if type(node.iter) is ast.Name:
             iter_name = node.iter.id.lower()
-            if any(
-                keyword in iter_name
-                for keyword in ["observer", "listener", "subscriber", "notification"]
-            ):
+            if _NOTIFY_ITER_RE.search(iter_name):
                 # Check if loop contains method calls that look like notifications
-                for item in ast.walk(node):
-                    if isinstance(item, ast.Call) and isinstance(
-                        item.func, ast.Attribute
-                    ):
-                        method_name = item.func.attr.lower()
-                        if any(
-                            keyword in method_name
-                            for keyword in ["update", "notify", "on_", "handle"]
-                        ):
-                            self.opportunities.append(
-                                PatternOpportunity(
-                                    pattern_name="observer",
-                                    opportunity_type=OpportunityType.REFACTOR_TO_PATTERN,
-                                    confidence=PatternConfidence.MEDIUM,
-                                    file_path=self.file_path,
-                                    line_number=node.lineno,
-                                    line_end=getattr(node, "end_lineno", None),
-                                    description="Manual observer notification loop detected",
-                                    current_code_snippet=f"for loop over {iter_name} with notification calls",
-                                    suggested_improvement="Implement formal Observer pattern with subscription management",
-                                    reasoning="Manual loops for notifications suggest need for Observer pattern",
-                                    effort_estimate="Low",
-                                    impact_estimate="Medium",
-                                )
-                            )
-                            break
-
-    def _check_factory_pattern(self, node: ast.FunctionDef) -> None:
+                if facts.has_notification_call:
+                    return [
+                        PatternOpportunity(
+                            pattern_name="observer",
+                            opportunity_type=OpportunityType.REFACTOR_TO_PATTERN,
+                            confidence=PatternConfidence.MEDIUM,
+                            file_path=self.file_path,
+                            line_number=node.lineno,
+                            line_end=node.end_lineno,
+                            description="Manual observer notification loop detected",
+                            current_code_snippet=f"for loop over {iter_name} with notification calls",
+                            suggested_improvement="Implement formal Observer pattern with subscription management",
+                            reasoning="Manual loops for notifications suggest need for Observer pattern",
+                            effort_estimate="Low",
+                            impact_estimate="Medium",
+                        )
+                    ]
+        return []
+
+    def _check_factory_pattern(
+        self, node: ast.FunctionDef, facts: _SubtreeFacts
+    ) -> List[PatternOpportunity]:
         """Check for factory pattern opportunities in functions"""
         # Look for functions that return different types based on parameters
-        return_statements = []
-        for item in ast.walk(node):
-            if isinstance(item, ast.Return) and item.value:
-                if isinstance(item.value, ast.Call):
-                    return_statements.append(item.value)
+        return_count = facts.call_returns
 
-        if len(return_statements) >= 2:
+        if return_count >= 2:
             # Multiple return types might indicate factory pattern
-            self.opportunities.append(
+            return [
                 PatternOpportunity(
                     pattern_name="factory",
                     opportunity_type=OpportunityType.OPTIMIZATION_OPPORTUNITY,
                     confidence=PatternConfidence.MEDIUM,
                     file_path=self.file_path,
                     line_number=node.lineno,
-                    line_end=getattr(node, "end_lineno", None),
+                    line_end=node.end_lineno,
                     description=f"Function {node.name} returns multiple types - consider Factory pattern",
-                    current_code_snippet=f"def {node.name}() with {len(return_statements)} different return types",
+                    current_code_snippet=f"def {node.name}() with {return_count} different return types",
                     suggested_improvement="Formalize as Factory pattern with clear interface",
-                    reasoning=f"Function returns {len(return_statements)} different types, suggesting factory behavior",
+                    reasoning=f"Function returns {return_count} different types, suggesting factory behavior",
                     effort_estimate="Low",
                     impact_estimate="Low",
                 )
-            )
+            ]
+        return []
 
-    def _check_adapter_pattern(self, node: ast.ClassDef) -> None:
+    def _check_adapter_pattern(self, node: ast.ClassDef) -> List[PatternOpportunity]:
         """Check for adapter pattern opportunities"""
         # Look for classes that wrap other objects
         has_adaptee = False
         has_delegation = False
 
         for item in node.body:
-            if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+            if type(item) is ast.FunctionDef and item.name == "__init__":
                 # Check if constructor takes another object
                 if len(item.args.args) >= 2:  # self + at least one param
                     has_adaptee = True
-            elif isinstance(item, ast.FunctionDef):
+            elif type(item) is ast.FunctionDef:
                 # Check for delegation patterns
-                for subitem in ast.walk(item):
-                    if isinstance(subitem, ast.Attribute) and isinstance(
-                        subitem.value, ast.Name
-                    ):
-                        if subitem.value.id != "self":
-                            has_delegation = True
-                            break
+                if item in self._delegating_functions:
+                    has_delegation = True
 
         if has_adaptee and has_delegation:
-            self.opportunities.append(
+            return [
                 PatternOpportunity(
                     pattern_name="adapter",
                     opportunity_type=OpportunityType.OPTIMIZATION_OPPORTUNITY,
                     confidence=PatternConfidence.LOW,
                     file_path=self.file_path,
                     line_number=node.lineno,
-                    line_end=getattr(node, "end_lineno", None),
+                    line_end=node.end_lineno,
                     description=f"Class {node.name} shows adapter-like behavior",
                     current_code_snippet=f"class {node.name} with delegation pattern",
                     suggested_improvement="Consider formalizing as Adapter pattern if interfacing incompatible classes",
@@ -418,36 +556,25 @@ class CodeAnalyzer(ast.NodeVisitor):
                     effort_estimate="Low",
                     impact_estimate="Low",
                 )
-            )
+            ]
+        return []
 
-    def _analyze_function_body(self, node: ast.FunctionDef) -> None:
+    def _analyze_function_body(
+        self, node: ast.FunctionDef, facts: _SubtreeFacts
+    ) -> List[PatternOpportunity]:
         """Analyze function body for various patterns"""
         # Check for command pattern opportunities
-        if any(
-            keyword in node.name.lower()
-            for keyword in ["execute", "run", "perform", "do"]
-        ):
+        if _COMMAND_NAME_RE.search(node.name.lower()):
             # Look for state storage that might indicate command pattern
-            has_state_storage = False
-            for item in ast.walk(node):
-                if isinstance(item, ast.Assign):
-                    for target in item.targets:
-                        if isinstance(target, ast.Attribute) and isinstance(
-                            target.value, ast.Name
-                        ):
-                            if target.value.id == "self":
-                                has_state_storage = True
-                                break
-
-            if has_state_storage:
-                self.opportunities.append(
+            if facts.assigns_self_attribute:
+                return [
                     PatternOpportunity(
                         pattern_name="command",
                         opportunity_type=OpportunityType.OPTIMIZATION_OPPORTUNITY,
                         confidence=PatternConfidence.LOW,
                         file_path=self.file_path,
                         line_number=node.lineno,
-                        line_end=getattr(node, "end_lineno", None),
+                        line_end=node.end_lineno,
                         description=f"Function {node.name} stores state - consider Command pattern",
                         current_code_snippet=f"def {node.name}() with state storage",
                         suggested_improvement="Consider Command pattern if undo/redo or queuing needed",
@@ -455,107 +582,138 @@ class CodeAnalyzer(ast.NodeVisitor):
                         effort_estimate="Medium",
                         impact_estimate="Low",
                     )
-                )
-
-    def _detect_patterns(self) -> None:
-        """Detect higher-level patterns from collected data"""
-        # Additional pattern detection logic can be added here
-        pass
+                ]
+        return []
 
     def _is_data_model_class(self, class_name: str) -> bool:
         """Check if class name suggests it's a data model"""
-        data_model_patterns = [
-            "user",
-            "product",
-            "order",
-            "customer",
-            "item",
-            "model",
-            "entity",
-            "record",
-            "data",
-            "person",
-            "account",
-            "invoice",
-        ]
-        return any(pattern in class_name.lower() for pattern in data_model_patterns)
+        return _DATA_MODEL_RE.search(class_name.lower()) is not None
 
     def _could_benefit_from_singleton(self, class_name: str) -> bool:
         """Check if class could benefit from singleton pattern"""
-        singleton_candidates = [
-            "database",
-            "connection",
-            "config",
-            "settings",
-            "logger",
-            "cache",
-            "registry",
-            "manager",
-            "service",
-            "client",
-        ]
-        return any(
-            candidate in class_name.lower() for candidate in singleton_candidates
-        )
+        return _SINGLETON_RE.search(class_name.lower()) is not None
 
-    def _looks_like_algorithm_selection(self, node: ast.If) -> bool:
+    def _looks_like_algorithm_selection(
+        self, chain_length: int, facts: _SubtreeFacts
+    ) -> bool:
         """Check if if/elif chain looks like algorithm selection"""
-        # Heuristic: look for different method calls or operations in each branch
-        branches = []
-        current = node
+        # Heuristic: look for different method calls or operations in each branch.
+        # Each branch's subtree holds the later elifs, so the calls across all
+        # branches are exactly the calls under the head of the chain.
+        if chain_length >= 2:
+            return len(facts.call_names) >= chain_length
 
-        while current:
-            branch_calls = set()
-            for item in ast.walk(current):
-                if isinstance(item, ast.Call) and isinstance(item.func, ast.Name):
-                    branch_calls.add(item.func.id)
-                elif isinstance(item, ast.Call) and isinstance(
-                    item.func, ast.Attribute
-                ):
-                    branch_calls.add(item.func.attr)
-            branches.append(branch_calls)
+        return False
 
-            if (
-                current.orelse
-                and len(current.orelse) == 1
-                and isinstance(current.orelse[0], ast.If)
-            ):
-                current = current.orelse[0]
-            else:
-                break
 
-        # If branches have different method calls, likely algorithm selection
-        if len(branches) >= 2:
-            all_calls = set().union(*branches)
-            return len(all_calls) >= len(
-                branches
-            )  # Different algorithms likely use different methods
+# analyze_file results keyed by (path, mtime_ns, size), least recently used first
+_FILE_CACHE_SIZE = 4096
+_FILE_CACHE: "OrderedDict[Tuple[str, int, int], List[PatternOpportunity]]" = (
+    OrderedDict()
+)
 
-        return False
+# Below this many uncached files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 32
 
 
-def analyze_file(file_path: Union[str, Path]) -> List[PatternOpportunity]:
-    """Analyze a single Python file for pattern opportunities"""
-    file_path = Path(file_path)
+def _snapshot_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+    """Return the cache key for a file's current contents, or None if missing"""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return (str(file_path), stat.st_mtime_ns, stat.st_size)
 
-    if not file_path.exists() or file_path.suffix != ".py":
-        return []
 
+def _cached_result(key: Tuple[str, int, int]) -> Optional[List[PatternOpportunity]]:
+    """Look up a cached analysis, marking it as recently used"""
+    cached = _FILE_CACHE.get(key)
+    if cached is not None:
+        _FILE_CACHE.move_to_end(key)
+    return cached
+
+
+def _store_result(
+    key: Tuple[str, int, int], opportunities: List[PatternOpportunity]
+) -> None:
+    """Cache an analysis, evicting the least recently used entry when full"""
+    _FILE_CACHE[key] = opportunities
+    if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+        _FILE_CACHE.popitem(last=False)
+
+
+def _analyze_path(file_path: str) -> Optional[List[PatternOpportunity]]:
+    """Read and analyze one file, or return None if it cannot be read
+
+    Kept at module level so process pool workers can run it.
+    """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             source_code = f.read()
+    except (IOError, UnicodeDecodeError):
+        return None
 
-        analyzer = CodeAnalyzer(str(file_path))
-        return analyzer.analyze_file(source_code)
+    analyzer = CodeAnalyzer(file_path)
+    return analyzer.analyze_file(source_code)
 
-    except (IOError, UnicodeDecodeError):
+
+def analyze_file(file_path: Union[str, Path]) -> List[PatternOpportunity]:
+    """Analyze a single Python file for pattern opportunities
+
+    Results are cached by path, modification time and size, so analyzing an
+    unchanged file again skips parsing it.
+    """
+    file_path = Path(file_path)
+
+    if file_path.suffix != ".py":
+        return []
+
+    key = _snapshot_key(file_path)
+    if key is None:
         return []
 
+    opportunities = _cached_result(key)
+    if opportunities is None:
+        opportunities = _analyze_path(key[0])
+        if opportunities is None:
+            return []
+        _store_result(key, opportunities)
+    return list(opportunities)
+
+
+def _iter_python_files(
+    directory_path: Path, exclude_patterns: List[str]
+) -> Iterator[Path]:
+    """Yield .py files under a directory whose paths contain no exclude pattern
+
+    A directory whose path contains a pattern is pruned rather than walked,
+    since every path beneath it would contain the pattern too.
+    """
+    for root, dirs, files in os.walk(directory_path):
+        if any(pattern in root for pattern in exclude_patterns):
+            dirs.clear()
+            continue
+        dirs[:] = [
+            d for d in dirs if not any(pattern in d for pattern in exclude_patterns)
+        ]
+        for name in files:
+            if name.endswith(".py"):
+                py_file = Path(root, name)
+                if not any(pattern in str(py_file) for pattern in exclude_patterns):
+                    yield py_file
+
 
 def analyze_directory(
-    directory_path: Union[str, Path], exclude_patterns: Optional[List[str]] = None
+    directory_path: Union[str, Path],
+    exclude_patterns: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict[str, List[PatternOpportunity]]:
-    """Analyze all Python files in a directory for pattern opportunities"""
+    """Analyze all Python files in a directory for pattern opportunities
+
+    Files missing from the analyze_file cache are analyzed in a process pool
+    of up to max_workers processes (default: CPU count) when there are enough
+    of them to be worth starting workers for.
+    """
     directory_path = Path(directory_path)
     exclude_patterns = exclude_patterns or [
         "__pycache__",
@@ -565,16 +723,31 @@ def analyze_directory(
         "env",
     ]
 
-    results = {}
+    found: Dict[Tuple[str, int, int], Optional[List[PatternOpportunity]]] = {}
 
-    for py_file in directory_path.rglob("*.py"):
-        # Skip excluded directories
-        if any(pattern in str(py_file) for pattern in exclude_patterns):
-            continue
+    for py_file in _iter_python_files(directory_path, exclude_patterns):
+        key = _snapshot_key(py_file)
+        if key is not None:
+            found[key] = _cached_result(key)
 
-        opportunities = analyze_file(py_file)
+    missing = [key for key, opportunities in found.items() if opportunities is None]
+    paths = [key[0] for key in missing]
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(missing) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            analyzed = list(executor.map(_analyze_path, paths, chunksize=16))
+    else:
+        analyzed = [_analyze_path(path) for path in paths]
+
+    for key, opportunities in zip(missing, analyzed):
+        if opportunities is not None:
+            _store_result(key, opportunities)
+        found[key] = opportunities
+
+    results = {}
+    for key, opportunities in found.items():
         if opportunities:  # Only include files with opportunities
-            results[str(py_file)] = opportunities
+            results[key[0]] = list(opportunities)
 
     return results
 
@@ -582,14 +755,20 @@ def analyze_directory(
 def generate_analysis_report(
     opportunities_by_file: Dict[str, List[PatternOpportunity]],
 ) -> str:
-    """Generate a human-readable analysis report"""
+    """Generate a human-readable analysis report
+
+    Each file's opportunities are expected in priority order, as returned by
+    analyze_file and analyze_directory.
+    """
     total_opportunities = sum(len(ops) for ops in opportunities_by_file.values())
 
     if total_opportunities == 0:
         return "🎉 No pattern opportunities detected! Your code looks well-structured."
 
-    report = f"# Pattern Analysis Report\n\n"
-    report += f"**Total Opportunities Found**: {total_opportunities} across {len(opportunities_by_file)} files\n\n"
+    parts = [
+        "# Pattern Analysis Report\n\n",
+        f"**Total Opportunities Found**: {total_opportunities} across {len(opportunities_by_file)} files\n\n",
+    ]
 
     # Group by pattern type
     by_pattern = {}
@@ -599,36 +778,37 @@ def generate_analysis_report(
                 by_pattern[opp.pattern_name] = []
             by_pattern[opp.pattern_name].append(opp)
 
-    report += "## Summary by Pattern\n\n"
+    parts.append("## Summary by Pattern\n\n")
+    high_priority_total = 0
     for pattern, opportunities in sorted(by_pattern.items()):
         count = len(opportunities)
         high_priority = len([o for o in opportunities if o.priority_score > 0.7])
-        report += f"- **{pattern.title()}**: {count} opportunities ({high_priority} high priority)\n"
-
-    report += "\n## High Priority Opportunities\n\n"
-    all_opportunities = []
-    for opportunities in opportunities_by_file.values():
-        all_opportunities.extend(opportunities)
+        high_priority_total += high_priority
+        parts.append(
+            f"- **{pattern.title()}**: {count} opportunities ({high_priority} high priority)\n"
+        )
 
-    high_priority = sorted(
-        [o for o in all_opportunities if o.priority_score > 0.7],
-        key=lambda x: x.priority_score,
-        reverse=True,
+    parts.append("\n## High Priority Opportunities\n\n")
+    # Each file's list is already sorted by priority, as analyze_file returns
+    # it, so merging them gives the overall ranking without a full re-sort
+    ranked = heapq.merge(
+        *opportunities_by_file.values(), key=lambda x: -x.priority_score
     )
-
-    for i, opp in enumerate(high_priority[:10], 1):  # Top 10
-        report += f"### {i}. {opp.pattern_name.title()} Pattern\n"
-        report += f"**File**: {opp.file_path}:{opp.line_number}\n"
-        report += f"**Confidence**: {opp.confidence.value.title()}\n"
-        report += f"**Description**: {opp.description}\n"
-        report += f"**Reasoning**: {opp.reasoning}\n"
-        report += (
+    ranked_high = takewhile(lambda o: o.priority_score > 0.7, ranked)
+
+    for i, opp in enumerate(islice(ranked_high, 10), 1):  # Top 10
+        parts.append(
+            f"### {i}. {opp.pattern_name.title()} Pattern\n"
+            f"**File**: {opp.file_path}:{opp.line_number}\n"
+            f"**Confidence**: {opp.confidence.value.title()}\n"
+            f"**Description**: {opp.description}\n"
+            f"**Reasoning**: {opp.reasoning}\n"
             f"**Effort**: {opp.effort_estimate} | **Impact**: {opp.impact_estimate}\n\n"
         )
 
-    if len(high_priority) > 10:
-        report += (
-            f"... and {len(high_priority) - 10} more high priority opportunities.\n\n"
+    if high_priority_total > 10:
+        parts.append(
+            f"... and {high_priority_total - 10} more high priority opportunities.\n\n"
         )
 
-    return report
+    return "".join(parts)
@@ -0,0 +1,48 @@
+"""Buffered console output shared by the pattern demos.
+
+Pattern classes that report status lines write them through ``emit``. Inside a
+``batched_output`` block the lines are collected for the current thread and
+written to stdout in one call when the block ends; outside a block they are
+printed immediately. Text printed directly with ``print`` is not collected, so
+it appears before the buffered output of the block it was printed in.
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+_output_batch = threading.local()
+
+
+def emit(message: str) -> None:
+    """Print a status line, or buffer it inside a ``batched_output`` block.
+
+    Args:
+        message: Line to write to stdout
+    """
+    lines = getattr(_output_batch, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+@contextmanager
+def batched_output() -> Iterator[None]:
+    """Buffer the current thread's output and write it in one call.
+
+    Nested blocks join the outermost one, and the buffer is written even when
+    the block raises.
+    """
+    if getattr(_output_batch, "lines", None) is not None:
+        yield
+        return
+    lines: List[str] = []
+    _output_batch.lines = lines
+    try:
+        yield
+    finally:
+        _output_batch.lines = None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
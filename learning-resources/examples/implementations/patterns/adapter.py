@@ -4,15 +4,41 @@ This module provides implementations of the Adapter pattern, demonstrating
 how to make incompatible interfaces work together.
 """
 
+import functools
+import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Adapter and adaptee messages are logged at INFO instead of printed. Nothing
+# is output unless the application configures logging; while INFO is disabled
+# the calls skip message formatting entirely.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Target Interface
+#
+# Targets stay ABCs rather than typing.Protocol: adapters subclass them
+# explicitly, and isinstance checks against a runtime-checkable Protocol walk
+# every protocol member, which is over an order of magnitude slower than the
+# cached ABC subclass check.
 
 
 class MediaPlayer(ABC):
     """Target interface for media players."""
 
+    __slots__ = ()
+
     @abstractmethod
     def play(self, audio_type: str, filename: str) -> None:
         """Play audio file.
@@ -30,37 +56,49 @@ class MediaPlayer(ABC):
 class Mp3Player:
     """Legacy MP3 player with its own interface."""
 
+    __slots__ = ()
+
     def play_mp3(self, filename: str) -> None:
         """Play MP3 file.
 
         Args:
             filename: MP3 file to play
         """
-        print(f"Playing MP3 file: {filename}")
+        logger.info("Playing MP3 file: %s", filename)
 
 
 class Mp4Player:
     """Legacy MP4 player with its own interface."""
 
+    __slots__ = ()
+
     def play_mp4(self, filename: str) -> None:
         """Play MP4 file.
 
         Args:
             filename: MP4 file to play
         """
-        print(f"Playing MP4 file: {filename}")
+        logger.info("Playing MP4 file: %s", filename)
 
 
 class VlcPlayer:
     """VLC player with its own interface."""
 
+    __slots__ = ()
+
     def play_vlc(self, filename: str) -> None:
         """Play VLC file.
 
         Args:
             filename: VLC file to play
         """
-        print(f"Playing VLC file: {filename}")
+        logger.info("Playing VLC file: %s", filename)
+
+
+# Adaptee players hold no state, so one instance of each is shared
+_MP3_PLAYER = Mp3Player()
+_MP4_PLAYER = Mp4Player()
+_VLC_PLAYER = VlcPlayer()
 
 
 # Adapter Classes
@@ -69,22 +107,26 @@ class VlcPlayer:
 class MediaAdapter(MediaPlayer):
     """Adapter that makes different media players compatible."""
 
+    __slots__ = ("audio_type", "player", "_play")
+
+    # Shared player and its bound play method, keyed by audio type
+    _REGISTRY: ClassVar[Dict[str, Tuple[Any, Callable[[str], None]]]] = {
+        "mp3": (_MP3_PLAYER, _MP3_PLAYER.play_mp3),
+        "mp4": (_MP4_PLAYER, _MP4_PLAYER.play_mp4),
+        "vlc": (_VLC_PLAYER, _VLC_PLAYER.play_vlc),
+    }
+
     def __init__(self, audio_type: str):
         """Initialize the adapter.
 
+        The shared player and its play method are looked up once here, so
+        playing a file is a single call with no per-call dispatch.
+
         Args:
             audio_type: Type of audio this adapter handles
         """
         self.audio_type = audio_type
-
-        if audio_type == "mp3":
-            self.player = Mp3Player()
-        elif audio_type == "mp4":
-            self.player = Mp4Player()
-        elif audio_type == "vlc":
-            self.player = VlcPlayer()
-        else:
-            self.player = None
+        self.player, self._play = self._REGISTRY.get(audio_type, (None, None))
 
     def play(self, audio_type: str, filename: str) -> None:
         """Play audio file using the appropriate player.
@@ -93,19 +135,20 @@ class MediaAdapter(MediaPlayer):
             audio_type: Type of audio file
             filename: Name of the file to play
         """
-        if audio_type == "mp3" and hasattr(self.player, "play_mp3"):
-            self.player.play_mp3(filename)
-        elif audio_type == "mp4" and hasattr(self.player, "play_mp4"):
-            self.player.play_mp4(filename)
-        elif audio_type == "vlc" and hasattr(self.player, "play_vlc"):
-            self.player.play_vlc(filename)
+        if self._play is not None and audio_type == self.audio_type:
+            self._play(filename)
         else:
-            print(f"Media format {audio_type} not supported")
+            logger.info("Media format %s not supported", audio_type)
 
 
 class AudioPlayer(MediaPlayer):
     """Audio player that uses adapters for different formats."""
 
+    __slots__ = ("adapters",)
+
+    # Formats played through a MediaAdapter rather than directly
+    _ADAPTED_TYPES: ClassVar[FrozenSet[str]] = frozenset({"mp4", "vlc"})
+
     def __init__(self):
         """Initialize the audio player."""
         self.adapters: Dict[str, MediaAdapter] = {}
@@ -121,14 +164,15 @@ class AudioPlayer(MediaPlayer):
 
         if audio_type == "mp3":
             # Direct support for MP3
-            print(f"Playing MP3 file: {filename}")
-        elif audio_type in ["mp4", "vlc"]:
+            logger.info("Playing MP3 file: %s", filename)
+        elif audio_type in self._ADAPTED_TYPES:
             # Use adapter for other formats
-            if audio_type not in self.adapters:
-                self.adapters[audio_type] = MediaAdapter(audio_type)
-            self.adapters[audio_type].play(audio_type, filename)
+            adapter = self.adapters.get(audio_type)
+            if adapter is None:
+                self.adapters[audio_type] = adapter = MediaAdapter(audio_type)
+            adapter.play(audio_type, filename)
         else:
-            print(f"Media format {audio_type} not supported")
+            logger.info("Media format %s not supported", audio_type)
 
 
 # Database Adapter Example
@@ -137,6 +181,8 @@ class AudioPlayer(MediaPlayer):
 class DatabaseConnection(ABC):
     """Target interface for database connections."""
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> None:
         """Connect to the database."""
@@ -163,6 +209,8 @@ class DatabaseConnection(ABC):
 class MySQLConnection:
     """Legacy MySQL connection class."""
 
+    __slots__ = ("host", "user", "password", "database", "connected")
+
     def __init__(self, host: str, user: str, password: str, database: str):
         """Initialize MySQL connection.
 
@@ -180,7 +228,7 @@ class MySQLConnection:
 
     def mysql_connect(self) -> None:
         """Connect to MySQL database."""
-        print(f"Connecting to MySQL database {self.database} on {self.host}")
+        logger.info("Connecting to MySQL database %s on %s", self.database, self.host)
         self.connected = True
 
     def mysql_query(self, sql: str) -> List[Dict[str, Any]]:
@@ -195,19 +243,21 @@ class MySQLConnection:
         if not self.connected:
             raise RuntimeError("Not connected to MySQL database")
 
-        print(f"Executing MySQL query: {sql}")
+        logger.info("Executing MySQL query: %s", sql)
         # Simulate results
         return [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
 
     def mysql_disconnect(self) -> None:
         """Disconnect from MySQL database."""
-        print("Disconnecting from MySQL database")
+        logger.info("Disconnecting from MySQL database")
         self.connected = False
 
 
 class PostgreSQLConnection:
     """Legacy PostgreSQL connection class."""
 
+    __slots__ = ("host", "user", "password", "database", "connected")
+
     def __init__(self, host: str, user: str, password: str, database: str):
         """Initialize PostgreSQL connection.
 
@@ -225,7 +275,9 @@ class PostgreSQLConnection:
 
     def pg_connect(self) -> None:
         """Connect to PostgreSQL database."""
-        print(f"Connecting to PostgreSQL database {self.database} on {self.host}")
+        logger.info(
+            "Connecting to PostgreSQL database %s on %s", self.database, self.host
+        )
         self.connected = True
 
     def pg_execute(self, sql: str) -> List[Dict[str, Any]]:
@@ -240,30 +292,43 @@ class PostgreSQLConnection:
         if not self.connected:
             raise RuntimeError("Not connected to PostgreSQL database")
 
-        print(f"Executing PostgreSQL query: {sql}")
+        logger.info("Executing PostgreSQL query: %s", sql)
         # Simulate results
         return [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
 
     def pg_disconnect(self) -> None:
         """Disconnect from PostgreSQL database."""
-        print("Disconnecting from PostgreSQL database")
+        logger.info("Disconnecting from PostgreSQL database")
         self.connected = False
 
 
-class MySQLAdapter(DatabaseConnection):
-    """Adapter for MySQL connection."""
+class SqlAdapter(DatabaseConnection):
+    """Adapter for legacy SQL connections, driven by method names.
 
-    def __init__(self, mysql_connection: MySQLConnection):
+    The connection's connect, query and close methods are resolved once at
+    construction and then called directly.
+    """
+
+    __slots__ = ("_connect", "_query", "_close")
+
+    def __init__(self, connection: Any, method_names: Tuple[str, str, str]):
         """Initialize the adapter.
 
         Args:
-            mysql_connection: MySQL connection instance
+            connection: Legacy connection instance
+            method_names: Names of the connection's connect, query and
+                close methods, in that order
         """
-        self.mysql_connection = mysql_connection
+        connect_name, query_name, close_name = method_names
+        self._connect: Callable[[], None] = getattr(connection, connect_name)
+        self._query: Callable[[str], List[Dict[str, Any]]] = getattr(
+            connection, query_name
+        )
+        self._close: Callable[[], None] = getattr(connection, close_name)
 
     def connect(self) -> None:
         """Connect to the database."""
-        self.mysql_connection.mysql_connect()
+        self._connect()
 
     def query(self, sql: str) -> List[Dict[str, Any]]:
         """Execute a query.
@@ -274,42 +339,45 @@ class MySQLAdapter(DatabaseConnection):
         Returns:
             Query results
         """
-        return self.mysql_connection.mysql_query(sql)
+        return self._query(sql)
 
     def close(self) -> None:
         """Close the database connection."""
-        self.mysql_connection.mysql_disconnect()
+        self._close()
 
 
-class PostgreSQLAdapter(DatabaseConnection):
-    """Adapter for PostgreSQL connection."""
+class MySQLAdapter(SqlAdapter):
+    """Adapter for MySQL connection."""
 
-    def __init__(self, postgresql_connection: PostgreSQLConnection):
+    __slots__ = ("mysql_connection",)
+
+    def __init__(self, mysql_connection: MySQLConnection):
         """Initialize the adapter.
 
         Args:
-            postgresql_connection: PostgreSQL connection instance
+            mysql_connection: MySQL connection instance
         """
-        self.postgresql_connection = postgresql_connection
+        self.mysql_connection = mysql_connection
+        super().__init__(
+            mysql_connection, ("mysql_connect", "mysql_query", "mysql_disconnect")
+        )
 
-    def connect(self) -> None:
-        """Connect to the database."""
-        self.postgresql_connection.pg_connect()
 
-    def query(self, sql: str) -> List[Dict[str, Any]]:
-        """Execute a query.
+class PostgreSQLAdapter(SqlAdapter):
+    """Adapter for PostgreSQL connection."""
 
-        Args:
-            sql: SQL query string
+    __slots__ = ("postgresql_connection",)
 
-        Returns:
-            Query results
-        """
-        return self.postgresql_connection.pg_execute(sql)
+    def __init__(self, postgresql_connection: PostgreSQLConnection):
+        """Initialize the adapter.
 
-    def close(self) -> None:
-        """Close the database connection."""
-        self.postgresql_connection.pg_disconnect()
+        Args:
+            postgresql_connection: PostgreSQL connection instance
+        """
+        self.postgresql_connection = postgresql_connection
+        super().__init__(
+            postgresql_connection, ("pg_connect", "pg_execute", "pg_disconnect")
+        )
 
 
 # Payment Gateway Adapter Example
@@ -318,6 +386,8 @@ class PostgreSQLAdapter(DatabaseConnection):
 class PaymentProcessor(ABC):
     """Target interface for payment processing."""
 
+    __slots__ = ()
+
     @abstractmethod
     def process_payment(self, amount: float, card_number: str) -> bool:
         """Process a payment.
@@ -345,7 +415,7 @@ class PayPalGateway:
         Returns:
             Payment result
         """
-        print(f"Processing PayPal payment of ${amount} for {email}")
+        logger.info("Processing PayPal payment of $%s for %s", amount, email)
         return {"status": "success", "transaction_id": "PP123456"}
 
 
@@ -362,13 +432,33 @@ class StripeGateway:
         Returns:
             Charge result
         """
-        print(f"Processing Stripe payment of ${amount_cents/100} with token {token}")
+        logger.info(
+            "Processing Stripe payment of $%s with token %s", amount_cents / 100, token
+        )
         return {"status": "succeeded", "charge_id": "ch_123456"}
 
 
+@functools.lru_cache(maxsize=4096)
+def _stripe_token(last_four: str) -> str:
+    """Derive the Stripe token for a card's last four digits.
+
+    Keyed by the last four digits only, so full card numbers are never
+    retained, and bounded so arbitrary card strings cannot grow the cache.
+
+    Args:
+        last_four: Last four digits of the card number
+
+    Returns:
+        The Stripe token string.
+    """
+    return f"tok_{last_four}"
+
+
 class PayPalAdapter(PaymentProcessor):
     """Adapter for PayPal gateway."""
 
+    __slots__ = ("paypal_gateway", "email")
+
     def __init__(self, paypal_gateway: PayPalGateway, email: str):
         """Initialize the adapter.
 
@@ -396,6 +486,8 @@ class PayPalAdapter(PaymentProcessor):
 class StripeAdapter(PaymentProcessor):
     """Adapter for Stripe gateway."""
 
+    __slots__ = ("stripe_gateway",)
+
     def __init__(self, stripe_gateway: StripeGateway):
         """Initialize the adapter.
 
@@ -415,8 +507,8 @@ class StripeAdapter(PaymentProcessor):
             True if payment successful, False otherwise
         """
         # Convert card number to Stripe token (simplified)
-        token = f"tok_{card_number[-4:]}"
-        amount_cents = int(amount * 100)
+        token = _stripe_token(card_number[-4:])
+        amount_cents = round(amount * 100)
 
         result = self.stripe_gateway.charge_card(amount_cents, token)
         return result["status"] == "succeeded"
@@ -428,6 +520,8 @@ class StripeAdapter(PaymentProcessor):
 class Rectangle:
     """Rectangle class with its own interface."""
 
+    __slots__ = ("width", "height")
+
     def __init__(self, width: float, height: float):
         """Initialize rectangle.
 
@@ -445,12 +539,16 @@ class Rectangle:
             x: X coordinate
             y: Y coordinate
         """
-        print(f"Drawing rectangle ({self.width}x{self.height}) at ({x}, {y})")
+        logger.info(
+            "Drawing rectangle (%sx%s) at (%s, %s)", self.width, self.height, x, y
+        )
 
 
 class LegacyRectangle:
     """Legacy rectangle class with different interface."""
 
+    __slots__ = ("x1", "y1", "x2", "y2")
+
     def __init__(self, x1: float, y1: float, x2: float, y2: float):
         """Initialize legacy rectangle.
 
@@ -467,14 +565,20 @@ class LegacyRectangle:
 
     def old_draw(self) -> None:
         """Draw rectangle using legacy interface."""
-        print(
-            f"Drawing legacy rectangle from ({self.x1}, {self.y1}) to ({self.x2}, {self.y2})"
+        logger.info(
+            "Drawing legacy rectangle from (%s, %s) to (%s, %s)",
+            self.x1,
+            self.y1,
+            self.x2,
+            self.y2,
         )
 
 
 class LegacyRectangleAdapter(Rectangle):
     """Object adapter for legacy rectangle."""
 
+    __slots__ = ("legacy_rectangle",)
+
     def __init__(self, legacy_rectangle: LegacyRectangle):
         """Initialize the adapter.
 
@@ -504,6 +608,28 @@ class LegacyRectangleAdapter(Rectangle):
 
         self.legacy_rectangle.old_draw()
 
+    def draw_many(self, positions: Iterable[Tuple[int, int]]) -> None:
+        """Draw the rectangle at each of several positions.
+
+        The legacy rectangle, its draw method and the dimensions are looked
+        up once, so each position costs only the coordinate updates and the
+        legacy draw call.
+
+        Args:
+            positions: (x, y) coordinates to draw at, in order
+        """
+        legacy = self.legacy_rectangle
+        old_draw = legacy.old_draw
+        width = self.width
+        height = self.height
+
+        for x, y in positions:
+            legacy.x1 = x
+            legacy.y1 = y
+            legacy.x2 = x + width
+            legacy.y2 = y + height
+            old_draw()
+
 
 # Service Layer using Multiple Adapters
 
@@ -511,6 +637,8 @@ class LegacyRectangleAdapter(Rectangle):
 class PaymentService:
     """Service that can use multiple payment processors."""
 
+    __slots__ = ("processors",)
+
     def __init__(self):
         """Initialize the payment service."""
         self.processors: Dict[str, PaymentProcessor] = {}
@@ -537,11 +665,11 @@ class PaymentService:
         Returns:
             True if payment successful, False otherwise
         """
-        if processor_name not in self.processors:
-            print(f"Payment processor {processor_name} not available")
+        processor = self.processors.get(processor_name)
+        if processor is None:
+            logger.info("Payment processor %s not available", processor_name)
             return False
 
-        processor = self.processors[processor_name]
         return processor.process_payment(amount, card_number)
 
 
@@ -623,6 +751,7 @@ def demonstrate_rectangle_adapter():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     demonstrate_media_adapter()
     demonstrate_database_adapter()
     demonstrate_payment_adapter()
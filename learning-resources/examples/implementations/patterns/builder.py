@@ -4,14 +4,18 @@ This module provides implementations of the Builder pattern, demonstrating
 how to construct complex objects step by step with a fluent interface.
 """
 
+import functools
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
 
 # Product Classes
 
 
-@dataclass
+@dataclass(slots=True)
 class Computer:
     """Computer product built by the builder."""
 
@@ -35,15 +39,15 @@ class Computer:
         Returns:
             Computer description
         """
-        specs = f"Computer: {self.cpu}, {self.memory}, {self.storage}"
+        specs = [self.cpu, self.memory, self.storage]
         if self.graphics_card:
-            specs += f", {self.graphics_card}"
+            specs.append(self.graphics_card)
         if self.operating_system:
-            specs += f", {self.operating_system}"
-        return specs
+            specs.append(self.operating_system)
+        return "Computer: " + ", ".join(specs)
 
 
-@dataclass
+@dataclass(slots=True)
 class House:
     """House product built by the builder."""
 
@@ -56,12 +60,7 @@ class House:
     garden: bool = False
     pool: bool = False
     floors: int = 1
-    rooms: List[str] = None
-
-    def __post_init__(self):
-        """Initialize rooms list if not provided."""
-        if self.rooms is None:
-            self.rooms = []
+    rooms: List[str] = field(default_factory=list)
 
     def __str__(self) -> str:
         """String representation of the house.
@@ -75,7 +74,7 @@ class House:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pizza:
     """Pizza product built by the builder."""
 
@@ -83,32 +82,31 @@ class Pizza:
     crust: str = "regular"
     sauce: str = "tomato"
     cheese: str = "mozzarella"
-    toppings: List[str] = None
+    toppings: List[str] = field(default_factory=list)
     extra_cheese: bool = False
     gluten_free: bool = False
     spicy: bool = False
 
-    def __post_init__(self):
-        """Initialize toppings list if not provided."""
-        if self.toppings is None:
-            self.toppings = []
-
     def __str__(self) -> str:
         """String representation of the pizza.
 
         Returns:
             Pizza description
         """
-        desc = f"{self.size.title()} {self.crust} crust pizza with {self.sauce} sauce and {self.cheese}"
+        desc = [
+            f"{self.size.title()} {self.crust} crust pizza with "
+            f"{self.sauce} sauce and {self.cheese}"
+        ]
         if self.toppings:
-            desc += f", topped with {', '.join(self.toppings)}"
+            desc.append(", topped with ")
+            desc.append(", ".join(self.toppings))
         if self.extra_cheese:
-            desc += ", extra cheese"
+            desc.append(", extra cheese")
         if self.gluten_free:
-            desc += " (gluten-free)"
+            desc.append(" (gluten-free)")
         if self.spicy:
-            desc += " (spicy)"
-        return desc
+            desc.append(" (spicy)")
+        return "".join(desc)
 
 
 # Abstract Builder Interface
@@ -134,9 +132,13 @@ class Builder(ABC):
 class ComputerBuilder:
     """Builder for Computer objects with a fluent interface."""
 
+    __slots__ = ("_computer",)
+
+    _computer: Computer
+
     def __init__(self):
         """Initialize the computer builder."""
-        self.reset()
+        self._computer = Computer()
 
     def reset(self) -> "ComputerBuilder":
         """Reset the builder to initial state.
@@ -297,6 +299,23 @@ class ComputerBuilder:
         self._computer.mouse = mouse
         return self
 
+    def configure(self, **values: Any) -> "ComputerBuilder":
+        """Set several computer fields in one call.
+
+        Args:
+            **values: Computer field names mapped to their values, assigned as given
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            AttributeError: If a name is not a Computer field
+        """
+        computer = self._computer
+        for name, value in values.items():
+            setattr(computer, name, value)
+        return self
+
     def build(self) -> Computer:
         """Build and return the computer.
 
@@ -312,9 +331,13 @@ class ComputerBuilder:
 class HouseBuilder:
     """Builder for House objects with a fluent interface."""
 
+    __slots__ = ("_house",)
+
+    _house: House
+
     def __init__(self):
         """Initialize the house builder."""
-        self.reset()
+        self._house = House()
 
     def reset(self) -> "HouseBuilder":
         """Reset the builder to initial state.
@@ -436,6 +459,35 @@ class HouseBuilder:
         self._house.rooms.append(room)
         return self
 
+    def set_rooms(self, rooms: Iterable[str]) -> "HouseBuilder":
+        """Replace the room list in a single allocation.
+
+        Args:
+            rooms: Room types, in order
+
+        Returns:
+            Self for method chaining
+        """
+        self._house.rooms = list(rooms)
+        return self
+
+    def configure(self, **values: Any) -> "HouseBuilder":
+        """Set several house fields in one call.
+
+        Args:
+            **values: House field names mapped to their values, assigned as given
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            AttributeError: If a name is not a House field
+        """
+        house = self._house
+        for name, value in values.items():
+            setattr(house, name, value)
+        return self
+
     def build(self) -> House:
         """Build and return the house.
 
@@ -451,9 +503,13 @@ class HouseBuilder:
 class PizzaBuilder:
     """Builder for Pizza objects with a fluent interface."""
 
+    __slots__ = ("_pizza",)
+
+    _pizza: Pizza
+
     def __init__(self):
         """Initialize the pizza builder."""
-        self.reset()
+        self._pizza = Pizza()
 
     def reset(self) -> "PizzaBuilder":
         """Reset the builder to initial state.
@@ -536,6 +592,18 @@ class PizzaBuilder:
         self._pizza.toppings.extend(toppings)
         return self
 
+    def set_toppings(self, toppings: Iterable[str]) -> "PizzaBuilder":
+        """Replace the topping list in a single allocation.
+
+        Args:
+            toppings: Toppings to use
+
+        Returns:
+            Self for method chaining
+        """
+        self._pizza.toppings = list(toppings)
+        return self
+
     def add_extra_cheese(self) -> "PizzaBuilder":
         """Add extra cheese.
 
@@ -563,6 +631,23 @@ class PizzaBuilder:
         self._pizza.spicy = True
         return self
 
+    def configure(self, **values: Any) -> "PizzaBuilder":
+        """Set several pizza fields in one call.
+
+        Args:
+            **values: Pizza field names mapped to their values, assigned as given
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            AttributeError: If a name is not a Pizza field
+        """
+        pizza = self._pizza
+        for name, value in values.items():
+            setattr(pizza, name, value)
+        return self
+
     def build(self) -> Pizza:
         """Build and return the pizza.
 
@@ -571,13 +656,100 @@ class PizzaBuilder:
         """
         return self._pizza
 
+    @staticmethod
+    def build_many(specs: Iterable[Dict[str, Any]]) -> List[Pizza]:
+        """Build several pizzas from field specifications.
+
+        Each pizza is constructed directly from its spec instead of going
+        through the fluent setters.
+
+        Args:
+            specs: Mappings of Pizza field names to values, one per pizza
+
+        Returns:
+            List of pizzas, in the order of the specs.
+
+        Raises:
+            TypeError: If a spec names a field Pizza does not have.
+        """
+        pizzas = []
+        for spec in specs:
+            pizza = Pizza(**spec)
+            pizza.toppings = list(pizza.toppings)
+            pizzas.append(pizza)
+        return pizzas
+
+
+# Preset values shared by several director configurations, interned so every
+# product built from a preset references the same string objects
+_WINDOWS_11_PRO = sys.intern("Windows 11 Pro")
+_INTEGRATED_GRAPHICS = sys.intern("Integrated Graphics")
+_CONCRETE_SLAB = sys.intern("Concrete Slab")
+_WOOD_FRAME = sys.intern("Wood Frame")
+_ASPHALT_SHINGLES = sys.intern("Asphalt Shingles")
+_MASTER_BEDROOM = sys.intern("Master Bedroom")
+_LIVING_ROOM = sys.intern("Living Room")
+_DINING_ROOM = sys.intern("Dining Room")
+_BELL_PEPPERS = sys.intern("bell peppers")
+
 
 # Director Classes
 
+# Recorded preset: the builder it was recorded with, product class, its field
+# values and its list-valued fields
+_PresetRecord = Tuple[Any, type, Tuple[Any, ...], Tuple[str, ...]]
+
+
+def _preset(build: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Memoize a director preset method.
+
+    The first call runs the builder steps and records the product's field
+    values. Every call, the first included, returns a new product constructed
+    from those values, copying list fields so products never share them with
+    each other or with the builder. The steps run again if the director's
+    builder has been replaced since the values were recorded.
+
+    Args:
+        build: Director method that builds the preset with the builder
+
+    Returns:
+        The memoized director method.
+    """
+    name = build.__name__
+
+    @functools.wraps(build)
+    def wrapper(self: Any) -> T:
+        record = self._presets.get(name)
+        if record is None or record[0] is not self.builder:
+            product = build(self)
+            values = tuple(getattr(product, f.name) for f in fields(product))
+            list_fields = tuple(
+                f.name
+                for f, value in zip(fields(product), values)
+                if type(value) is list
+            )
+            record = (
+                self.builder,
+                type(product),
+                tuple(v.copy() if type(v) is list else v for v in values),
+                list_fields,
+            )
+            self._presets[name] = record
+
+        _, product_class, values, list_fields = record
+        product = product_class(*values)
+        for field_name in list_fields:
+            setattr(product, field_name, getattr(product, field_name).copy())
+        return product
+
+    return wrapper
+
 
 class ComputerDirector:
     """Director that uses ComputerBuilder to construct specific computer types."""
 
+    __slots__ = ("builder", "_presets")
+
     def __init__(self, builder: ComputerBuilder):
         """Initialize the director.
 
@@ -585,7 +757,9 @@ class ComputerDirector:
             builder: Computer builder instance
         """
         self.builder = builder
+        self._presets: Dict[str, _PresetRecord] = {}
 
+    @_preset
     def build_gaming_computer(self) -> Computer:
         """Build a gaming computer.
 
@@ -603,13 +777,14 @@ class ComputerDirector:
             .enable_bluetooth()
             .enable_wifi()
             .set_case_color("RGB")
-            .set_operating_system("Windows 11 Pro")
+            .set_operating_system(_WINDOWS_11_PRO)
             .set_monitor("32-inch 4K Gaming Monitor")
             .set_keyboard("Mechanical RGB Keyboard")
             .set_mouse("High-DPI Gaming Mouse")
             .build()
         )
 
+    @_preset
     def build_office_computer(self) -> Computer:
         """Build an office computer.
 
@@ -621,17 +796,18 @@ class ComputerDirector:
             .set_cpu("Intel Core i5-13400")
             .set_memory("16GB DDR4")
             .set_storage("512GB SSD")
-            .set_graphics_card("Integrated Graphics")
+            .set_graphics_card(_INTEGRATED_GRAPHICS)
             .set_network_card("Standard Ethernet")
             .enable_wifi()
             .set_case_color("Black")
-            .set_operating_system("Windows 11 Pro")
+            .set_operating_system(_WINDOWS_11_PRO)
             .set_monitor("24-inch 1080p Monitor")
             .set_keyboard("Standard Keyboard")
             .set_mouse("Optical Mouse")
             .build()
         )
 
+    @_preset
     def build_budget_computer(self) -> Computer:
         """Build a budget computer.
 
@@ -643,7 +819,7 @@ class ComputerDirector:
             .set_cpu("AMD Ryzen 3 4300G")
             .set_memory("8GB DDR4")
             .set_storage("256GB SSD")
-            .set_graphics_card("Integrated Graphics")
+            .set_graphics_card(_INTEGRATED_GRAPHICS)
             .enable_wifi()
             .set_case_color("Black")
             .set_operating_system("Windows 11 Home")
@@ -654,6 +830,8 @@ class ComputerDirector:
 class HouseDirector:
     """Director that uses HouseBuilder to construct specific house types."""
 
+    __slots__ = ("builder", "_presets")
+
     def __init__(self, builder: HouseBuilder):
         """Initialize the director.
 
@@ -661,7 +839,9 @@ class HouseDirector:
             builder: House builder instance
         """
         self.builder = builder
+        self._presets: Dict[str, _PresetRecord] = {}
 
+    @_preset
     def build_luxury_house(self) -> House:
         """Build a luxury house.
 
@@ -679,17 +859,22 @@ class HouseDirector:
             .add_garden()
             .add_pool()
             .set_floors(3)
-            .add_room("Master Bedroom")
-            .add_room("Guest Bedroom")
-            .add_room("Study")
-            .add_room("Living Room")
-            .add_room("Dining Room")
-            .add_room("Kitchen")
-            .add_room("Home Theater")
-            .add_room("Gym")
+            .set_rooms(
+                [
+                    _MASTER_BEDROOM,
+                    "Guest Bedroom",
+                    "Study",
+                    _LIVING_ROOM,
+                    _DINING_ROOM,
+                    "Kitchen",
+                    "Home Theater",
+                    "Gym",
+                ]
+            )
             .build()
         )
 
+    @_preset
     def build_family_house(self) -> House:
         """Build a family house.
 
@@ -698,22 +883,27 @@ class HouseDirector:
         """
         return (
             self.builder.reset()
-            .set_foundation("Concrete Slab")
-            .set_walls("Wood Frame")
-            .set_roof("Asphalt Shingles")
+            .set_foundation(_CONCRETE_SLAB)
+            .set_walls(_WOOD_FRAME)
+            .set_roof(_ASPHALT_SHINGLES)
             .set_windows(12)
             .set_doors(4)
             .add_garage()
             .add_garden()
             .set_floors(2)
-            .add_room("Master Bedroom")
-            .add_room("Children's Bedroom")
-            .add_room("Living Room")
-            .add_room("Kitchen")
-            .add_room("Dining Room")
+            .set_rooms(
+                [
+                    _MASTER_BEDROOM,
+                    "Children's Bedroom",
+                    _LIVING_ROOM,
+                    "Kitchen",
+                    _DINING_ROOM,
+                ]
+            )
             .build()
         )
 
+    @_preset
     def build_starter_house(self) -> House:
         """Build a starter house.
 
@@ -722,15 +912,19 @@ class HouseDirector:
         """
         return (
             self.builder.reset()
-            .set_foundation("Concrete Slab")
-            .set_walls("Wood Frame")
-            .set_roof("Asphalt Shingles")
+            .set_foundation(_CONCRETE_SLAB)
+            .set_walls(_WOOD_FRAME)
+            .set_roof(_ASPHALT_SHINGLES)
             .set_windows(8)
             .set_doors(2)
             .set_floors(1)
-            .add_room("Bedroom")
-            .add_room("Living Room")
-            .add_room("Kitchen")
+            .set_rooms(
+                [
+                    "Bedroom",
+                    _LIVING_ROOM,
+                    "Kitchen",
+                ]
+            )
             .build()
         )
 
@@ -738,6 +932,8 @@ class HouseDirector:
 class PizzaDirector:
     """Director that uses PizzaBuilder to construct specific pizza types."""
 
+    __slots__ = ("builder", "_presets")
+
     def __init__(self, builder: PizzaBuilder):
         """Initialize the director.
 
@@ -745,7 +941,9 @@ class PizzaDirector:
             builder: Pizza builder instance
         """
         self.builder = builder
+        self._presets: Dict[str, _PresetRecord] = {}
 
+    @_preset
     def build_margherita(self) -> Pizza:
         """Build a Margherita pizza.
 
@@ -758,11 +956,11 @@ class PizzaDirector:
             .set_crust("thin")
             .set_sauce("tomato")
             .set_cheese("mozzarella")
-            .add_topping("fresh basil")
-            .add_topping("tomato slices")
+            .set_toppings(["fresh basil", "tomato slices"])
             .build()
         )
 
+    @_preset
     def build_pepperoni(self) -> Pizza:
         """Build a pepperoni pizza.
 
@@ -779,6 +977,7 @@ class PizzaDirector:
             .build()
         )
 
+    @_preset
     def build_supreme(self) -> Pizza:
         """Build a supreme pizza.
 
@@ -791,12 +990,12 @@ class PizzaDirector:
             .set_crust("thick")
             .set_sauce("tomato")
             .set_cheese("mozzarella")
-            .add_toppings(
+            .set_toppings(
                 [
                     "pepperoni",
                     "sausage",
                     "mushrooms",
-                    "bell peppers",
+                    _BELL_PEPPERS,
                     "onions",
                     "black olives",
                 ]
@@ -805,6 +1004,7 @@ class PizzaDirector:
             .build()
         )
 
+    @_preset
     def build_veggie_deluxe(self) -> Pizza:
         """Build a veggie deluxe pizza.
 
@@ -817,12 +1017,12 @@ class PizzaDirector:
             .set_crust("thin")
             .set_sauce("pesto")
             .set_cheese("goat cheese")
-            .add_toppings(
+            .set_toppings(
                 [
                     "spinach",
                     "sun-dried tomatoes",
                     "artichokes",
-                    "bell peppers",
+                    _BELL_PEPPERS,
                     "red onions",
                     "pine nuts",
                 ]
@@ -838,26 +1038,48 @@ class PizzaDirector:
 class SQLQueryBuilder:
     """Builder for constructing SQL queries."""
 
+    __slots__ = (
+        "_select",
+        "_from",
+        "_joins",
+        "_where",
+        "_group_by",
+        "_having",
+        "_order_by",
+        "_limit",
+        "_query",
+    )
+
     def __init__(self):
         """Initialize the SQL query builder."""
-        self.reset()
+        self._select: List[str] = []
+        self._from = ""
+        self._joins: List[str] = []
+        self._where: List[str] = []
+        self._group_by: List[str] = []
+        self._having: List[str] = []
+        self._order_by: List[str] = []
+        self._limit: Optional[int] = None
+        self._query: Optional[str] = None
 
     def reset(self) -> "SQLQueryBuilder":
         """Reset the builder to initial state.
 
+        Clause lists are cleared in place so a builder reused for many
+        queries keeps its list storage instead of reallocating it.
+
         Returns:
             Self for method chaining
         """
-        self._query_parts = {
-            "select": [],
-            "from": "",
-            "joins": [],
-            "where": [],
-            "group_by": [],
-            "having": [],
-            "order_by": [],
-            "limit": None,
-        }
+        self._select.clear()
+        self._from = ""
+        self._joins.clear()
+        self._where.clear()
+        self._group_by.clear()
+        self._having.clear()
+        self._order_by.clear()
+        self._limit = None
+        self._query = None
         return self
 
     def select(self, *columns: str) -> "SQLQueryBuilder":
@@ -869,7 +1091,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["select"].extend(columns)
+        self._select.extend(columns)
+        self._query = None
         return self
 
     def from_table(self, table: str) -> "SQLQueryBuilder":
@@ -881,7 +1104,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["from"] = table
+        self._from = table
+        self._query = None
         return self
 
     def join(
@@ -897,7 +1121,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["joins"].append(f"{join_type} JOIN {table} ON {on_condition}")
+        self._joins.append(f"{join_type} JOIN {table} ON {on_condition}")
+        self._query = None
         return self
 
     def where(self, condition: str) -> "SQLQueryBuilder":
@@ -909,7 +1134,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["where"].append(condition)
+        self._where.append(condition)
+        self._query = None
         return self
 
     def group_by(self, *columns: str) -> "SQLQueryBuilder":
@@ -921,7 +1147,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["group_by"].extend(columns)
+        self._group_by.extend(columns)
+        self._query = None
         return self
 
     def having(self, condition: str) -> "SQLQueryBuilder":
@@ -933,7 +1160,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["having"].append(condition)
+        self._having.append(condition)
+        self._query = None
         return self
 
     def order_by(self, column: str, direction: str = "ASC") -> "SQLQueryBuilder":
@@ -946,7 +1174,8 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["order_by"].append(f"{column} {direction}")
+        self._order_by.append(f"{column} {direction}")
+        self._query = None
         return self
 
     def limit(self, count: int) -> "SQLQueryBuilder":
@@ -958,52 +1187,64 @@ class SQLQueryBuilder:
         Returns:
             Self for method chaining
         """
-        self._query_parts["limit"] = count
+        self._limit = count
+        self._query = None
         return self
 
     def build(self) -> str:
         """Build and return the SQL query.
 
+        The query text is cached until the builder is next modified, so
+        repeated builds of an unchanged query return the same string.
+
         Returns:
             SQL query string
         """
-        query_parts = []
+        if self._query is not None:
+            return self._query
+
+        # Keywords and clause bodies are separate entries so the whole query
+        # is assembled by a single join
+        query_parts = ["SELECT"]
 
         # SELECT
-        if self._query_parts["select"]:
-            query_parts.append(f"SELECT {', '.join(self._query_parts['select'])}")
-        else:
-            query_parts.append("SELECT *")
+        query_parts.append(", ".join(self._select) if self._select else "*")
 
         # FROM
-        if self._query_parts["from"]:
-            query_parts.append(f"FROM {self._query_parts['from']}")
+        if self._from:
+            query_parts.append("FROM")
+            query_parts.append(self._from)
 
         # JOINs
-        for join in self._query_parts["joins"]:
-            query_parts.append(join)
+        query_parts.extend(self._joins)
 
         # WHERE
-        if self._query_parts["where"]:
-            query_parts.append(f"WHERE {' AND '.join(self._query_parts['where'])}")
+        if self._where:
+            query_parts.append("WHERE")
+            query_parts.append(" AND ".join(self._where))
 
         # GROUP BY
-        if self._query_parts["group_by"]:
-            query_parts.append(f"GROUP BY {', '.join(self._query_parts['group_by'])}")
+        if self._group_by:
+            query_parts.append("GROUP BY")
+            query_parts.append(", ".join(self._group_by))
 
         # HAVING
-        if self._query_parts["having"]:
-            query_parts.append(f"HAVING {' AND '.join(self._query_parts['having'])}")
+        if self._having:
+            query_parts.append("HAVING")
+            query_parts.append(" AND ".join(self._having))
 
         # ORDER BY
-        if self._query_parts["order_by"]:
-            query_parts.append(f"ORDER BY {', '.join(self._query_parts['order_by'])}")
+        if self._order_by:
+            query_parts.append("ORDER BY")
+            query_parts.append(", ".join(self._order_by))
 
         # LIMIT
-        if self._query_parts["limit"]:
-            query_parts.append(f"LIMIT {self._query_parts['limit']}")
+        if self._limit:
+            query_parts.append("LIMIT")
+            query_parts.append(str(self._limit))
 
-        return " ".join(query_parts)
+        self._query = query = " ".join(query_parts)
+        return query
 
 
 # Example usage functions
@@ -5,10 +5,14 @@ how to encapsulate requests as objects to support undo operations, queuing,
 and logging.
 """
 
+import zlib
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Deque, List, Optional
+
+from ._output import batched_output, emit
 
 
 class Command(ABC):
@@ -18,6 +22,8 @@ class Command(ABC):
     trigger an event at a later time.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self) -> None:
         """Execute the command."""
@@ -35,6 +41,8 @@ class NoCommand(Command):
     Used as a placeholder when no command is assigned to avoid null checks.
     """
 
+    __slots__ = ()
+
     def execute(self) -> None:
         """Do nothing."""
         pass
@@ -44,12 +52,18 @@ class NoCommand(Command):
         pass
 
 
+# Shared placeholder installed in empty remote control slots.
+_NO_COMMAND = NoCommand()
+
+
 # Receiver Classes
 
 
 class Light:
     """Light device that can be turned on/off."""
 
+    __slots__ = ("location", "is_on")
+
     def __init__(self, location: str):
         """Initialize the light.
 
@@ -62,12 +76,12 @@ class Light:
     def turn_on(self) -> None:
         """Turn the light on."""
         self.is_on = True
-        print(f"{self.location} light is ON")
+        emit(f"{self.location} light is ON")
 
     def turn_off(self) -> None:
         """Turn the light off."""
         self.is_on = False
-        print(f"{self.location} light is OFF")
+        emit(f"{self.location} light is OFF")
 
     def get_state(self) -> bool:
         """Get the current state of the light.
@@ -78,9 +92,15 @@ class Light:
         return self.is_on
 
 
+# Status text for each fan speed, indexed by the clamped speed value.
+_FAN_SPEED_STATES = ("OFF", "on LOW speed", "on MEDIUM speed", "on HIGH speed")
+
+
 class Fan:
     """Fan device with variable speed control."""
 
+    __slots__ = ("location", "speed")
+
     def __init__(self, location: str):
         """Initialize the fan.
 
@@ -96,15 +116,15 @@ class Fan:
         Args:
             speed: Fan speed (0-3)
         """
-        self.speed = max(0, min(3, speed))
-        if self.speed == 0:
-            print(f"{self.location} fan is OFF")
-        elif self.speed == 1:
-            print(f"{self.location} fan is on LOW speed")
-        elif self.speed == 2:
-            print(f"{self.location} fan is on MEDIUM speed")
+        if type(speed) is int:
+            self.speed = 0 if speed < 0 else 3 if speed > 3 else speed
+            state = self.speed
         else:
-            print(f"{self.location} fan is on HIGH speed")
+            # Other numbers keep the original mapping: only speeds equal to
+            # 0, 1 or 2 get their own label, anything else reports HIGH
+            self.speed = max(0, min(3, speed))
+            state = int(self.speed) if self.speed in (0, 1, 2) else 3
+        emit(f"{self.location} fan is {_FAN_SPEED_STATES[state]}")
 
     def off(self) -> None:
         """Turn the fan off."""
@@ -134,6 +154,8 @@ class Fan:
 class Stereo:
     """Stereo device with volume control."""
 
+    __slots__ = ("location", "is_on", "volume")
+
     def __init__(self, location: str):
         """Initialize the stereo.
 
@@ -147,12 +169,12 @@ class Stereo:
     def turn_on(self) -> None:
         """Turn the stereo on."""
         self.is_on = True
-        print(f"{self.location} stereo is ON")
+        emit(f"{self.location} stereo is ON")
 
     def turn_off(self) -> None:
         """Turn the stereo off."""
         self.is_on = False
-        print(f"{self.location} stereo is OFF")
+        emit(f"{self.location} stereo is OFF")
 
     def set_volume(self, volume: int) -> None:
         """Set the stereo volume.
@@ -161,7 +183,7 @@ class Stereo:
             volume: Volume level (0-100)
         """
         self.volume = max(0, min(100, volume))
-        print(f"{self.location} stereo volume set to {self.volume}")
+        emit(f"{self.location} stereo volume set to {self.volume}")
 
     def get_volume(self) -> int:
         """Get the current volume.
@@ -186,6 +208,8 @@ class Stereo:
 class LightOnCommand(Command):
     """Command to turn a light on."""
 
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         """Initialize the command.
 
@@ -206,6 +230,8 @@ class LightOnCommand(Command):
 class LightOffCommand(Command):
     """Command to turn a light off."""
 
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         """Initialize the command.
 
@@ -226,6 +252,8 @@ class LightOffCommand(Command):
 class FanSpeedCommand(Command):
     """Command to set fan speed."""
 
+    __slots__ = ("fan", "speed", "previous_speed")
+
     def __init__(self, fan: Fan, speed: int):
         """Initialize the command.
 
@@ -250,6 +278,8 @@ class FanSpeedCommand(Command):
 class StereoOnWithVolumeCommand(Command):
     """Command to turn stereo on with specific volume."""
 
+    __slots__ = ("stereo", "volume", "previous_volume", "was_on")
+
     def __init__(self, stereo: Stereo, volume: int = 50):
         """Initialize the command.
 
@@ -279,6 +309,8 @@ class StereoOnWithVolumeCommand(Command):
 class StereoOffCommand(Command):
     """Command to turn stereo off."""
 
+    __slots__ = ("stereo", "previous_volume", "was_on")
+
     def __init__(self, stereo: Stereo):
         """Initialize the command.
 
@@ -305,6 +337,8 @@ class StereoOffCommand(Command):
 class MacroCommand(Command):
     """Command that executes multiple commands."""
 
+    __slots__ = ("commands",)
+
     def __init__(self, commands: List[Command]):
         """Initialize the macro command.
 
@@ -315,13 +349,15 @@ class MacroCommand(Command):
 
     def execute(self) -> None:
         """Execute all commands in order."""
-        for command in self.commands:
-            command.execute()
+        with batched_output():
+            for command in self.commands:
+                command.execute()
 
     def undo(self) -> None:
         """Undo all commands in reverse order."""
-        for command in reversed(self.commands):
-            command.undo()
+        with batched_output():
+            for command in reversed(self.commands):
+                command.undo()
 
 
 # Invoker Classes
@@ -336,10 +372,9 @@ class RemoteControl:
         Args:
             slots: Number of command slots
         """
-        no_command = NoCommand()
-        self.on_commands = [no_command] * slots
-        self.off_commands = [no_command] * slots
-        self.undo_command = no_command
+        self.on_commands: List[Command] = [_NO_COMMAND] * slots
+        self.off_commands: List[Command] = [_NO_COMMAND] * slots
+        self.undo_command: Command = _NO_COMMAND
 
     def set_command(self, slot: int, on_command: Command, off_command: Command) -> None:
         """Set commands for a specific slot.
@@ -360,8 +395,10 @@ class RemoteControl:
             slot: Slot number
         """
         if 0 <= slot < len(self.on_commands):
-            self.on_commands[slot].execute()
-            self.undo_command = self.on_commands[slot]
+            command = self.on_commands[slot]
+            if command is not _NO_COMMAND:
+                command.execute()
+            self.undo_command = command
 
     def off_button_pressed(self, slot: int) -> None:
         """Press the "off" button for a specific slot.
@@ -370,12 +407,15 @@ class RemoteControl:
             slot: Slot number
         """
         if 0 <= slot < len(self.off_commands):
-            self.off_commands[slot].execute()
-            self.undo_command = self.off_commands[slot]
+            command = self.off_commands[slot]
+            if command is not _NO_COMMAND:
+                command.execute()
+            self.undo_command = command
 
     def undo_button_pressed(self) -> None:
         """Press the undo button."""
-        self.undo_command.undo()
+        if self.undo_command is not _NO_COMMAND:
+            self.undo_command.undo()
 
     def __str__(self) -> str:
         """String representation of the remote control.
@@ -383,12 +423,13 @@ class RemoteControl:
         Returns:
             String showing all configured commands
         """
-        result = "\n------ Remote Control ------\n"
-        for i in range(len(self.on_commands)):
-            result += f"[slot {i}] {self.on_commands[i].__class__.__name__}    "
-            result += f"{self.off_commands[i].__class__.__name__}\n"
-        result += f"[undo] {self.undo_command.__class__.__name__}\n"
-        return result
+        lines = ["\n------ Remote Control ------"]
+        lines.extend(
+            f"[slot {i}] {type(on).__name__}    {type(off).__name__}"
+            for i, (on, off) in enumerate(zip(self.on_commands, self.off_commands))
+        )
+        lines.append(f"[undo] {type(self.undo_command).__name__}\n")
+        return "\n".join(lines)
 
 
 class SimpleRemoteControl:
@@ -420,7 +461,7 @@ class CommandQueue:
 
     def __init__(self):
         """Initialize the command queue."""
-        self.commands: List[Command] = []
+        self.commands: Deque[Command] = deque()
 
     def add_command(self, command: Command) -> None:
         """Add a command to the queue.
@@ -431,10 +472,15 @@ class CommandQueue:
         self.commands.append(command)
 
     def execute_all(self) -> None:
-        """Execute all commands in the queue."""
-        for command in self.commands:
-            command.execute()
-        self.commands.clear()
+        """Execute all commands in the queue.
+
+        Commands are removed as they run, so commands added while the queue
+        is draining are executed in the same call.
+        """
+        commands = self.commands
+        with batched_output():
+            while commands:
+                commands.popleft().execute()
 
     def clear(self) -> None:
         """Clear all commands from the queue."""
@@ -449,7 +495,7 @@ class CommandQueue:
         return len(self.commands)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandHistoryEntry:
     """Entry in command history."""
 
@@ -467,7 +513,9 @@ class CommandHistory:
         Args:
             max_size: Maximum number of commands to keep in history
         """
-        self.history: List[CommandHistoryEntry] = []
+        # Bounded deque acts as a ring buffer: appending at capacity drops the
+        # oldest entry in O(1) instead of shifting a list
+        self.history: Deque[CommandHistoryEntry] = deque(maxlen=max_size)
         self.current_position = -1
         self.max_size = max_size
 
@@ -479,22 +527,18 @@ class CommandHistory:
             description: Optional description of the command
         """
         # Remove any commands after current position (for redo functionality)
-        self.history = self.history[: self.current_position + 1]
+        while len(self.history) > self.current_position + 1:
+            self.history.pop()
 
         # Execute the command
         command.execute()
 
-        # Add to history
+        # Add to history, evicting the oldest entry once max_size is reached
         entry = CommandHistoryEntry(
             command=command, executed_at=datetime.now(), description=description
         )
         self.history.append(entry)
-        self.current_position += 1
-
-        # Limit history size
-        if len(self.history) > self.max_size:
-            self.history.pop(0)
-            self.current_position -= 1
+        self.current_position = len(self.history) - 1
 
     def undo(self) -> bool:
         """Undo the last command.
@@ -544,7 +588,7 @@ class CommandHistory:
         Returns:
             List of command history entries
         """
-        return self.history.copy()
+        return list(self.history)
 
     def clear(self) -> None:
         """Clear the command history."""
@@ -621,6 +665,8 @@ class TextEditor:
 class InsertTextCommand(Command):
     """Command to insert text into a text editor."""
 
+    __slots__ = ("editor", "text", "position")
+
     def __init__(self, editor: TextEditor, text: str, position: int):
         """Initialize the command.
 
@@ -648,9 +694,15 @@ class InsertTextCommand(Command):
         self.editor.set_content(new_content)
 
 
+# Deleted text longer than this is held zlib-compressed until undo needs it
+_COMPRESS_THRESHOLD = 4096
+
+
 class DeleteTextCommand(Command):
     """Command to delete text from a text editor."""
 
+    __slots__ = ("editor", "start", "length", "_deleted_text", "_compressed")
+
     def __init__(self, editor: TextEditor, start: int, length: int):
         """Initialize the command.
 
@@ -662,7 +714,24 @@ class DeleteTextCommand(Command):
         self.editor = editor
         self.start = start
         self.length = length
-        self.deleted_text = ""
+        self._deleted_text = ""
+        self._compressed: Optional[bytes] = None
+
+    @property
+    def deleted_text(self) -> str:
+        """Text removed by the last execution."""
+        if self._compressed is not None:
+            return zlib.decompress(self._compressed).decode("utf-8")
+        return self._deleted_text
+
+    @deleted_text.setter
+    def deleted_text(self, text: str) -> None:
+        if len(text) > _COMPRESS_THRESHOLD:
+            self._compressed = zlib.compress(text.encode("utf-8"), 1)
+            self._deleted_text = ""
+        else:
+            self._compressed = None
+            self._deleted_text = text
 
     def execute(self) -> None:
         """Delete the text."""
@@ -4,13 +4,37 @@ This module provides implementations of the Factory and Abstract Factory pattern
 demonstrating how to create objects without specifying their exact classes.
 """
 
+import functools
 import math
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
 
 
+def _normalize_key(key: str) -> str:
+    """Lowercase a factory key, reusing it as-is when already lowercase.
+
+    Args:
+        key: The type or platform key passed to a factory
+
+    Returns:
+        The lowercase key.
+    """
+    return key if key.islower() else key.lower()
+
+
 class Product(ABC):
     """Abstract base class for products created by factories."""
 
@@ -95,6 +119,22 @@ class ConcreteCreatorB(Creator):
         return ConcreteProductB()
 
 
+def _build_product_table() -> tuple[Optional[Type[Product]], ...]:
+    """Build the ASCII lookup table used by ``SimpleFactory``.
+
+    Returns:
+        A 128-entry tuple mapping each character code to its product class.
+    """
+    table: list[Optional[Type[Product]]] = [None] * 128
+    table[ord("A")] = ConcreteProductA
+    table[ord("B")] = ConcreteProductB
+    return tuple(table)
+
+
+# Product classes indexed by the character code of their one-letter type
+_PRODUCT_TABLE = _build_product_table()
+
+
 class SimpleFactory:
     """Simple factory for creating products without inheritance."""
 
@@ -111,12 +151,15 @@ class SimpleFactory:
         Raises:
             ValueError: If the product type is not supported.
         """
-        if product_type == "A":
-            return ConcreteProductA()
-        elif product_type == "B":
-            return ConcreteProductB()
-        else:
+        product_class = None
+        if isinstance(product_type, str) and len(product_type) == 1:
+            code = ord(product_type)
+            if code < len(_PRODUCT_TABLE):
+                product_class = _PRODUCT_TABLE[code]
+
+        if product_class is None:
             raise ValueError(f"Unknown product type: {product_type}")
+        return product_class()
 
     @staticmethod
     def get_supported_types() -> list[str]:
@@ -134,6 +177,8 @@ class SimpleFactory:
 class Notifier(ABC):
     """Abstract base class for notification services."""
 
+    __slots__ = ()
+
     @abstractmethod
     def send(self, recipient: str, message: str) -> None:
         """Send a notification to a recipient.
@@ -145,14 +190,27 @@ class Notifier(ABC):
         pass
 
 
+# Default notifier settings, interned so equality checks against them can
+# short-circuit on identity
+_DEFAULT_SMTP_SERVER = sys.intern("smtp.gmail.com")
+_DEFAULT_EMAIL_USER = sys.intern("app@company.com")
+_DEFAULT_EMAIL_PASSWORD = sys.intern("secret")
+_DEFAULT_SMS_API_KEY = sys.intern("default_key")
+_DEFAULT_SMS_SERVICE = sys.intern("Twilio")
+_DEFAULT_PUSH_APP_ID = sys.intern("com.company.app")
+_DEFAULT_PUSH_SERVICE = sys.intern("Firebase")
+
+
 class EmailNotifier(Notifier):
     """Email notification service."""
 
+    __slots__ = ("smtp_server", "username", "password")
+
     def __init__(
         self,
-        smtp_server: str = "smtp.gmail.com",
-        username: str = "app@company.com",
-        password: str = "secret",
+        smtp_server: str = _DEFAULT_SMTP_SERVER,
+        username: str = _DEFAULT_EMAIL_USER,
+        password: str = _DEFAULT_EMAIL_PASSWORD,
         **kwargs,
     ):
         """Initialize email notifier.
@@ -180,7 +238,14 @@ class EmailNotifier(Notifier):
 class SMSNotifier(Notifier):
     """SMS notification service."""
 
-    def __init__(self, api_key: str = "default_key", service: str = "Twilio", **kwargs):
+    __slots__ = ("api_key", "service")
+
+    def __init__(
+        self,
+        api_key: str = _DEFAULT_SMS_API_KEY,
+        service: str = _DEFAULT_SMS_SERVICE,
+        **kwargs,
+    ):
         """Initialize SMS notifier.
 
         Args:
@@ -204,8 +269,13 @@ class SMSNotifier(Notifier):
 class PushNotifier(Notifier):
     """Push notification service."""
 
+    __slots__ = ("app_id", "service")
+
     def __init__(
-        self, app_id: str = "com.company.app", service: str = "Firebase", **kwargs
+        self,
+        app_id: str = _DEFAULT_PUSH_APP_ID,
+        service: str = _DEFAULT_PUSH_SERVICE,
+        **kwargs,
     ):
         """Initialize push notifier.
 
@@ -227,6 +297,18 @@ class PushNotifier(Notifier):
         print(f"   Using service: {self.service}")
 
 
+# Notifier classes keyed by lowercase notification type, in supported order
+_NOTIFIERS: Dict[str, Type[Notifier]] = {
+    "email": EmailNotifier,
+    "sms": SMSNotifier,
+    "push": PushNotifier,
+}
+
+# Supported notification types and their error-message listing, built once
+_NOTIFIER_TYPES = list(_NOTIFIERS)
+_NOTIFIER_TYPES_TEXT = ", ".join(_NOTIFIERS)
+
+
 class NotificationFactory:
     """Factory for creating notification services."""
 
@@ -244,20 +326,15 @@ class NotificationFactory:
         Raises:
             ValueError: If the notification type is not supported.
         """
-        notification_type = notification_type.lower()
+        notification_type = _normalize_key(notification_type)
 
-        if notification_type == "email":
-            return EmailNotifier(**kwargs)
-        elif notification_type == "sms":
-            return SMSNotifier(**kwargs)
-        elif notification_type == "push":
-            return PushNotifier(**kwargs)
-        else:
-            supported = NotificationFactory.get_supported_types()
+        notifier_class = _NOTIFIERS.get(notification_type)
+        if notifier_class is None:
             raise ValueError(
                 f"Unknown notification type: {notification_type}. "
-                f"Supported types: {', '.join(supported)}"
+                f"Supported types: {_NOTIFIER_TYPES_TEXT}"
             )
+        return notifier_class(**kwargs)
 
     @staticmethod
     def get_supported_types() -> list[str]:
@@ -266,7 +343,7 @@ class NotificationFactory:
         Returns:
             List of supported notification type strings.
         """
-        return ["email", "sms", "push"]
+        return _NOTIFIER_TYPES.copy()
 
 
 # Shape Factory Example
@@ -275,6 +352,8 @@ class NotificationFactory:
 class Shape(ABC):
     """Abstract base class for geometric shapes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         """Calculate the area of the shape.
@@ -295,7 +374,17 @@ class Shape(ABC):
 
 
 class Circle(Shape):
-    """Circle shape implementation."""
+    """Circle shape implementation.
+
+    Example:
+        >>> circle = Circle(2)
+        >>> circle.area() == math.pi * 4
+        True
+        >>> circle.perimeter() == math.pi * 4
+        True
+    """
+
+    __slots__ = ("radius",)
 
     def __init__(self, radius: float):
         """Initialize a circle.
@@ -330,6 +419,8 @@ class Circle(Shape):
 class Rectangle(Shape):
     """Rectangle shape implementation."""
 
+    __slots__ = ("width", "height")
+
     def __init__(self, width: float, height: float):
         """Initialize a rectangle.
 
@@ -365,6 +456,8 @@ class Rectangle(Shape):
 class Triangle(Shape):
     """Equilateral triangle shape implementation."""
 
+    __slots__ = ("side",)
+
     def __init__(self, side: float):
         """Initialize an equilateral triangle.
 
@@ -395,6 +488,35 @@ class Triangle(Shape):
         return 3 * self.side
 
 
+def _make_circle(**kwargs: Any) -> Circle:
+    """Build a circle from factory keyword arguments."""
+    if "radius" not in kwargs:
+        raise ValueError("Circle requires 'radius' parameter")
+    return Circle(kwargs["radius"])
+
+
+def _make_rectangle(**kwargs: Any) -> Rectangle:
+    """Build a rectangle from factory keyword arguments."""
+    if "width" not in kwargs or "height" not in kwargs:
+        raise ValueError("Rectangle requires 'width' and 'height' parameters")
+    return Rectangle(kwargs["width"], kwargs["height"])
+
+
+def _make_triangle(**kwargs: Any) -> Triangle:
+    """Build a triangle from factory keyword arguments."""
+    if "side" not in kwargs:
+        raise ValueError("Triangle requires 'side' parameter")
+    return Triangle(kwargs["side"])
+
+
+# Shape builders keyed by lowercase shape type, in supported order
+_SHAPE_BUILDERS: Dict[str, Callable[..., Shape]] = {
+    "circle": _make_circle,
+    "rectangle": _make_rectangle,
+    "triangle": _make_triangle,
+}
+
+
 class ShapeFactory:
     """Factory for creating geometric shapes."""
 
@@ -411,30 +533,62 @@ class ShapeFactory:
 
         Raises:
             ValueError: If the shape type is not supported or required parameters are missing.
+
+        Example:
+            >>> ShapeFactory.create_shape("Rectangle", width=4, height=5).area()
+            20
+            >>> ShapeFactory.create_shape("circle")
+            Traceback (most recent call last):
+                ...
+            ValueError: Circle requires 'radius' parameter
         """
-        shape_type = shape_type.lower()
+        return ShapeFactory._get_builder(shape_type)(**kwargs)
+
+    @staticmethod
+    def create_many(
+        shape_type: str, params_iter: Iterable[Dict[str, Any]]
+    ) -> List[Shape]:
+        """Create several shapes of one type.
 
-        if shape_type == "circle":
-            if "radius" not in kwargs:
-                raise ValueError("Circle requires 'radius' parameter")
-            return Circle(kwargs["radius"])
+        The shape type is resolved once, then each parameter mapping is
+        passed straight to the shape builder.
 
-        elif shape_type == "rectangle":
-            if "width" not in kwargs or "height" not in kwargs:
-                raise ValueError("Rectangle requires 'width' and 'height' parameters")
-            return Rectangle(kwargs["width"], kwargs["height"])
+        Args:
+            shape_type: Type of shape to create
+            params_iter: Parameter mappings, one per shape to create
 
-        elif shape_type == "triangle":
-            if "side" not in kwargs:
-                raise ValueError("Triangle requires 'side' parameter")
-            return Triangle(kwargs["side"])
+        Returns:
+            List of Shape instances, in the order of the parameters.
 
-        else:
+        Raises:
+            ValueError: If the shape type is not supported or required parameters are missing.
+        """
+        builder = ShapeFactory._get_builder(shape_type)
+        return [builder(**params) for params in params_iter]
+
+    @staticmethod
+    def _get_builder(shape_type: str) -> Callable[..., Shape]:
+        """Resolve the builder for a shape type.
+
+        Args:
+            shape_type: Type of shape to look up
+
+        Returns:
+            The builder callable for the shape type.
+
+        Raises:
+            ValueError: If the shape type is not supported.
+        """
+        shape_type = _normalize_key(shape_type)
+
+        builder = _SHAPE_BUILDERS.get(shape_type)
+        if builder is None:
             supported = ShapeFactory.get_supported_shapes()
             raise ValueError(
                 f"Unknown shape type: {shape_type}. "
                 f"Supported types: {', '.join(supported)}"
             )
+        return builder
 
     @staticmethod
     def get_supported_shapes() -> list[str]:
@@ -443,7 +597,7 @@ class ShapeFactory:
         Returns:
             List of supported shape type strings.
         """
-        return ["circle", "rectangle", "triangle"]
+        return list(_SHAPE_BUILDERS)
 
 
 # Abstract Factory Example
@@ -585,6 +739,26 @@ class MacOSFactory(AbstractFactory):
         return MacOSCheckbox()
 
 
+# UI component factories keyed by lowercase platform, in supported order
+_UI_FACTORIES: Dict[str, Type[AbstractFactory]] = {
+    "windows": WindowsFactory,
+    "macos": MacOSFactory,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_factory(platform: str) -> AbstractFactory:
+    """Create the shared component factory for a platform.
+
+    Args:
+        platform: Lowercase platform name
+
+    Returns:
+        The platform's factory, created once and reused since it is stateless.
+    """
+    return _UI_FACTORIES[platform]()
+
+
 class UIComponentFactory:
     """Factory for creating UI component factories based on platform."""
 
@@ -592,6 +766,9 @@ class UIComponentFactory:
     def create_factory(platform: str) -> AbstractFactory:
         """Create a UI component factory for the specified platform.
 
+        Component factories are stateless, so each platform's factory is
+        created once and shared between calls.
+
         Args:
             platform: The target platform ("windows" or "macos")
 
@@ -601,17 +778,14 @@ class UIComponentFactory:
         Raises:
             ValueError: If the platform is not supported.
         """
-        platform = platform.lower()
+        platform = _normalize_key(platform)
 
-        if platform == "windows":
-            return WindowsFactory()
-        elif platform == "macos":
-            return MacOSFactory()
-        else:
+        if platform not in _UI_FACTORIES:
             raise ValueError(
                 f"Unknown platform: {platform}. "
                 f"Supported platforms: {', '.join(UIComponentFactory.get_supported_platforms())}"
             )
+        return _platform_factory(platform)
 
     @staticmethod
     def get_supported_platforms() -> list[str]:
@@ -620,7 +794,7 @@ class UIComponentFactory:
         Returns:
             List of supported platform strings.
         """
-        return ["windows", "macos"]
+        return list(_UI_FACTORIES)
 
 
 # Example client code
@@ -4,10 +4,14 @@ This module provides implementations of the Observer pattern, demonstrating
 how to establish one-to-many dependency relationships between objects.
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ._output import batched_output, emit
 
 
 class Observer(ABC):
@@ -67,7 +71,9 @@ class ConcreteSubject(Subject):
 
     def __init__(self):
         """Initialize the subject with an empty observer list."""
-        self._observers: Set[Observer] = set()
+        # Insertion-ordered mapping of observer to its bound ``update`` method
+        self._observers: Dict[Observer, Callable[[Any], None]] = {}
+        self._observers_lock = threading.Lock()
         self._state: Any = None
 
     def register_observer(self, observer: Observer) -> None:
@@ -76,7 +82,11 @@ class ConcreteSubject(Subject):
         Args:
             observer: The observer to register
         """
-        self._observers.add(observer)
+        # Copy-on-write under the lock: notifications read the mapping once and
+        # iterate it lock-free, so no lock is ever held while observers run
+        with self._observers_lock:
+            if observer not in self._observers:
+                self._observers = {**self._observers, observer: observer.update}
 
     def remove_observer(self, observer: Observer) -> None:
         """Remove an observer from the notification list.
@@ -84,20 +94,34 @@ class ConcreteSubject(Subject):
         Args:
             observer: The observer to remove
         """
-        self._observers.discard(observer)
+        with self._observers_lock:
+            if observer in self._observers:
+                observers = dict(self._observers)
+                del observers[observer]
+                self._observers = observers
 
     def notify_observers(self) -> None:
         """Notify all registered observers of a change."""
-        # Create a copy to avoid issues if observers modify the set during iteration
-        for observer in list(self._observers):
-            observer.update(self._state)
+        # Registration swaps in a new mapping, so iterating the current one is safe
+        # even if observers register or remove observers during notification
+        for update in self._observers.values():
+            update(self._state)
 
     def set_state(self, state: Any) -> None:
         """Set the subject's state and notify observers.
 
+        Observers are only notified when the state actually changes.
+
         Args:
             state: The new state
         """
+        try:
+            unchanged = bool(state == self._state)
+        except (TypeError, ValueError):
+            unchanged = False  # Incomparable states are treated as changes
+        if unchanged:
+            return
+
         self._state = state
         self.notify_observers()
 
@@ -136,20 +160,22 @@ class ConcreteObserver(Observer):
         print(f"Observer {self.name} received state update: {state}")
 
 
-# Weather Station Example (Push Model)
+# Weather Station Example (Pull Model)
 
 
 class WeatherObserver(Observer):
-    """Abstract base class for weather observers."""
+    """Abstract base class for weather observers.
+
+    Observers receive the station itself and pull only the measurements
+    they need through its getters.
+    """
 
     @abstractmethod
-    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+    def update(self, station: "WeatherStation") -> None:
         """Update the observer with weather data.
 
         Args:
-            temperature: Temperature in Celsius
-            humidity: Humidity percentage
-            pressure: Atmospheric pressure in hPa
+            station: The weather station that changed
         """
         pass
 
@@ -159,10 +185,16 @@ class WeatherStation(Subject):
 
     def __init__(self):
         """Initialize the weather station."""
-        self._observers: Set[WeatherObserver] = set()
+        # Insertion-ordered mapping of observer to its bound ``update`` method,
+        # resolved once at registration to skip the per-notify attribute lookup
+        self._observers: Dict[WeatherObserver, Callable[[WeatherStation], None]] = {}
+        self._observers_lock = threading.Lock()
         self._temperature: float = 0.0
         self._humidity: float = 0.0
         self._pressure: float = 0.0
+        # Last measurements passed to set_measurements; None until the first
+        # reading, so that reading always notifies even if it is all zeros
+        self._last_reading: Optional[Tuple[float, float, float]] = None
 
     def register_observer(self, observer: WeatherObserver) -> None:
         """Register a weather observer.
@@ -170,7 +202,9 @@ class WeatherStation(Subject):
         Args:
             observer: The weather observer to register
         """
-        self._observers.add(observer)
+        with self._observers_lock:
+            if observer not in self._observers:
+                self._observers = {**self._observers, observer: observer.update}
 
     def remove_observer(self, observer: WeatherObserver) -> None:
         """Remove a weather observer.
@@ -178,23 +212,36 @@ class WeatherStation(Subject):
         Args:
             observer: The weather observer to remove
         """
-        self._observers.discard(observer)
+        with self._observers_lock:
+            if observer in self._observers:
+                observers = dict(self._observers)
+                del observers[observer]
+                self._observers = observers
 
     def notify_observers(self) -> None:
         """Notify all observers of weather changes."""
-        for observer in list(self._observers):
-            observer.update(self._temperature, self._humidity, self._pressure)
+        with batched_output():
+            for update in self._observers.values():
+                update(self)
 
     def set_measurements(
         self, temperature: float, humidity: float, pressure: float
     ) -> None:
         """Set new weather measurements and notify observers.
 
+        Observers are not notified when all three measurements equal the
+        previous reading. The first reading always notifies.
+
         Args:
             temperature: Temperature in Celsius
             humidity: Humidity percentage
             pressure: Atmospheric pressure in hPa
         """
+        reading = (temperature, humidity, pressure)
+        if reading == self._last_reading:
+            return
+
+        self._last_reading = reading
         self._temperature = temperature
         self._humidity = humidity
         self._pressure = pressure
@@ -234,19 +281,18 @@ class CurrentConditionsDisplay(WeatherObserver):
         self._humidity: float = 0.0
         self._pressure: float = 0.0
 
-    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+    def update(self, station: "WeatherStation") -> None:
         """Update the display with current conditions.
 
         Args:
-            temperature: Temperature in Celsius
-            humidity: Humidity percentage
-            pressure: Atmospheric pressure in hPa
+            station: The weather station that changed
         """
-        self._temperature = temperature
-        self._humidity = humidity
-        self._pressure = pressure
-        print(
-            f"Current conditions: {temperature}°C, {humidity}% humidity, {pressure} hPa"
+        self._temperature = station.get_temperature()
+        self._humidity = station.get_humidity()
+        self._pressure = station.get_pressure()
+        emit(
+            f"Current conditions: {self._temperature}°C, "
+            f"{self._humidity}% humidity, {self._pressure} hPa"
         )
 
 
@@ -254,28 +300,35 @@ class StatisticsDisplay(WeatherObserver):
     """Display showing weather statistics."""
 
     def __init__(self):
-        """Initialize the statistics display."""
-        self._temperatures: List[float] = []
-        self._humidities: List[float] = []
-        self._pressures: List[float] = []
+        """Initialize the statistics display.
+
+        Only running aggregates are kept, so each update costs O(1) time and
+        memory regardless of how many measurements have been seen.
+        """
+        self._temp_sum: float = 0.0
+        self._temp_count: int = 0
+        self._temp_min: float = float("inf")
+        self._temp_max: float = float("-inf")
 
-    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+    def update(self, station: "WeatherStation") -> None:
         """Update the statistics with new measurements.
 
         Args:
-            temperature: Temperature in Celsius
-            humidity: Humidity percentage
-            pressure: Atmospheric pressure in hPa
+            station: The weather station that changed
         """
-        self._temperatures.append(temperature)
-        self._humidities.append(humidity)
-        self._pressures.append(pressure)
-
-        avg_temp = sum(self._temperatures) / len(self._temperatures)
-        min_temp = min(self._temperatures)
-        max_temp = max(self._temperatures)
-
-        print(
+        temperature = station.get_temperature()
+        self._temp_sum += temperature
+        self._temp_count += 1
+        if temperature < self._temp_min:
+            self._temp_min = temperature
+        if temperature > self._temp_max:
+            self._temp_max = temperature
+
+        avg_temp = self._temp_sum / self._temp_count
+        min_temp = self._temp_min
+        max_temp = self._temp_max
+
+        emit(
             f"Statistics: Avg temp: {avg_temp:.1f}°C, Min: {min_temp}°C, Max: {max_temp}°C"
         )
 
@@ -287,14 +340,15 @@ class ForecastDisplay(WeatherObserver):
         """Initialize the forecast display."""
         self._last_pressure: Optional[float] = None
 
-    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+    def update(self, station: "WeatherStation") -> None:
         """Update the forecast based on pressure changes.
 
+        Only the pressure reading is pulled from the station.
+
         Args:
-            temperature: Temperature in Celsius
-            humidity: Humidity percentage
-            pressure: Atmospheric pressure in hPa
+            station: The weather station that changed
         """
+        pressure = station.get_pressure()
         if self._last_pressure is None:
             forecast = "More of the same"
         elif pressure > self._last_pressure:
@@ -304,7 +358,7 @@ class ForecastDisplay(WeatherObserver):
         else:
             forecast = "More of the same"
 
-        print(f"Forecast: {forecast}")
+        emit(f"Forecast: {forecast}")
         self._last_pressure = pressure
 
 
@@ -334,7 +388,9 @@ class Stock(Subject):
             symbol: Stock symbol (e.g., "AAPL")
             price: Initial stock price
         """
-        self._observers: Set[StockObserver] = set()
+        # Insertion-ordered mapping of observer to its bound ``update`` method
+        self._observers: Dict[StockObserver, Callable[[Stock], None]] = {}
+        self._observers_lock = threading.Lock()
         self._symbol = symbol
         self._price = price
 
@@ -344,7 +400,9 @@ class Stock(Subject):
         Args:
             observer: The stock observer to register
         """
-        self._observers.add(observer)
+        with self._observers_lock:
+            if observer not in self._observers:
+                self._observers = {**self._observers, observer: observer.update}
 
     def remove_observer(self, observer: StockObserver) -> None:
         """Remove a stock observer.
@@ -352,19 +410,28 @@ class Stock(Subject):
         Args:
             observer: The stock observer to remove
         """
-        self._observers.discard(observer)
+        with self._observers_lock:
+            if observer in self._observers:
+                observers = dict(self._observers)
+                del observers[observer]
+                self._observers = observers
 
     def notify_observers(self) -> None:
         """Notify all observers of stock changes."""
-        for observer in list(self._observers):
-            observer.update(self)
+        for update in self._observers.values():
+            update(self)
 
     def set_price(self, price: float) -> None:
         """Set the stock price and notify observers.
 
+        Observers are not notified when the price is unchanged.
+
         Args:
             price: New stock price
         """
+        if price == self._price:
+            return
+
         self._price = price
         self.notify_observers()
 
@@ -408,6 +475,9 @@ class StockDisplay(StockObserver):
 class TradingBot(StockObserver):
     """Automated trading bot that reacts to stock price changes."""
 
+    # Signal text indexed by decision: 0 = buy, 1 = sell, 2 = hold
+    _SIGNALS = ("BUY signal for", "SELL signal for", "HOLD")
+
     def __init__(self, name: str, buy_threshold: float, sell_threshold: float):
         """Initialize the trading bot.
 
@@ -429,20 +499,23 @@ class TradingBot(StockObserver):
         price = stock.get_price()
         symbol = stock.get_symbol()
 
-        if price <= self.buy_threshold:
-            print(f"{self.name}: BUY signal for {symbol} at ${price:.2f}")
-        elif price >= self.sell_threshold:
-            print(f"{self.name}: SELL signal for {symbol} at ${price:.2f}")
-        else:
-            print(f"{self.name}: HOLD {symbol} at ${price:.2f}")
+        decision = (
+            0
+            if price <= self.buy_threshold
+            else 1 if price >= self.sell_threshold else 2
+        )
+        print(f"{self.name}: {self._SIGNALS[decision]} {symbol} at ${price:.2f}")
 
 
 # Event System Example
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
-    """Represents an event with type, data, and timestamp."""
+    """Represents an event with type, data, and timestamp.
+
+    Slotted so that large event histories don't carry a ``__dict__`` per event.
+    """
 
     event_type: str
     data: Dict[str, Any]
@@ -450,13 +523,87 @@ class Event:
     source: str
 
 
+BatchCallback = Callable[[List[Event]], None]
+Publisher = Callable[..., None]
+
+# Events emitted within this many seconds of each other share one timestamp
+_CLOCK_QUANTUM = 0.001
+_last_now: Tuple[float, datetime] = (float("-inf"), datetime.min)
+
+
+def _coarse_now() -> datetime:
+    """Get the current time, reusing the last reading within one clock quantum.
+
+    Returns:
+        The current wall-clock time, accurate to ``_CLOCK_QUANTUM`` seconds
+    """
+    global _last_now
+    tick = perf_counter()
+    if tick - _last_now[0] < _CLOCK_QUANTUM:
+        return _last_now[1]
+    now = datetime.now()
+    _last_now = (tick, now)
+    return now
+
+
+def _dispatch(
+    callbacks: Sequence[Callable[[Any], None]], payload: Any, error_label: str
+) -> None:
+    """Call every callback with the payload, reporting errors without stopping.
+
+    A single ``try`` block covers the whole loop. When a callback raises, the
+    error is reported and dispatch resumes with the next callback, so the
+    common no-error path never re-enters exception handling.
+
+    Args:
+        callbacks: Callbacks to invoke, in order
+        payload: Argument passed to each callback
+        error_label: Prefix used when reporting a failing callback
+    """
+    start = 0
+    count = len(callbacks)
+    while start < count:
+        index = start
+        try:
+            for index in range(start, count):
+                callbacks[index](payload)
+            return
+        except Exception as e:
+            emit(f"{error_label}: {e}")
+            start = index + 1
+
+
 class EventManager:
-    """Event manager that supports multiple event types and listeners."""
+    """Event manager that supports multiple event types and listeners.
 
-    def __init__(self):
-        """Initialize the event manager."""
-        self._listeners: Dict[str, List[Callable[[Event], None]]] = {}
+    The class is slotted and fully annotated so attribute access in the
+    dispatch path goes through fixed slots, and the module can be compiled
+    with mypyc without changes.
+    """
+
+    __slots__ = (
+        "_listeners",
+        "_batch_listeners",
+        "_event_history",
+        "_record_history",
+        "_version",
+    )
+
+    def __init__(self, record_history: bool = True):
+        """Initialize the event manager.
+
+        Args:
+            record_history: Whether emitted events are kept for
+                ``get_event_history``
+        """
+        # Listener tuples are replaced, never mutated, on (un)subscription so a
+        # dispatch in progress keeps iterating the snapshot it started with
+        self._listeners: Dict[str, Tuple[Callable[[Event], None], ...]] = {}
+        self._batch_listeners: Dict[str, Tuple[BatchCallback, ...]] = {}
         self._event_history: List[Event] = []
+        self._record_history = record_history
+        # Bumped on every (un)subscription so publishers can refresh snapshots
+        self._version = 0
 
     def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
         """Subscribe to events of a specific type.
@@ -465,9 +612,9 @@ class EventManager:
             event_type: Type of events to subscribe to
             callback: Function to call when event occurs
         """
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-        self._listeners[event_type].append(callback)
+        callbacks = self._listeners.get(event_type, ())
+        self._listeners[event_type] = callbacks + (callback,)
+        self._version += 1
 
     def unsubscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
         """Unsubscribe from events of a specific type.
@@ -476,34 +623,169 @@ class EventManager:
             event_type: Type of events to unsubscribe from
             callback: Function to remove from listeners
         """
-        if event_type in self._listeners:
-            try:
-                self._listeners[event_type].remove(callback)
-            except ValueError:
-                pass  # Callback not in list
+        callbacks = self._listeners.get(event_type)
+        if callbacks is not None and callback in callbacks:
+            index = callbacks.index(callback)
+            self._listeners[event_type] = callbacks[:index] + callbacks[index + 1 :]
+            self._version += 1
+
+    def subscribe_batch(self, event_type: str, callback: BatchCallback) -> None:
+        """Subscribe to batches of events of a specific type.
+
+        Batch callbacks are invoked once per ``emit_many`` call with the full
+        list of events, instead of once per event.
+
+        Args:
+            event_type: Type of events to subscribe to
+            callback: Function to call with the list of emitted events
+        """
+        callbacks = self._batch_listeners.get(event_type, ())
+        self._batch_listeners[event_type] = callbacks + (callback,)
+        self._version += 1
+
+    def unsubscribe_batch(self, event_type: str, callback: BatchCallback) -> None:
+        """Unsubscribe a batch callback from events of a specific type.
+
+        Args:
+            event_type: Type of events to unsubscribe from
+            callback: Batch function to remove from listeners
+        """
+        callbacks = self._batch_listeners.get(event_type)
+        if callbacks is not None and callback in callbacks:
+            index = callbacks.index(callback)
+            self._batch_listeners[event_type] = (
+                callbacks[:index] + callbacks[index + 1 :]
+            )
+            self._version += 1
 
     def emit(
         self, event_type: str, data: Dict[str, Any], source: str = "unknown"
     ) -> None:
         """Emit an event to all subscribed listeners.
 
+        Nothing is allocated when the event has no listeners and history
+        recording is disabled.
+
+        Args:
+            event_type: Type of event to emit
+            data: Event data
+            source: Source of the event
+        """
+        self._publish(
+            event_type,
+            data,
+            source,
+            self._listeners.get(event_type),
+            self._batch_listeners.get(event_type),
+        )
+
+    def get_publisher(self, event_type: str) -> Publisher:
+        """Get a fast publishing function bound to one event type.
+
+        The publisher keeps a tuple snapshot of the type's listeners and only
+        rebuilds it after a subscription change, so repeated publishing skips
+        the listener lookups done by ``emit``.
+
+        Args:
+            event_type: Type of events the publisher emits
+
+        Returns:
+            Function taking ``(data, source="unknown")`` that emits the event
+        """
+        version = -1
+        listeners: Tuple[Callable[[Event], None], ...] = ()
+        batch_listeners: Tuple[BatchCallback, ...] = ()
+
+        def publish(data: Dict[str, Any], source: str = "unknown") -> None:
+            nonlocal version, listeners, batch_listeners
+            if version != self._version:
+                listeners = self._listeners.get(event_type, ())
+                batch_listeners = self._batch_listeners.get(event_type, ())
+                version = self._version
+            self._publish(event_type, data, source, listeners, batch_listeners)
+
+        return publish
+
+    def _publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        source: str,
+        listeners: Optional[Sequence[Callable[[Event], None]]],
+        batch_listeners: Optional[Sequence[BatchCallback]],
+    ) -> None:
+        """Record an event and dispatch it to the given listeners.
+
         Args:
             event_type: Type of event to emit
             data: Event data
             source: Source of the event
+            listeners: Per-event callbacks for this type, if any
+            batch_listeners: Batch callbacks for this type, if any
         """
+        if not listeners and not batch_listeners and not self._record_history:
+            return
+
         event = Event(
-            event_type=event_type, data=data, timestamp=datetime.now(), source=source
+            event_type=event_type, data=data, timestamp=_coarse_now(), source=source
         )
 
-        self._event_history.append(event)
+        if self._record_history:
+            self._event_history.append(event)
 
-        if event_type in self._listeners:
-            for callback in self._listeners[event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Error in event callback: {e}")
+        if not listeners and not batch_listeners:
+            return
+
+        with batched_output():
+            if listeners:
+                _dispatch(listeners, event, "Error in event callback")
+
+            if batch_listeners:
+                _dispatch(batch_listeners, [event], "Error in batch event callback")
+
+    def emit_many(
+        self,
+        event_type: str,
+        data_list: List[Dict[str, Any]],
+        source: str = "unknown",
+    ) -> None:
+        """Emit several events of the same type in a single dispatch.
+
+        All events share one timestamp. Regular subscribers are called per
+        event first, then batch subscribers receive the whole list in one call,
+        the same order ``emit`` uses.
+
+        Args:
+            event_type: Type of events to emit
+            data_list: Data for each event, in emission order
+            source: Source of the events
+        """
+        listeners = self._listeners.get(event_type)
+        batch_listeners = self._batch_listeners.get(event_type)
+        if not data_list or (
+            not listeners and not batch_listeners and not self._record_history
+        ):
+            return
+
+        now = _coarse_now()
+        events = [
+            Event(event_type=event_type, data=data, timestamp=now, source=source)
+            for data in data_list
+        ]
+
+        if self._record_history:
+            self._event_history.extend(events)
+
+        if not listeners and not batch_listeners:
+            return
+
+        with batched_output():
+            if listeners:
+                for event in events:
+                    _dispatch(listeners, event, "Error in event callback")
+
+            if batch_listeners:
+                _dispatch(batch_listeners, events, "Error in batch event callback")
 
     def get_event_history(self, event_type: Optional[str] = None) -> List[Event]:
         """Get the history of events.
@@ -537,6 +819,8 @@ class UserService:
         """
         self.event_manager = event_manager
         self.users: Dict[int, Dict[str, Any]] = {}
+        self._publish_registered = event_manager.get_publisher("user_registered")
+        self._publish_email_updated = event_manager.get_publisher("user_email_updated")
 
     def register_user(self, user_id: int, name: str, email: str) -> None:
         """Register a new user and emit an event.
@@ -549,7 +833,7 @@ class UserService:
         user_data = {"user_id": user_id, "name": name, "email": email}
         self.users[user_id] = user_data
 
-        self.event_manager.emit("user_registered", user_data, "user_service")
+        self._publish_registered(user_data, "user_service")
 
     def update_user_email(self, user_id: int, new_email: str) -> None:
         """Update a user's email and emit an event.
@@ -562,8 +846,7 @@ class UserService:
             old_email = self.users[user_id]["email"]
             self.users[user_id]["email"] = new_email
 
-            self.event_manager.emit(
-                "user_email_updated",
+            self._publish_email_updated(
                 {"user_id": user_id, "old_email": old_email, "new_email": new_email},
                 "user_service",
             )
@@ -595,9 +878,7 @@ class EmailService:
             event: User registration event
         """
         user_data = event.data
-        print(
-            f"📧 Sending welcome email to {user_data['name']} at {user_data['email']}"
-        )
+        emit(f"📧 Sending welcome email to {user_data['name']} at {user_data['email']}")
 
     def _send_email_confirmation(self, event: Event) -> None:
         """Send email confirmation when email is updated.
@@ -606,7 +887,7 @@ class EmailService:
             event: Email update event
         """
         data = event.data
-        print(
+        emit(
             f"📧 Sending confirmation email to {data['new_email']} for user {data['user_id']}"
         )
 
@@ -638,7 +919,7 @@ class AuditService:
         user_data = event.data
         log_entry = f"User {user_data['user_id']} ({user_data['name']}) registered at {event.timestamp}"
         self.audit_log.append(log_entry)
-        print(f"📋 AUDIT: {log_entry}")
+        emit(f"📋 AUDIT: {log_entry}")
 
     def _log_email_update(self, event: Event) -> None:
         """Log email update events.
@@ -649,7 +930,7 @@ class AuditService:
         data = event.data
         log_entry = f"User {data['user_id']} changed email from {data['old_email']} to {data['new_email']} at {event.timestamp}"
         self.audit_log.append(log_entry)
-        print(f"📋 AUDIT: {log_entry}")
+        emit(f"📋 AUDIT: {log_entry}")
 
 
 # Example usage functions
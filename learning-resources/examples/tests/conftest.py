@@ -73,6 +73,17 @@ def sample_products():
     }
 
 
+@pytest.fixture(scope="session")
+def default_notifiers():
+    """Default-configured notifiers shared across the test session."""
+    from implementations.patterns.factory import NotificationFactory
+
+    return {
+        notification_type: NotificationFactory.create_notifier(notification_type)
+        for notification_type in ("email", "sms", "push")
+    }
+
+
 # ===============================================================================
 # Observer Pattern Fixtures
 # ===============================================================================
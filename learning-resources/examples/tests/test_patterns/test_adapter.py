@@ -1,5 +1,9 @@
 """Tests for adapter pattern implementations."""
 
+import logging
+import subprocess
+import sys
+from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import Mock, call, patch
 
@@ -23,12 +27,33 @@ from implementations.patterns.adapter import (  # Target Interface; Adaptee Clas
     PostgreSQLAdapter,
     PostgreSQLConnection,
     Rectangle,
+    SqlAdapter,
     StripeAdapter,
     StripeGateway,
     VlcPlayer,
+    logger,
 )
 
 
+class _StdoutHandler(logging.Handler):
+    """Log handler that writes each message to the current ``sys.stdout``."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        sys.stdout.write(self.format(record) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def adapter_output():
+    """Print adapter log messages to stdout so tests can read them with capsys."""
+    handler = _StdoutHandler()
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield
+    logger.removeHandler(handler)
+    logger.setLevel(previous_level)
+
+
 class TestAdapteeClasses:
     """Test adaptee classes (Mp3Player, Mp4Player, VlcPlayer)."""
 
@@ -110,6 +135,32 @@ class TestMediaAdapter:
         assert adapter.audio_type == "avi"
         assert adapter.player is None
 
+    def test_adapter_resolves_play_method_once(self):
+        """Test that the player's play method is bound at construction."""
+        adapter = MediaAdapter("vlc")
+        unsupported = MediaAdapter("avi")
+
+        assert adapter._play == adapter.player.play_vlc
+        assert unsupported._play is None
+
+    def test_adapter_play_does_not_probe_player(self, capsys):
+        """Test that play() calls the bound method without attribute lookups."""
+        adapter = MediaAdapter("mp4")
+
+        with patch.object(Mp4Player, "play_mp4") as patched:
+            adapter.play("mp4", "video.mp4")
+
+        patched.assert_not_called()
+        assert "Playing MP4 file: video.mp4" in capsys.readouterr().out
+
+    def test_adapters_share_player_instances(self):
+        """Test that adapters of one type share a single stateless player."""
+        first = MediaAdapter("mp3")
+        second = MediaAdapter("mp3")
+
+        assert first.player is second.player
+        assert first.player is not MediaAdapter("mp4").player
+
     def test_adapter_implements_media_player(self):
         """Test that adapter implements MediaPlayer interface."""
         adapter = MediaAdapter("mp3")
@@ -254,6 +305,20 @@ class TestAudioPlayer:
         assert "Playing MP4 file: video1.mp4" in captured.out
         assert "Playing MP4 file: video2.mp4" in captured.out
 
+    def test_audio_players_share_only_players(self):
+        """Test that audio players get their own adapters around shared players."""
+        first = AudioPlayer()
+        second = AudioPlayer()
+
+        first.play("vlc", "movie.vlc")
+        second.play("vlc", "clip.vlc")
+
+        assert first.adapters["vlc"] is not second.adapters["vlc"]
+        assert first.adapters["vlc"].player is second.adapters["vlc"].player
+
+        first.adapters["vlc"].audio_type = "mp4"
+        assert second.adapters["vlc"].audio_type == "vlc"
+
     def test_audio_player_multiple_formats(self, capsys):
         """Test playing multiple formats."""
         player = AudioPlayer()
@@ -468,6 +533,29 @@ class TestDatabaseAdapters:
         captured = capsys.readouterr()
         assert "Disconnecting from PostgreSQL database" in captured.out
 
+    def test_sql_adapter_with_custom_method_names(self):
+        """Test adapting any connection by naming its methods."""
+        conn = Mock()
+        conn.run.return_value = [{"id": 7}]
+        adapter = SqlAdapter(conn, ("open", "run", "shutdown"))
+
+        adapter.connect()
+        results = adapter.query("SELECT 7")
+        adapter.close()
+
+        assert isinstance(adapter, DatabaseConnection)
+        assert results == [{"id": 7}]
+        conn.open.assert_called_once_with()
+        conn.run.assert_called_once_with("SELECT 7")
+        conn.shutdown.assert_called_once_with()
+
+    def test_sql_adapter_missing_method(self):
+        """Test that an unknown method name fails at construction."""
+        conn = MySQLConnection("localhost", "user", "password", "mydb")
+
+        with pytest.raises(AttributeError):
+            SqlAdapter(conn, ("pg_connect", "pg_execute", "pg_disconnect"))
+
 
 class TestPaymentAdapters:
     """Test payment adapter implementations."""
@@ -557,6 +645,25 @@ class TestPaymentAdapters:
         captured = capsys.readouterr()
         assert "Processing Stripe payment of $99.99 with token tok_3456" in captured.out
 
+    def test_stripe_adapter_rounds_to_nearest_cent(self):
+        """Test that amounts are rounded, not truncated, to cents."""
+        gateway = Mock()
+        gateway.charge_card.return_value = {"status": "succeeded"}
+        adapter = StripeAdapter(gateway)
+
+        adapter.process_payment(0.29, "4111111111111111")
+        adapter.process_payment(0.29, "5500000000001111")
+
+        first, second = gateway.charge_card.call_args_list
+        assert first == call(29, "tok_1111")
+        assert first.args[1] is second.args[1]  # Token reused from the cache
+
+    def test_stripe_token_cache_is_bounded(self):
+        """Test that the token cache cannot grow without limit."""
+        from implementations.patterns.adapter import _stripe_token
+
+        assert _stripe_token.cache_info().maxsize == 4096
+
     def test_stripe_adapter_token_generation(self):
         """Test Stripe adapter token generation."""
         gateway = StripeGateway()
@@ -655,6 +762,23 @@ class TestRectangleAdapter:
         captured = capsys.readouterr()
         assert "Drawing legacy rectangle from (10, 20) to (110, 70)" in captured.out
 
+    def test_legacy_rectangle_adapter_draw_many(self, capsys):
+        """Test drawing the adapted rectangle at several positions."""
+        legacy_rect = LegacyRectangle(0, 0, 100, 50)
+        adapter = LegacyRectangleAdapter(legacy_rect)
+
+        adapter.draw_many([(10, 20), (0, 0)])
+
+        # Coordinates reflect the last position drawn
+        assert (legacy_rect.x1, legacy_rect.y1) == (0, 0)
+        assert (legacy_rect.x2, legacy_rect.y2) == (100, 50)
+
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == [
+            "Drawing legacy rectangle from (10, 20) to (110, 70)",
+            "Drawing legacy rectangle from (0, 0) to (100, 50)",
+        ]
+
     def test_legacy_rectangle_adapter_negative_dimensions(self):
         """Test legacy rectangle adapter with negative dimensions."""
         legacy_rect = LegacyRectangle(110, 70, 10, 20)  # Reversed coordinates
@@ -925,6 +1049,14 @@ class TestAdapterPatternIntegration:
 class TestAdapterPatternEdgeCases:
     """Test edge cases and error conditions."""
 
+    @pytest.mark.parametrize(
+        "target", [MediaPlayer, DatabaseConnection, PaymentProcessor]
+    )
+    def test_target_interfaces_are_abstract(self, target):
+        """Test that target interfaces cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            target()
+
     def test_adapter_with_null_adaptee(self):
         """Test adapter with null adaptee."""
         # Create adapter with unsupported type
@@ -1015,6 +1147,60 @@ class TestAdapterPatternEdgeCases:
         assert "Playing MP3 file: song.mp3" in captured.out
         assert "Media format MP3 not supported" in captured.out
 
+    def test_output_silenced_above_info(self, capsys):
+        """Test that raising the adapter log level suppresses output."""
+        logger.setLevel(logging.WARNING)
+        Mp3Player().play_mp3("quiet.mp3")
+        StripeAdapter(StripeGateway()).process_payment(1.0, "4242")
+
+        assert capsys.readouterr().out == ""
+
+    def test_output_propagates_to_root_logger(self):
+        """Test that adapter messages reach handlers on the root logger."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            Mp3Player().play_mp3("logged.mp3")
+        finally:
+            root.removeHandler(handler)
+
+        assert [r.getMessage() for r in records] == ["Playing MP3 file: logged.mp3"]
+
+    @pytest.mark.parametrize(
+        "setup, expected",
+        [
+            ("", ""),
+            (
+                "logging.basicConfig(level=logging.INFO, format='%(message)s', "
+                "stream=sys.stdout)\n",
+                "Playing MP3 file: once.mp3\n",
+            ),
+        ],
+        ids=["unconfigured", "configured"],
+    )
+    def test_output_follows_application_logging(self, setup, expected):
+        """Test the module adds no output of its own, even after a reload."""
+        script = (
+            "import importlib, logging, sys\n"
+            + setup
+            + "import implementations.patterns.adapter as adapter\n"
+            "importlib.reload(adapter)\n"
+            "adapter.Mp3Player().play_mp3('once.mp3')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+
+        assert result.stdout == expected
+        assert result.stderr == ""
+
 
 class TestAdapterPatternPerformance:
     """Test performance characteristics of adapter pattern."""
@@ -1098,3 +1284,25 @@ class TestAdapterPatternPerformance:
         assert adaptation_time < 0.5  # Should be efficient
         assert len(adapted_rectangles) == 1000
         assert all(isinstance(r, Rectangle) for r in adapted_rectangles)
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Mp3Player(),
+            MediaAdapter("mp4"),
+            AudioPlayer(),
+            MySQLConnection("localhost", "user", "password", "mydb"),
+            MySQLAdapter(MySQLConnection("localhost", "user", "password", "mydb")),
+            PostgreSQLAdapter(
+                PostgreSQLConnection("localhost", "user", "password", "mydb")
+            ),
+            PayPalAdapter(PayPalGateway(), "customer@example.com"),
+            StripeAdapter(StripeGateway()),
+            LegacyRectangleAdapter(LegacyRectangle(0, 0, 10, 5)),
+            PaymentService(),
+        ],
+        ids=lambda instance: type(instance).__name__,
+    )
+    def test_adapters_have_no_instance_dict(self, instance):
+        """Test that adapters and adaptees use slots instead of a __dict__."""
+        assert not hasattr(instance, "__dict__")
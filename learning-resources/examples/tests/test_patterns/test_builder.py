@@ -1,5 +1,6 @@
 """Tests for builder pattern implementations."""
 
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -73,6 +74,9 @@ class TestProductClasses:
         assert "Computer: Intel i7, 16GB, 512GB SSD" in str_repr
         assert "NVIDIA GTX 1080" in str_repr
         assert "Windows 11" in str_repr
+        assert str_repr == (
+            "Computer: Intel i7, 16GB, 512GB SSD, NVIDIA GTX 1080, Windows 11"
+        )
 
     def test_computer_string_minimal(self):
         """Test computer string representation with minimal specs."""
@@ -202,6 +206,10 @@ class TestProductClasses:
         assert "extra cheese" in str_repr
         assert "(gluten-free)" in str_repr
         assert "(spicy)" in str_repr
+        assert str_repr == (
+            "Large thin crust pizza with tomato sauce and mozzarella, "
+            "topped with pepperoni, mushrooms, extra cheese (gluten-free) (spicy)"
+        )
 
     def test_pizza_string_minimal(self):
         """Test pizza string representation with minimal options."""
@@ -213,6 +221,16 @@ class TestProductClasses:
         expected = "Medium regular crust pizza with tomato sauce and mozzarella"
         assert str_repr == expected
 
+    @pytest.mark.parametrize("product_class", [Computer, House, Pizza])
+    def test_products_have_no_instance_dict(self, product_class):
+        """Test that products use slots instead of a __dict__."""
+        assert not hasattr(product_class(), "__dict__")
+
+    def test_default_lists_not_shared(self):
+        """Test that each product gets its own default list."""
+        assert House().rooms is not House().rooms
+        assert Pizza().toppings is not Pizza().toppings
+
 
 class TestComputerBuilder:
     """Test computer builder implementation."""
@@ -427,6 +445,22 @@ class TestComputerBuilder:
         assert computer2.memory == "16GB"
         assert computer1 is not computer2
 
+    def test_configure(self):
+        """Test setting several fields in one call."""
+        builder = ComputerBuilder()
+
+        result = builder.configure(cpu="Intel i9", memory="64GB", wifi=True)
+
+        assert result is builder
+        assert builder.build() == Computer(cpu="Intel i9", memory="64GB", wifi=True)
+
+    def test_configure_unknown_field(self):
+        """Test configure rejects names that are not Computer fields."""
+        builder = ComputerBuilder()
+
+        with pytest.raises(AttributeError):
+            builder.configure(gpu="RTX 4090")
+
 
 class TestHouseBuilder:
     """Test house builder implementation."""
@@ -558,6 +592,17 @@ class TestHouseBuilder:
         assert "Kitchen" in house.rooms
         assert "Bedroom" in house.rooms
 
+    def test_set_rooms_replaces_with_copy(self):
+        """Test set_rooms replaces existing rooms with a copy of the input."""
+        builder = HouseBuilder()
+        rooms = ["Kitchen", "Study"]
+
+        result = builder.add_room("Attic").set_rooms(rooms)
+
+        assert result is builder
+        assert builder._house.rooms == ["Kitchen", "Study"]
+        assert builder._house.rooms is not rooms
+
     def test_build(self):
         """Test building house."""
         builder = HouseBuilder()
@@ -587,6 +632,14 @@ class TestHouseBuilder:
         assert house.floors == 2
         assert len(house.rooms) == 2
 
+    def test_configure(self):
+        """Test setting several fields in one call."""
+        builder = HouseBuilder()
+
+        house = builder.configure(floors=2, garage=True, rooms=["Kitchen"]).build()
+
+        assert house == House(floors=2, garage=True, rooms=["Kitchen"])
+
 
 class TestPizzaBuilder:
     """Test pizza builder implementation."""
@@ -685,6 +738,16 @@ class TestPizzaBuilder:
         assert "sausage" in builder._pizza.toppings
         assert "mushrooms" in builder._pizza.toppings
 
+    def test_set_toppings_replaces_with_copy(self):
+        """Test set_toppings replaces existing toppings with a copy."""
+        builder = PizzaBuilder()
+        toppings = ("ham", "pineapple")
+
+        result = builder.add_topping("olives").set_toppings(toppings)
+
+        assert result is builder
+        assert builder._pizza.toppings == ["ham", "pineapple"]
+
     def test_add_extra_cheese(self):
         """Test adding extra cheese."""
         builder = PizzaBuilder()
@@ -738,6 +801,32 @@ class TestPizzaBuilder:
         assert pizza.gluten_free is True
         assert pizza.spicy is True
 
+    def test_build_many(self):
+        """Test building several pizzas from specs in one call."""
+        toppings = ["ham", "pineapple"]
+        specs = [
+            {"size": "small", "crust": "thin"},
+            {"size": "large", "toppings": toppings, "spicy": True},
+            {},
+        ]
+
+        pizzas = PizzaBuilder.build_many(specs)
+
+        assert [p.size for p in pizzas] == ["small", "large", "medium"]
+        assert pizzas[0].crust == "thin"
+        assert pizzas[1].toppings == toppings
+        assert pizzas[1].toppings is not toppings
+        assert pizzas[1].spicy is True
+        assert pizzas[2] == Pizza()
+
+    def test_configure(self):
+        """Test setting several fields in one call."""
+        builder = PizzaBuilder()
+
+        pizza = builder.configure(size="large", spicy=True).add_topping("ham").build()
+
+        assert pizza == Pizza(size="large", spicy=True, toppings=["ham"])
+
 
 class TestSQLQueryBuilder:
     """Test SQL query builder implementation."""
@@ -746,8 +835,9 @@ class TestSQLQueryBuilder:
         """Test creating SQL query builder."""
         builder = SQLQueryBuilder()
 
-        assert builder._query_parts is not None
-        assert isinstance(builder._query_parts, dict)
+        assert builder._select == []
+        assert builder._limit is None
+        assert not hasattr(builder, "__dict__")
 
     def test_builder_reset(self):
         """Test resetting builder."""
@@ -760,8 +850,22 @@ class TestSQLQueryBuilder:
         result = builder.reset()
 
         assert result is builder
-        assert builder._query_parts["select"] == []
-        assert builder._query_parts["from"] == ""
+        assert builder._select == []
+        assert builder._from == ""
+
+    def test_reset_clears_lists_in_place(self):
+        """Test reset reuses the clause lists and forgets the cached query."""
+        builder = SQLQueryBuilder()
+        where = builder._where
+        builder.select("id").from_table("users").where("active = 1").build()
+
+        builder.reset()
+
+        assert builder._where is where
+        assert where == []
+        assert builder.select("id").from_table("orders").build() == (
+            "SELECT id FROM orders"
+        )
 
     def test_select_single_column(self):
         """Test selecting single column."""
@@ -770,7 +874,7 @@ class TestSQLQueryBuilder:
         result = builder.select("name")
 
         assert result is builder
-        assert "name" in builder._query_parts["select"]
+        assert "name" in builder._select
 
     def test_select_multiple_columns(self):
         """Test selecting multiple columns."""
@@ -779,10 +883,10 @@ class TestSQLQueryBuilder:
         result = builder.select("name", "email", "age")
 
         assert result is builder
-        assert len(builder._query_parts["select"]) == 3
-        assert "name" in builder._query_parts["select"]
-        assert "email" in builder._query_parts["select"]
-        assert "age" in builder._query_parts["select"]
+        assert len(builder._select) == 3
+        assert "name" in builder._select
+        assert "email" in builder._select
+        assert "age" in builder._select
 
     def test_from_table(self):
         """Test setting FROM table."""
@@ -791,7 +895,7 @@ class TestSQLQueryBuilder:
         result = builder.from_table("users")
 
         assert result is builder
-        assert builder._query_parts["from"] == "users"
+        assert builder._from == "users"
 
     def test_join(self):
         """Test adding JOIN clause."""
@@ -800,10 +904,7 @@ class TestSQLQueryBuilder:
         result = builder.join("orders", "users.id = orders.user_id")
 
         assert result is builder
-        assert (
-            "INNER JOIN orders ON users.id = orders.user_id"
-            in builder._query_parts["joins"]
-        )
+        assert "INNER JOIN orders ON users.id = orders.user_id" in builder._joins
 
     def test_join_with_type(self):
         """Test adding JOIN with specific type."""
@@ -812,10 +913,20 @@ class TestSQLQueryBuilder:
         result = builder.join("orders", "users.id = orders.user_id", "LEFT")
 
         assert result is builder
-        assert (
-            "LEFT JOIN orders ON users.id = orders.user_id"
-            in builder._query_parts["joins"]
-        )
+        assert "LEFT JOIN orders ON users.id = orders.user_id" in builder._joins
+
+    @pytest.mark.parametrize(
+        "join_type", ["left", "LEFT OUTER", "full outer", "NATURAL"]
+    )
+    def test_join_type_passed_through(self, join_type):
+        """Test the join type is used exactly as given."""
+        builder = SQLQueryBuilder()
+
+        builder.join("orders", "users.id = orders.user_id", join_type)
+
+        assert builder._joins == [
+            f"{join_type} JOIN orders ON users.id = orders.user_id"
+        ]
 
     def test_where_single_condition(self):
         """Test adding WHERE condition."""
@@ -824,7 +935,7 @@ class TestSQLQueryBuilder:
         result = builder.where("active = 1")
 
         assert result is builder
-        assert "active = 1" in builder._query_parts["where"]
+        assert "active = 1" in builder._where
 
     def test_where_multiple_conditions(self):
         """Test adding multiple WHERE conditions."""
@@ -841,8 +952,8 @@ class TestSQLQueryBuilder:
         result = builder.group_by("department", "role")
 
         assert result is builder
-        assert "department" in builder._query_parts["group_by"]
-        assert "role" in builder._query_parts["group_by"]
+        assert "department" in builder._group_by
+        assert "role" in builder._group_by
 
     def test_having(self):
         """Test HAVING clause."""
@@ -851,7 +962,7 @@ class TestSQLQueryBuilder:
         result = builder.having("COUNT(*) > 1")
 
         assert result is builder
-        assert "COUNT(*) > 1" in builder._query_parts["having"]
+        assert "COUNT(*) > 1" in builder._having
 
     def test_order_by_default(self):
         """Test ORDER BY with default direction."""
@@ -860,7 +971,7 @@ class TestSQLQueryBuilder:
         result = builder.order_by("name")
 
         assert result is builder
-        assert "name ASC" in builder._query_parts["order_by"]
+        assert "name ASC" in builder._order_by
 
     def test_order_by_with_direction(self):
         """Test ORDER BY with specific direction."""
@@ -869,7 +980,16 @@ class TestSQLQueryBuilder:
         result = builder.order_by("created_at", "DESC")
 
         assert result is builder
-        assert "created_at DESC" in builder._query_parts["order_by"]
+        assert "created_at DESC" in builder._order_by
+
+    @pytest.mark.parametrize("direction", ["desc", "DESC NULLS LAST"])
+    def test_order_by_direction_passed_through(self, direction):
+        """Test the sort direction is used exactly as given."""
+        builder = SQLQueryBuilder()
+
+        builder.order_by("created_at", direction)
+
+        assert builder._order_by == [f"created_at {direction}"]
 
     def test_limit(self):
         """Test LIMIT clause."""
@@ -878,7 +998,7 @@ class TestSQLQueryBuilder:
         result = builder.limit(10)
 
         assert result is builder
-        assert builder._query_parts["limit"] == 10
+        assert builder._limit == 10
 
     def test_build_simple_query(self):
         """Test building simple query."""
@@ -938,6 +1058,29 @@ class TestSQLQueryBuilder:
 
         assert query == "SELECT *"
 
+    def test_build_full_query_exact(self):
+        """Test the exact text of a query using every clause."""
+        query = (
+            SQLQueryBuilder()
+            .select("u.name", "COUNT(o.id)")
+            .from_table("users u")
+            .join("orders o", "u.id = o.user_id", "LEFT")
+            .where("u.active = 1")
+            .where("o.total > 0")
+            .group_by("u.id", "u.name")
+            .having("COUNT(o.id) > 0")
+            .order_by("u.name")
+            .limit(5)
+            .build()
+        )
+
+        assert query == (
+            "SELECT u.name, COUNT(o.id) FROM users u "
+            "LEFT JOIN orders o ON u.id = o.user_id "
+            "WHERE u.active = 1 AND o.total > 0 GROUP BY u.id, u.name "
+            "HAVING COUNT(o.id) > 0 ORDER BY u.name ASC LIMIT 5"
+        )
+
     def test_multiple_builds(self):
         """Test building multiple queries with same builder."""
         builder = SQLQueryBuilder()
@@ -951,6 +1094,19 @@ class TestSQLQueryBuilder:
         assert query1 == "SELECT name FROM users"
         assert query2 == "SELECT id, email FROM customers"
 
+    def test_build_cached_until_modified(self):
+        """Test that unchanged queries reuse the built text."""
+        builder = SQLQueryBuilder().select("name").from_table("users")
+
+        first = builder.build()
+        assert builder.build() is first
+
+        builder.where("active = 1")
+        assert builder.build() == "SELECT name FROM users WHERE active = 1"
+        builder.limit(5)
+        assert builder.build().endswith("LIMIT 5")
+        assert builder.reset().build() == "SELECT *"
+
 
 class TestComputerDirector:
     """Test computer director implementation."""
@@ -1033,6 +1189,16 @@ class TestComputerDirector:
         assert office.cpu != budget.cpu
         assert gaming.memory != budget.memory
 
+    def test_presets_share_interned_values(self):
+        """Test that values shared between presets are the same objects."""
+        director = ComputerDirector(ComputerBuilder())
+
+        gaming = director.build_gaming_computer()
+        office = director.build_office_computer()
+
+        assert gaming.operating_system is office.operating_system
+        assert office.operating_system is sys.intern("Windows 11 Pro")
+
 
 class TestHouseDirector:
     """Test house director implementation."""
@@ -1364,6 +1530,64 @@ class TestBuilderPatternIntegration:
         assert gaming1.memory == gaming2.memory
         assert gaming1.storage == gaming2.storage
 
+    def test_repeated_presets_are_equal_and_independent(self):
+        """Test that memoized presets return fresh, equal products."""
+        house_director = HouseDirector(HouseBuilder())
+        pizza_director = PizzaDirector(PizzaBuilder())
+
+        first_house = house_director.build_luxury_house()
+        second_house = house_director.build_luxury_house()
+        first_pizza = pizza_director.build_supreme()
+        second_pizza = pizza_director.build_supreme()
+
+        assert second_house == first_house
+        assert second_house is not first_house
+        assert second_house.rooms is not first_house.rooms
+        assert second_pizza == first_pizza
+        assert second_pizza.toppings is not first_pizza.toppings
+
+        # Mutating one product does not leak into later presets
+        second_house.rooms.append("Wine Cellar")
+        first_pizza.toppings.clear()
+        assert "Wine Cellar" not in house_director.build_luxury_house().rooms
+        assert pizza_director.build_supreme().toppings == second_pizza.toppings
+
+    def test_preset_uses_builder_once(self):
+        """Test that a preset runs the builder steps only on first use."""
+        builder = ComputerBuilder()
+        director = ComputerDirector(builder)
+
+        with patch.object(
+            ComputerBuilder, "reset", autospec=True, side_effect=ComputerBuilder.reset
+        ) as reset:
+            director.build_budget_computer()
+            director.build_budget_computer()
+
+        assert reset.call_count == 1
+
+    def test_preset_returns_detached_product_every_call(self):
+        """Test that presets never return the builder's own product."""
+        builder = ComputerBuilder()
+        director = ComputerDirector(builder)
+
+        first = director.build_budget_computer()
+        second = director.build_budget_computer()
+
+        assert first is not builder.build()
+        assert second is not first
+        assert first == second
+
+    def test_preset_rebuilt_after_builder_replaced(self):
+        """Test that replacing the builder makes presets use the new one."""
+        director = ComputerDirector(ComputerBuilder())
+        director.build_budget_computer()
+
+        new_builder = ComputerBuilder()
+        director.builder = new_builder
+        computer = director.build_budget_computer()
+
+        assert new_builder.build().cpu == computer.cpu != ""
+
 
 class TestBuilderPatternEdgeCases:
     """Test edge cases and error conditions."""
@@ -1,5 +1,6 @@
 """Tests for command pattern implementations."""
 
+import threading
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -42,6 +43,22 @@ class TestBasicCommandPattern:
         # Should be instance of Command
         assert isinstance(no_command, Command)
 
+    def test_remote_controls_share_no_command(self):
+        """Test remote controls share one placeholder command."""
+        first, second = RemoteControl(), RemoteControl()
+
+        assert first.undo_command is second.on_commands[0]
+        assert first.off_commands[3] is second.undo_command
+
+    def test_no_command_subclass(self):
+        """Test NoCommand can be subclassed."""
+
+        class LoggingNoCommand(NoCommand):
+            pass
+
+        NoCommand()
+        assert type(LoggingNoCommand()) is LoggingNoCommand
+
 
 class TestReceiverClasses:
     """Test receiver classes (Light, Fan, Stereo)."""
@@ -102,6 +119,19 @@ class TestReceiverClasses:
         captured = capsys.readouterr()
         assert "Living Room fan is on MEDIUM speed" in captured.out
 
+    @pytest.mark.parametrize(
+        "speed, expected",
+        [(1.0, "LOW"), (2.0, "MEDIUM"), (1.5, "HIGH"), (-0.5, "OFF"), (7.5, "HIGH")],
+    )
+    def test_fan_set_speed_non_integer(self, capsys, speed, expected):
+        """Test non-integer speeds are reported like their integer matches."""
+        fan = Fan("Attic")
+
+        fan.set_speed(speed)
+
+        assert expected in capsys.readouterr().out
+        assert fan.speed == max(0, min(3, speed))
+
     def test_fan_speed_bounds(self):
         """Test fan speed bounds."""
         fan = Fan("Office")
@@ -372,6 +402,37 @@ class TestConcreteCommands:
         assert light.is_on is False
         assert fan.speed == 0
 
+    def test_macro_command_writes_output_once(self, capsys):
+        """Test macro command buffers receiver output until it finishes."""
+        seen = []
+        probe = Mock(spec=Command)
+        probe.execute.side_effect = lambda: seen.append(capsys.readouterr().out)
+
+        macro = MacroCommand(
+            [LightOnCommand(Light("Kitchen")), probe, LightOnCommand(Light("Hall"))]
+        )
+        macro.execute()
+
+        assert seen == [""]
+        assert capsys.readouterr().out == "Kitchen light is ON\nHall light is ON\n"
+
+    def test_macro_output_buffer_is_per_thread(self, capsys):
+        """Test a running macro does not hold another thread's receiver output."""
+        seen = []
+
+        def turn_on_elsewhere():
+            worker = threading.Thread(target=Light("Garage").turn_on)
+            worker.start()
+            worker.join()
+            seen.append(capsys.readouterr().out)
+
+        probe = Mock(spec=Command)
+        probe.execute.side_effect = turn_on_elsewhere
+        MacroCommand([LightOnCommand(Light("Kitchen")), probe]).execute()
+
+        assert seen == ["Garage light is ON\n"]
+        assert capsys.readouterr().out == "Kitchen light is ON\n"
+
     def test_command_interface_compliance(self):
         """Test that all commands implement the Command interface."""
         light = Light("Test")
@@ -413,6 +474,19 @@ class TestRemoteControl:
             assert isinstance(remote.on_commands[i], NoCommand)
             assert isinstance(remote.off_commands[i], NoCommand)
 
+    def test_empty_slot_replaces_undo_command(self):
+        """Test pressing an empty slot makes the next undo a no-op."""
+        remote = RemoteControl()
+        light = Light("Living Room")
+        remote.set_command(0, LightOnCommand(light), LightOffCommand(light))
+
+        remote.on_button_pressed(0)
+        remote.on_button_pressed(1)
+        remote.undo_button_pressed()
+
+        assert isinstance(remote.undo_command, NoCommand)
+        assert light.is_on is True
+
     def test_remote_control_custom_slots(self):
         """Test creating remote control with custom number of slots."""
         remote = RemoteControl(5)
@@ -618,6 +692,21 @@ class TestCommandQueue:
         assert queue.size() == 0
         assert len(queue.commands) == 0
 
+    def test_execute_all_runs_commands_added_while_draining(self):
+        """Test commands queued by a running command execute in the same call."""
+        queue = CommandQueue()
+        light = Light("Test")
+        follow_up = LightOnCommand(light)
+        first = Mock(spec=Command)
+        first.execute.side_effect = lambda: queue.add_command(follow_up)
+
+        queue.add_command(first)
+        queue.execute_all()
+
+        first.execute.assert_called_once()
+        assert queue.size() == 0
+        assert light.is_on is True
+
     def test_multiple_execute_all(self, capsys):
         """Test multiple execute_all calls."""
         queue = CommandQueue()
@@ -805,6 +894,28 @@ class TestCommandHistory:
         descriptions = [entry.description for entry in history.history]
         assert descriptions == ["Command 2", "Command 3", "Command 4"]
 
+    def test_undo_redo_after_eviction(self):
+        """Test undo/redo stay aligned once old commands are evicted."""
+        history = CommandHistory(2)
+        fan = Fan("Test")
+
+        for speed in (1, 2, 3):
+            history.execute_command(FanSpeedCommand(fan, speed), f"Speed {speed}")
+
+        assert history.undo() is True
+        assert history.undo() is True
+        assert history.undo() is False
+        assert fan.get_speed() == 1
+
+        assert history.redo() is True
+        assert fan.get_speed() == 2
+
+        history.execute_command(FanSpeedCommand(fan, 0), "Off")
+
+        descriptions = [entry.description for entry in history.history]
+        assert descriptions == ["Speed 2", "Off"]
+        assert history.can_redo() is False
+
     def test_get_history(self):
         """Test getting history."""
         history = CommandHistory()
@@ -989,6 +1100,23 @@ class TestTextEditor:
         command.undo()
         assert editor.get_content() == "Hello World"
 
+    def test_delete_text_command_compresses_large_deletions(self):
+        """Test that large deleted text is stored compressed and restored."""
+        editor = TextEditor()
+        document = "Lorem ipsum dolor sit amet. " * 1000 + "ünïcode"
+        editor.set_content(document)
+
+        command = DeleteTextCommand(editor, 0, len(document))
+        command.execute()
+
+        assert editor.get_content() == ""
+        assert command._compressed is not None
+        assert len(command._compressed) < len(document)
+        assert command.deleted_text == document
+
+        command.undo()
+        assert editor.get_content() == document
+
 
 class TestCommandPatternIntegration:
     """Test integration scenarios with command pattern."""
@@ -1175,6 +1303,17 @@ class TestCommandPatternEdgeCases:
         # Light should still be on (first command executed)
         assert light.is_on is True
 
+    def test_macro_command_flushes_output_on_failure(self, capsys):
+        """Test buffered output is still written when a macro command fails."""
+        failing = Mock(spec=Command)
+        failing.execute.side_effect = ValueError("Command failed")
+        macro = MacroCommand([LightOnCommand(Light("Test")), failing])
+
+        with pytest.raises(ValueError):
+            macro.execute()
+
+        assert capsys.readouterr().out == "Test light is ON\n"
+
     def test_command_queue_with_failing_command(self):
         """Test command queue with a failing command."""
         queue = CommandQueue()
@@ -1253,6 +1392,28 @@ class TestCommandPatternEdgeCases:
 class TestCommandPatternPerformance:
     """Test performance characteristics of command pattern."""
 
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            NoCommand,
+            lambda: Light("Test"),
+            lambda: Fan("Test"),
+            lambda: Stereo("Test"),
+            lambda: LightOnCommand(Light("Test")),
+            lambda: LightOffCommand(Light("Test")),
+            lambda: FanSpeedCommand(Fan("Test"), 2),
+            lambda: StereoOnWithVolumeCommand(Stereo("Test")),
+            lambda: StereoOffCommand(Stereo("Test")),
+            lambda: MacroCommand([]),
+            lambda: InsertTextCommand(TextEditor(), "text", 0),
+            lambda: DeleteTextCommand(TextEditor(), 0, 1),
+            lambda: CommandHistoryEntry(NoCommand(), datetime.now()),
+        ],
+    )
+    def test_commands_and_receivers_use_slots(self, factory):
+        """Test that commands, receivers and history entries carry no __dict__."""
+        assert not hasattr(factory(), "__dict__")
+
     def test_large_command_queue_performance(self):
         """Test performance with large command queue."""
         import time
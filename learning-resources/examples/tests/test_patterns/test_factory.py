@@ -1,6 +1,8 @@
 """Tests for factory pattern implementations."""
 
 import math
+import sys
+import time
 from typing import Type
 
 import pytest
@@ -20,7 +22,6 @@ from implementations.patterns.factory import (  # Basic Factory Pattern; Notific
     MacOSCheckbox,
     MacOSFactory,
     NotificationFactory,
-    Notifier,
     Product,
     PushNotifier,
     Rectangle,
@@ -35,6 +36,69 @@ from implementations.patterns.factory import (  # Basic Factory Pattern; Notific
     WindowsFactory,
 )
 
+# Expected measurements of the reference shapes, computed once at import
+CIRCLE_R5_AREA = math.pi * 25
+CIRCLE_R5_PERIMETER = 2 * math.pi * 5
+TRIANGLE_S6_AREA = (math.sqrt(3) / 4) * 36
+SHAPE_SYSTEM_AREA = pytest.approx(CIRCLE_R5_AREA + 12 + TRIANGLE_S6_AREA, rel=1e-9)
+SHAPE_SYSTEM_PERIMETER = pytest.approx(CIRCLE_R5_PERIMETER + 14 + 18, rel=1e-9)
+
+# Keyed factory entry points exercised by the edge-case tests
+FACTORY_ENTRY_POINTS = [
+    NotificationFactory.create_notifier,
+    ShapeFactory.create_shape,
+    UIComponentFactory.create_factory,
+]
+FACTORY_ENTRY_POINT_IDS = ["notification", "shape", "ui"]
+
+# (notification_type, params, expected_class, expected_attrs)
+NOTIFIER_CASES = [
+    (
+        "email",
+        {},
+        EmailNotifier,
+        {"smtp_server": "smtp.gmail.com", "username": "app@company.com"},
+    ),
+    (
+        "email",
+        {
+            "smtp_server": "smtp.outlook.com",
+            "username": "custom@company.com",
+            "password": "custom_pass",
+        },
+        EmailNotifier,
+        {
+            "smtp_server": "smtp.outlook.com",
+            "username": "custom@company.com",
+            "password": "custom_pass",
+        },
+    ),
+    ("sms", {}, SMSNotifier, {"api_key": "default_key", "service": "Twilio"}),
+    (
+        "sms",
+        {"api_key": "custom_key", "service": "Custom Service"},
+        SMSNotifier,
+        {"api_key": "custom_key", "service": "Custom Service"},
+    ),
+    ("push", {}, PushNotifier, {"app_id": "com.company.app", "service": "Firebase"}),
+    (
+        "push",
+        {"app_id": "com.custom.app", "service": "Custom Push Service"},
+        PushNotifier,
+        {"app_id": "com.custom.app", "service": "Custom Push Service"},
+    ),
+]
+
+# (shape_type, params, expected_class, expected_area, expected_perimeter)
+SHAPE_CASES = [
+    ("circle", {"radius": 5}, Circle, CIRCLE_R5_AREA, CIRCLE_R5_PERIMETER),
+    ("circle", {"radius": 1}, Circle, math.pi, 2 * math.pi),
+    ("rectangle", {"width": 4, "height": 3}, Rectangle, 12, 14),
+    ("rectangle", {"width": 1, "height": 1}, Rectangle, 1, 4),
+    ("triangle", {"side": 6}, Triangle, TRIANGLE_S6_AREA, 18),
+    ("triangle", {"side": 1}, Triangle, math.sqrt(3) / 4, 3),
+]
+
 
 class TestBasicFactoryPattern:
     """Test the basic Factory Method pattern."""
@@ -97,6 +161,19 @@ class TestSimpleFactory:
             SimpleFactory.create_product("C")
         assert "Unknown product type: C" in str(exc_info.value)
 
+    @pytest.mark.parametrize("product_type", ["", "AB", "é", None])
+    def test_create_invalid_product_key(self, product_type):
+        """Test that keys outside the one-letter ASCII table are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            SimpleFactory.create_product(product_type)
+        assert f"Unknown product type: {product_type}" in str(exc_info.value)
+
+    @pytest.mark.parametrize("product_type", [b"A", bytearray(b"B")])
+    def test_create_product_rejects_bytes(self, product_type):
+        """Test that a bytes key is not mistaken for the matching string."""
+        with pytest.raises(ValueError):
+            SimpleFactory.create_product(product_type)
+
     def test_get_supported_types(self):
         """Test getting supported product types."""
         supported = SimpleFactory.get_supported_types()
@@ -115,78 +192,36 @@ class TestSimpleFactory:
 class TestNotificationFactory:
     """Test the NotificationFactory implementation."""
 
-    def test_create_email_notifier(self):
-        """Test creating email notifier."""
-        notifier = NotificationFactory.create_notifier("email")
-        assert isinstance(notifier, EmailNotifier)
-        assert notifier.smtp_server == "smtp.gmail.com"
-        assert notifier.username == "app@company.com"
-
-    def test_create_email_notifier_with_params(self):
-        """Test creating email notifier with custom parameters."""
-        notifier = NotificationFactory.create_notifier(
-            "email",
-            smtp_server="smtp.outlook.com",
-            username="custom@company.com",
-            password="custom_pass",
-        )
-        assert isinstance(notifier, EmailNotifier)
-        assert notifier.smtp_server == "smtp.outlook.com"
-        assert notifier.username == "custom@company.com"
-        assert notifier.password == "custom_pass"
-
-    def test_create_sms_notifier(self):
-        """Test creating SMS notifier."""
-        notifier = NotificationFactory.create_notifier("sms")
-        assert isinstance(notifier, SMSNotifier)
-        assert notifier.api_key == "default_key"
-        assert notifier.service == "Twilio"
-
-    def test_create_sms_notifier_with_params(self):
-        """Test creating SMS notifier with custom parameters."""
-        notifier = NotificationFactory.create_notifier(
-            "sms", api_key="custom_key", service="Custom Service"
-        )
-        assert isinstance(notifier, SMSNotifier)
-        assert notifier.api_key == "custom_key"
-        assert notifier.service == "Custom Service"
-
-    def test_create_push_notifier(self):
-        """Test creating push notifier."""
-        notifier = NotificationFactory.create_notifier("push")
-        assert isinstance(notifier, PushNotifier)
-        assert notifier.app_id == "com.company.app"
-        assert notifier.service == "Firebase"
-
-    def test_create_push_notifier_with_params(self):
-        """Test creating push notifier with custom parameters."""
-        notifier = NotificationFactory.create_notifier(
-            "push", app_id="com.custom.app", service="Custom Push Service"
-        )
-        assert isinstance(notifier, PushNotifier)
-        assert notifier.app_id == "com.custom.app"
-        assert notifier.service == "Custom Push Service"
-
-    def test_case_insensitive_creation(self):
+    @pytest.mark.parametrize(
+        "notification_type, params, expected_class, expected_attrs", NOTIFIER_CASES
+    )
+    def test_create_notifier(
+        self, notification_type, params, expected_class, expected_attrs
+    ):
+        """Test creating notifiers with default and custom parameters."""
+        notifier = NotificationFactory.create_notifier(notification_type, **params)
+
+        assert isinstance(notifier, expected_class)
+        for name, value in expected_attrs.items():
+            assert getattr(notifier, name) == value
+
+    @pytest.mark.parametrize(
+        "notification_type, expected_class",
+        [
+            ("EMAIL", EmailNotifier),
+            ("Email", EmailNotifier),
+            ("eMaIl", EmailNotifier),
+            ("SMS", SMSNotifier),
+            ("sms", SMSNotifier),
+            ("PUSH", PushNotifier),
+            ("push", PushNotifier),
+        ],
+    )
+    def test_case_insensitive_creation(self, notification_type, expected_class):
         """Test that factory is case-insensitive."""
-        notifiers = [
-            NotificationFactory.create_notifier("EMAIL"),
-            NotificationFactory.create_notifier("Email"),
-            NotificationFactory.create_notifier("eMaIl"),
-            NotificationFactory.create_notifier("SMS"),
-            NotificationFactory.create_notifier("sms"),
-            NotificationFactory.create_notifier("PUSH"),
-            NotificationFactory.create_notifier("push"),
-        ]
+        notifier = NotificationFactory.create_notifier(notification_type)
 
-        assert all(isinstance(n, Notifier) for n in notifiers)
-        assert isinstance(notifiers[0], EmailNotifier)
-        assert isinstance(notifiers[1], EmailNotifier)
-        assert isinstance(notifiers[2], EmailNotifier)
-        assert isinstance(notifiers[3], SMSNotifier)
-        assert isinstance(notifiers[4], SMSNotifier)
-        assert isinstance(notifiers[5], PushNotifier)
-        assert isinstance(notifiers[6], PushNotifier)
+        assert type(notifier) is expected_class
 
     def test_create_unknown_notifier(self):
         """Test creating unknown notifier raises ValueError."""
@@ -200,11 +235,36 @@ class TestNotificationFactory:
         supported = NotificationFactory.get_supported_types()
         assert supported == ["email", "sms", "push"]
 
-    def test_notifier_send_methods(self, capsys):
+    def test_get_supported_types_returns_copy(self):
+        """Test that mutating the returned list does not affect the factory."""
+        NotificationFactory.get_supported_types().append("fax")
+
+        assert NotificationFactory.get_supported_types() == ["email", "sms", "push"]
+
+    def test_default_notifiers_are_independent(self):
+        """Test that parameterless notifiers are separate instances."""
+        first = NotificationFactory.create_notifier("sms")
+        second = NotificationFactory.create_notifier("SMS")
+
+        first.api_key = "changed_key"
+
+        assert second is not first
+        assert second.api_key == "default_key"
+
+    def test_default_settings_interned(self):
+        """Test that default notifier settings are interned strings."""
+        email = EmailNotifier()
+        push = PushNotifier()
+
+        assert email.smtp_server is sys.intern("smtp.gmail.com")
+        assert email.username is sys.intern("app@company.com")
+        assert push.app_id is sys.intern("com.company.app")
+
+    def test_notifier_send_methods(self, capsys, default_notifiers):
         """Test that all notifiers can send messages."""
-        email = NotificationFactory.create_notifier("email")
-        sms = NotificationFactory.create_notifier("sms")
-        push = NotificationFactory.create_notifier("push")
+        email = default_notifiers["email"]
+        sms = default_notifiers["sms"]
+        push = default_notifiers["push"]
 
         email.send("test@example.com", "Email test")
         sms.send("+1234567890", "SMS test")
@@ -219,50 +279,39 @@ class TestNotificationFactory:
 class TestShapeFactory:
     """Test the ShapeFactory implementation."""
 
-    def test_create_circle(self):
-        """Test creating a circle."""
-        circle = ShapeFactory.create_shape("circle", radius=5)
-        assert isinstance(circle, Circle)
-        assert circle.radius == 5
-        assert circle.area() == pytest.approx(math.pi * 25, rel=1e-9)
-        assert circle.perimeter() == pytest.approx(2 * math.pi * 5, rel=1e-9)
-
-    def test_create_rectangle(self):
-        """Test creating a rectangle."""
-        rectangle = ShapeFactory.create_shape("rectangle", width=4, height=3)
-        assert isinstance(rectangle, Rectangle)
-        assert rectangle.width == 4
-        assert rectangle.height == 3
-        assert rectangle.area() == 12
-        assert rectangle.perimeter() == 14
-
-    def test_create_triangle(self):
-        """Test creating a triangle."""
-        triangle = ShapeFactory.create_shape("triangle", side=6)
-        assert isinstance(triangle, Triangle)
-        assert triangle.side == 6
-        expected_area = (math.sqrt(3) / 4) * 36
-        assert triangle.area() == pytest.approx(expected_area, rel=1e-9)
-        assert triangle.perimeter() == 18
-
-    def test_case_insensitive_creation(self):
+    @pytest.mark.parametrize(
+        "shape_type, params, expected_class, expected_area, expected_perimeter",
+        SHAPE_CASES,
+    )
+    def test_create_shape(
+        self, shape_type, params, expected_class, expected_area, expected_perimeter
+    ):
+        """Test creating shapes and their calculations."""
+        shape = ShapeFactory.create_shape(shape_type, **params)
+
+        assert isinstance(shape, expected_class)
+        for name, value in params.items():
+            assert getattr(shape, name) == value
+        assert shape.area() == pytest.approx(expected_area, rel=1e-9)
+        assert shape.perimeter() == pytest.approx(expected_perimeter, rel=1e-9)
+
+    @pytest.mark.parametrize(
+        "shape_type, params, expected_class",
+        [
+            ("CIRCLE", {"radius": 1}, Circle),
+            ("Circle", {"radius": 1}, Circle),
+            ("RECTANGLE", {"width": 1, "height": 1}, Rectangle),
+            ("Rectangle", {"width": 1, "height": 1}, Rectangle),
+            ("TRIANGLE", {"side": 1}, Triangle),
+            ("Triangle", {"side": 1}, Triangle),
+        ],
+    )
+    def test_case_insensitive_creation(self, shape_type, params, expected_class):
         """Test that shape factory is case-insensitive."""
-        shapes = [
-            ShapeFactory.create_shape("CIRCLE", radius=1),
-            ShapeFactory.create_shape("Circle", radius=1),
-            ShapeFactory.create_shape("RECTANGLE", width=1, height=1),
-            ShapeFactory.create_shape("Rectangle", width=1, height=1),
-            ShapeFactory.create_shape("TRIANGLE", side=1),
-            ShapeFactory.create_shape("Triangle", side=1),
-        ]
+        shape = ShapeFactory.create_shape(shape_type, **params)
 
-        assert all(isinstance(s, Shape) for s in shapes)
-        assert isinstance(shapes[0], Circle)
-        assert isinstance(shapes[1], Circle)
-        assert isinstance(shapes[2], Rectangle)
-        assert isinstance(shapes[3], Rectangle)
-        assert isinstance(shapes[4], Triangle)
-        assert isinstance(shapes[5], Triangle)
+        assert isinstance(shape, Shape)
+        assert isinstance(shape, expected_class)
 
     def test_missing_parameters(self):
         """Test creating shapes with missing parameters."""
@@ -322,29 +371,28 @@ class TestShapeFactory:
         assert "Unknown shape type: hexagon" in str(exc_info.value)
         assert "circle, rectangle, triangle" in str(exc_info.value)
 
+    def test_create_many(self):
+        """Test creating several shapes of one type at once."""
+        shapes = ShapeFactory.create_many("Rectangle", [{"width": 2, "height": 3}] * 3)
+
+        assert len(shapes) == 3
+        assert all(isinstance(s, Rectangle) for s in shapes)
+        assert len({*map(id, shapes)}) == 3
+        assert shapes[0].area() == 6
+
+    def test_create_many_invalid(self):
+        """Test bulk creation validates the type and each parameter set."""
+        with pytest.raises(ValueError, match="Unknown shape type: hexagon"):
+            ShapeFactory.create_many("hexagon", [{"side": 1}])
+        with pytest.raises(ValueError, match="Circle requires 'radius' parameter"):
+            ShapeFactory.create_many("circle", [{"radius": 1}, {}])
+        assert ShapeFactory.create_many("circle", []) == []
+
     def test_get_supported_shapes(self):
         """Test getting supported shape types."""
         supported = ShapeFactory.get_supported_shapes()
         assert supported == ["circle", "rectangle", "triangle"]
 
-    def test_shape_calculations(self):
-        """Test mathematical calculations are correct."""
-        # Test circle with radius 1
-        circle = ShapeFactory.create_shape("circle", radius=1)
-        assert circle.area() == pytest.approx(math.pi, rel=1e-9)
-        assert circle.perimeter() == pytest.approx(2 * math.pi, rel=1e-9)
-
-        # Test unit square
-        square = ShapeFactory.create_shape("rectangle", width=1, height=1)
-        assert square.area() == 1
-        assert square.perimeter() == 4
-
-        # Test equilateral triangle with side 1
-        triangle = ShapeFactory.create_shape("triangle", side=1)
-        expected_area = math.sqrt(3) / 4
-        assert triangle.area() == pytest.approx(expected_area, rel=1e-9)
-        assert triangle.perimeter() == 3
-
 
 class TestAbstractFactory:
     """Test the Abstract Factory pattern."""
@@ -381,23 +429,29 @@ class TestAbstractFactory:
         assert isinstance(windows_factory, WindowsFactory)
         assert isinstance(macos_factory, MacOSFactory)
 
-    def test_ui_component_factory_case_insensitive(self):
+    def test_ui_component_factory_reused(self):
+        """Test that each platform's component factory is shared."""
+        factory = UIComponentFactory.create_factory("windows")
+
+        assert UIComponentFactory.create_factory("Windows") is factory
+        assert UIComponentFactory.create_factory("macos") is not factory
+
+    @pytest.mark.parametrize(
+        "platform, expected_class",
+        [
+            ("WINDOWS", WindowsFactory),
+            ("Windows", WindowsFactory),
+            ("windows", WindowsFactory),
+            ("MACOS", MacOSFactory),
+            ("MacOS", MacOSFactory),
+            ("macos", MacOSFactory),
+        ],
+    )
+    def test_ui_component_factory_case_insensitive(self, platform, expected_class):
         """Test UI component factory is case-insensitive."""
-        factories = [
-            UIComponentFactory.create_factory("WINDOWS"),
-            UIComponentFactory.create_factory("Windows"),
-            UIComponentFactory.create_factory("windows"),
-            UIComponentFactory.create_factory("MACOS"),
-            UIComponentFactory.create_factory("MacOS"),
-            UIComponentFactory.create_factory("macos"),
-        ]
+        factory = UIComponentFactory.create_factory(platform)
 
-        assert isinstance(factories[0], WindowsFactory)
-        assert isinstance(factories[1], WindowsFactory)
-        assert isinstance(factories[2], WindowsFactory)
-        assert isinstance(factories[3], MacOSFactory)
-        assert isinstance(factories[4], MacOSFactory)
-        assert isinstance(factories[5], MacOSFactory)
+        assert isinstance(factory, expected_class)
 
     def test_unknown_platform(self):
         """Test unknown platform raises ValueError."""
@@ -442,27 +496,29 @@ class TestAbstractFactory:
 class TestFactoryEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_empty_string_parameters(self):
+    @pytest.mark.parametrize(
+        "factory", FACTORY_ENTRY_POINTS, ids=FACTORY_ENTRY_POINT_IDS
+    )
+    def test_empty_string_parameters(self, factory):
         """Test factories with empty string parameters."""
         with pytest.raises(ValueError):
-            NotificationFactory.create_notifier("")
+            factory("")
 
-        with pytest.raises(ValueError):
-            ShapeFactory.create_shape("")
+    def test_lowercase_key_reused(self):
+        """Test that already-lowercase keys are not copied."""
+        from implementations.patterns.factory import _normalize_key
 
-        with pytest.raises(ValueError):
-            UIComponentFactory.create_factory("")
+        key = "email"
+        assert _normalize_key(key) is key
+        assert _normalize_key("EMail") == "email"
 
-    def test_none_parameters(self):
+    @pytest.mark.parametrize(
+        "factory", FACTORY_ENTRY_POINTS, ids=FACTORY_ENTRY_POINT_IDS
+    )
+    def test_none_parameters(self, factory):
         """Test factories with None parameters."""
         with pytest.raises(AttributeError):
-            NotificationFactory.create_notifier(None)
-
-        with pytest.raises(AttributeError):
-            ShapeFactory.create_shape(None)
-
-        with pytest.raises(AttributeError):
-            UIComponentFactory.create_factory(None)
+            factory(None)
 
     def test_extra_parameters(self):
         """Test factories with extra parameters."""
@@ -474,30 +530,35 @@ class TestFactoryEdgeCases:
         email = NotificationFactory.create_notifier("email", extra_param="ignored")
         assert isinstance(email, EmailNotifier)
 
-    def test_factory_consistency(self):
+    @pytest.mark.parametrize(
+        "create, expected_class",
+        [
+            (lambda i: ShapeFactory.create_shape("circle", radius=i), Circle),
+            (lambda i: NotificationFactory.create_notifier("email"), EmailNotifier),
+        ],
+        ids=["circle", "email"],
+    )
+    def test_factory_consistency(self, create, expected_class):
         """Test that factories consistently create the same type."""
         # Create multiple instances of the same type
-        circles = [ShapeFactory.create_shape("circle", radius=i) for i in range(1, 6)]
-        emails = [NotificationFactory.create_notifier("email") for _ in range(5)]
+        products = [create(i) for i in range(1, 6)]
 
         # All should be the same type
-        assert all(isinstance(c, Circle) for c in circles)
-        assert all(isinstance(e, EmailNotifier) for e in emails)
+        assert all(isinstance(p, expected_class) for p in products)
 
         # But different instances
-        assert len(set(id(c) for c in circles)) == 5
-        assert len(set(id(e) for e in emails)) == 5
+        assert len({*map(id, products)}) == 5
 
 
 class TestFactoryIntegration:
     """Test integration scenarios with factories."""
 
-    def test_notification_system_integration(self, capsys):
+    def test_notification_system_integration(self, capsys, default_notifiers):
         """Test a complete notification system using factories."""
-        # Create different notification services
-        email = NotificationFactory.create_notifier("email")
-        sms = NotificationFactory.create_notifier("sms")
-        push = NotificationFactory.create_notifier("push")
+        # Use the session's notification services
+        email = default_notifiers["email"]
+        sms = default_notifiers["sms"]
+        push = default_notifiers["push"]
 
         # Send notifications
         message = "System maintenance scheduled"
@@ -523,33 +584,52 @@ class TestFactoryIntegration:
         total_area = sum(shape.area() for shape in shapes)
         total_perimeter = sum(shape.perimeter() for shape in shapes)
 
-        expected_area = (math.pi * 25) + 12 + (math.sqrt(3) / 4 * 36)
-        expected_perimeter = (2 * math.pi * 5) + 14 + 18
-
-        assert total_area == pytest.approx(expected_area, rel=1e-9)
-        assert total_perimeter == pytest.approx(expected_perimeter, rel=1e-9)
-
-    def test_cross_platform_ui_system(self):
+        assert total_area == SHAPE_SYSTEM_AREA
+        assert total_perimeter == SHAPE_SYSTEM_PERIMETER
+
+    @pytest.mark.parametrize("count", [3, 1000])
+    def test_bulk_shape_calculation_system(self, count):
+        """Test shape totals against vectorized NumPy reference values."""
+        np = pytest.importorskip("numpy")
+
+        sizes = np.arange(1, count + 1, dtype=np.float64)
+        expected_area = (
+            np.pi * sizes**2 + sizes * (sizes + 1) + (np.sqrt(3) / 4) * sizes**2
+        ).sum()
+        expected_perimeter = (
+            2 * np.pi * sizes + 2 * (sizes + (sizes + 1)) + 3 * sizes
+        ).sum()
+
+        shapes = []
+        for size in range(1, count + 1):
+            shapes.append(ShapeFactory.create_shape("circle", radius=size))
+            shapes.append(
+                ShapeFactory.create_shape("rectangle", width=size, height=size + 1)
+            )
+            shapes.append(ShapeFactory.create_shape("triangle", side=size))
+
+        assert sum(s.area() for s in shapes) == pytest.approx(expected_area)
+        assert sum(s.perimeter() for s in shapes) == pytest.approx(expected_perimeter)
+
+    @pytest.mark.parametrize("platform", ["windows", "macos"])
+    def test_cross_platform_ui_system(self, platform):
         """Test a cross-platform UI system."""
-        platforms = ["windows", "macos"]
-
-        for platform in platforms:
-            factory = UIComponentFactory.create_factory(platform)
+        factory = UIComponentFactory.create_factory(platform)
 
-            # Create UI components
-            button = factory.create_button()
-            checkbox = factory.create_checkbox()
+        # Create UI components
+        button = factory.create_button()
+        checkbox = factory.create_checkbox()
 
-            # Test that they work correctly
-            button_description = button.paint()
-            checkbox_description = checkbox.paint()
+        # Test that they work correctly
+        button_description = button.paint()
+        checkbox_description = checkbox.paint()
 
-            assert platform.lower() in button_description.lower()
-            assert platform.lower() in checkbox_description.lower()
+        assert platform.lower() in button_description.lower()
+        assert platform.lower() in checkbox_description.lower()
 
-            # Test polymorphism
-            assert isinstance(button, Button)
-            assert isinstance(checkbox, Checkbox)
+        # Test polymorphism
+        assert isinstance(button, Button)
+        assert isinstance(checkbox, Checkbox)
 
 
 class TestFactoryPerformance:
@@ -557,17 +637,33 @@ class TestFactoryPerformance:
 
     def test_factory_creation_performance(self):
         """Test that factory creation is efficient."""
-        import time
-
-        # Time shape creation
-        start = time.time()
-        shapes = [ShapeFactory.create_shape("circle", radius=i) for i in range(1, 1001)]
-        creation_time = time.time() - start
+        # Time shape creation with a monotonic high-resolution clock
+        start_ns = time.perf_counter_ns()
+        shapes = ShapeFactory.create_many(
+            "circle", ({"radius": i} for i in range(1, 1001))
+        )
+        creation_time_ns = time.perf_counter_ns() - start_ns
 
         assert len(shapes) == 1000
-        assert creation_time < 1.0  # Should be very fast
+        assert creation_time_ns < 1_000_000_000  # Should be well under a second
         assert all(isinstance(s, Circle) for s in shapes)
 
+    @pytest.mark.parametrize(
+        "product",
+        [
+            Circle(1),
+            Rectangle(1, 2),
+            Triangle(1),
+            EmailNotifier(),
+            SMSNotifier(),
+            PushNotifier(),
+        ],
+        ids=lambda product: type(product).__name__,
+    )
+    def test_products_have_no_instance_dict(self, product):
+        """Test that shapes and notifiers use slots instead of a __dict__."""
+        assert not hasattr(product, "__dict__")
+
     def test_factory_memory_usage(self):
         """Test that factories don't leak memory."""
         import gc
@@ -1,5 +1,6 @@
 """Tests for observer pattern implementations."""
 
+import threading
 import time
 from datetime import datetime
 from unittest.mock import Mock, call
@@ -88,10 +89,28 @@ class TestBasicObserverPattern:
         subject.register_observer(observer)
         subject.register_observer(observer)  # Register again
 
-        # Should only be registered once (using set)
+        # Should only be registered once
         assert len(subject._observers) == 1
         assert observer in subject._observers
 
+    def test_observers_notified_in_registration_order(self):
+        """Test that observers are notified in the order they registered."""
+        subject = ConcreteSubject()
+        calls = []
+
+        class RecordingObserver(Observer):
+            def __init__(self, name):
+                self.name = name
+
+            def update(self, state):
+                calls.append(self.name)
+
+        for name in ["first", "second", "third"]:
+            subject.register_observer(RecordingObserver(name))
+
+        subject.set_state("ordered")
+        assert calls == ["first", "second", "third"]
+
     def test_state_notification(self, capsys):
         """Test that observers are notified when state changes."""
         subject = ConcreteSubject()
@@ -121,6 +140,17 @@ class TestBasicObserverPattern:
         subject.set_state("test_state")
         assert subject.get_state() == "test_state"
 
+    def test_unchanged_state_does_not_notify(self):
+        """Test that setting the same state twice notifies only once."""
+        subject = ConcreteSubject()
+        observer = Mock(spec=Observer)
+        subject.register_observer(observer)
+
+        subject.set_state("same")
+        subject.set_state("same")
+
+        observer.update.assert_called_once_with("same")
+
     def test_notification_after_removal(self, capsys):
         """Test that removed observers don't receive notifications."""
         subject = ConcreteSubject()
@@ -201,9 +231,10 @@ class TestWeatherStation:
         assert "Statistics: Avg temp: 25.0°C, Min: 20.0°C, Max: 30.0°C" in lines[-1]
 
         # Check display state
-        assert display._temperatures == [20.0, 25.0, 30.0]
-        assert display._humidities == [60.0, 65.0, 70.0]
-        assert display._pressures == [1010.0, 1015.0, 1020.0]
+        assert display._temp_count == 3
+        assert display._temp_sum == 75.0
+        assert display._temp_min == 20.0
+        assert display._temp_max == 30.0
 
     def test_forecast_display(self, capsys):
         """Test forecast display."""
@@ -251,6 +282,119 @@ class TestWeatherStation:
         assert "Statistics:" in captured.out
         assert "Forecast:" in captured.out
 
+    def test_duplicate_weather_observer_registration(self):
+        """Test that a display registered twice is notified once."""
+        station = WeatherStation()
+        observer = Mock(spec=WeatherObserver)
+
+        station.register_observer(observer)
+        station.register_observer(observer)
+        station.set_measurements(25.0, 65.0, 1013.0)
+
+        assert len(station._observers) == 1
+        observer.update.assert_called_once_with(station)
+
+    def test_forecast_display_pulls_only_pressure(self, capsys):
+        """Test that observers pull the measurements they need."""
+        station = Mock(spec=WeatherStation)
+        station.get_pressure.return_value = 1013.0
+        display = ForecastDisplay()
+
+        display.update(station)
+
+        station.get_pressure.assert_called_once_with()
+        station.get_temperature.assert_not_called()
+        station.get_humidity.assert_not_called()
+        assert "Forecast: More of the same" in capsys.readouterr().out
+
+    def test_unchanged_measurements_do_not_notify(self):
+        """Test that repeating the same measurements skips notification."""
+        station = WeatherStation()
+        observer = Mock(spec=WeatherObserver)
+        station.register_observer(observer)
+
+        station.set_measurements(25.0, 65.0, 1013.0)
+        station.set_measurements(25.0, 65.0, 1013.0)
+        assert observer.update.call_count == 1
+
+        station.set_measurements(25.0, 65.0, 1014.0)
+        assert observer.update.call_count == 2
+
+    def test_first_zero_reading_notifies(self):
+        """Test that a first reading of all zeros still notifies observers."""
+        station = WeatherStation()
+        observer = Mock(spec=WeatherObserver)
+        station.register_observer(observer)
+
+        station.set_measurements(0.0, 0.0, 0.0)
+        assert observer.update.call_count == 1
+
+        station.set_measurements(0.0, 0.0, 0.0)
+        assert observer.update.call_count == 1
+
+    def test_display_output_flushed_once_per_notification(self, capsys):
+        """Test that display output is buffered until the cycle completes."""
+        station = WeatherStation()
+        writes = []
+
+        class WriteCountingDisplay(WeatherObserver):
+            def update(self, station):
+                writes.append(capsys.readouterr().out)
+
+        station.register_observer(CurrentConditionsDisplay())
+        station.register_observer(WriteCountingDisplay())
+        station.register_observer(ForecastDisplay())
+
+        station.set_measurements(25.0, 65.0, 1013.0)
+
+        # Nothing reached stdout while observers were still being notified
+        assert writes == [""]
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == [
+            "Current conditions: 25.0°C, 65.0% humidity, 1013.0 hPa",
+            "Forecast: More of the same",
+        ]
+
+    def test_display_output_flushed_when_observer_raises(self, capsys):
+        """Test buffered output is written even if an observer fails."""
+        station = WeatherStation()
+        failing = Mock(spec=WeatherObserver)
+        failing.update.side_effect = RuntimeError("display failed")
+        station.register_observer(CurrentConditionsDisplay())
+        station.register_observer(failing)
+
+        with pytest.raises(RuntimeError):
+            station.set_measurements(25.0, 65.0, 1013.0)
+        assert capsys.readouterr().out == (
+            "Current conditions: 25.0°C, 65.0% humidity, 1013.0 hPa\n"
+        )
+
+        ForecastDisplay().update(station)
+        assert capsys.readouterr().out == "Forecast: More of the same\n"
+
+    def test_output_buffer_is_per_thread(self, capsys):
+        """Test a notification cycle does not hold another thread's output."""
+        station = WeatherStation()
+        other_station = Mock(spec=WeatherStation)
+        other_station.get_pressure.return_value = 1000.0
+        seen = []
+
+        class CrossThreadDisplay(WeatherObserver):
+            def update(self, station):
+                worker = threading.Thread(
+                    target=ForecastDisplay().update, args=(other_station,)
+                )
+                worker.start()
+                worker.join()
+                seen.append(capsys.readouterr().out)
+
+        station.register_observer(CurrentConditionsDisplay())
+        station.register_observer(CrossThreadDisplay())
+        station.set_measurements(25.0, 65.0, 1013.0)
+
+        assert seen == ["Forecast: More of the same\n"]
+        assert capsys.readouterr().out.startswith("Current conditions")
+
     def test_weather_observer_removal(self, capsys):
         """Test removing weather observers."""
         station = WeatherStation()
@@ -300,7 +444,7 @@ class TestStockObserver:
 
     def test_trading_bot_signals(self, capsys):
         """Test trading bot signals."""
-        stock = Stock("AAPL", 150.0)
+        stock = Stock("AAPL", 145.0)
         bot = TradingBot("AlgoBot", buy_threshold=140.0, sell_threshold=160.0)
 
         stock.register_observer(bot)
@@ -337,6 +481,19 @@ class TestStockObserver:
         captured = capsys.readouterr()
         assert "AlgoBot: SELL signal for AAPL at $160.00" in captured.out
 
+    def test_unchanged_price_does_not_notify(self):
+        """Test that setting the same price skips notification."""
+        stock = Stock("AAPL", 150.0)
+        observer = Mock(spec=StockObserver)
+        stock.register_observer(observer)
+
+        stock.set_price(150.0)
+        observer.update.assert_not_called()
+
+        stock.set_price(151.0)
+        stock.set_price(151.0)
+        observer.update.assert_called_once_with(stock)
+
     def test_multiple_stock_observers(self, capsys):
         """Test multiple observers on the same stock."""
         stock = Stock("AAPL", 150.0)
@@ -369,12 +526,28 @@ class TestEventSystem:
         assert event.source == "user_service"
         assert isinstance(event.timestamp, datetime)
 
+    def test_event_uses_slots(self):
+        """Test that events don't allocate a per-instance __dict__."""
+        event = Event("user_registered", {}, datetime.now(), "user_service")
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = "not allowed"
+
     def test_event_manager_creation(self):
         """Test creating event manager."""
         manager = EventManager()
         assert len(manager._listeners) == 0
         assert len(manager._event_history) == 0
 
+    def test_event_manager_uses_slots(self):
+        """Test that the event manager keeps its state in fixed slots."""
+        manager = EventManager()
+
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.extra = "not allowed"
+
     def test_event_subscription(self):
         """Test subscribing to events."""
         manager = EventManager()
@@ -409,6 +582,24 @@ class TestEventSystem:
         manager.unsubscribe("test_event", callback)
         assert "test_event" not in manager._listeners
 
+    def test_unsubscribe_during_emit(self, capsys):
+        """Test a callback can unsubscribe itself while an event is dispatched."""
+        manager = EventManager()
+        received = []
+
+        def once(event):
+            received.append("once")
+            manager.unsubscribe("test_event", once)
+
+        manager.subscribe("test_event", once)
+        manager.subscribe("test_event", lambda event: received.append("always"))
+
+        manager.emit("test_event", {})
+        manager.emit_many("test_event", [{}, {}])
+
+        assert received == ["once", "always", "always", "always"]
+        assert "Error" not in capsys.readouterr().out
+
     def test_event_emission(self):
         """Test emitting events."""
         manager = EventManager()
@@ -455,6 +646,20 @@ class TestEventSystem:
         assert len(event2_history) == 1
         assert event2_history[0].event_type == "event2"
 
+    def test_event_history_keeps_dispatched_events(self):
+        """Test that history holds the events listeners received, in a copy."""
+        manager = EventManager()
+        received_events = []
+        manager.subscribe("event1", received_events.append)
+
+        manager.emit("event1", {"data": 1}, "source1")
+
+        history = manager.get_event_history()
+        assert history[0] is received_events[0]
+
+        history.clear()
+        assert len(manager.get_event_history()) == 1
+
     def test_clear_event_history(self):
         """Test clearing event history."""
         manager = EventManager()
@@ -467,6 +672,36 @@ class TestEventSystem:
         manager.clear_history()
         assert len(manager.get_event_history()) == 0
 
+    def test_burst_events_share_clock_reading(self, monkeypatch):
+        """Test that events within one clock quantum reuse the timestamp."""
+        from implementations.patterns import observer as observer_module
+
+        manager = EventManager()
+        ticks = iter([100.0, 100.0005, 100.002])
+        monkeypatch.setattr(observer_module, "perf_counter", lambda: next(ticks))
+        monkeypatch.setattr(observer_module, "_last_now", (float("-inf"), None))
+
+        for n in range(3):
+            manager.emit("tick", {"n": n})
+
+        first, second, third = manager.get_event_history("tick")
+        assert first.timestamp is second.timestamp
+        assert third.timestamp is not first.timestamp
+        assert third.timestamp >= first.timestamp
+
+    def test_event_history_disabled(self):
+        """Test that history can be turned off without affecting delivery."""
+        manager = EventManager(record_history=False)
+        received_events = []
+
+        manager.emit("unheard", {"data": 1}, "source1")
+        manager.subscribe("heard", received_events.append)
+        manager.emit("heard", {"data": 2}, "source2")
+        manager.emit_many("heard", [{"data": 3}])
+
+        assert manager.get_event_history() == []
+        assert [e.data["data"] for e in received_events] == [2, 3]
+
     def test_multiple_callbacks(self):
         """Test multiple callbacks for the same event."""
         manager = EventManager()
@@ -506,6 +741,94 @@ class TestEventSystem:
         assert "Error in event callback: Callback error" in captured.out
         assert "Working callback received: test_event" in captured.out
 
+    def test_emit_many_batch_dispatch(self):
+        """Test that batch callbacks receive all events in one call."""
+        manager = EventManager()
+        batches = []
+        single_events = []
+        calls = []
+
+        def on_batch(events):
+            calls.append("batch")
+            batches.append(events)
+
+        def on_event(event):
+            calls.append("event")
+            single_events.append(event)
+
+        manager.subscribe_batch("bulk", on_batch)
+        manager.subscribe("bulk", on_event)
+
+        manager.emit_many("bulk", [{"n": 1}, {"n": 2}, {"n": 3}], "importer")
+
+        # Per-event listeners run before batch listeners, as in emit
+        assert calls == ["event", "event", "event", "batch"]
+
+        assert len(batches) == 1
+        assert [e.data["n"] for e in batches[0]] == [1, 2, 3]
+        assert len({e.timestamp for e in batches[0]}) == 1
+        assert all(e.source == "importer" for e in batches[0])
+        assert single_events == batches[0]
+        assert manager.get_event_history("bulk") == batches[0]
+
+    def test_emit_many_empty_and_unsubscribe(self):
+        """Test emit_many with no data and batch unsubscription."""
+        manager = EventManager()
+        batches = []
+
+        manager.subscribe_batch("bulk", batches.append)
+        manager.emit_many("bulk", [])
+        assert batches == []
+        assert len(manager.get_event_history()) == 0
+
+        manager.emit("bulk", {"n": 1})
+        assert len(batches) == 1
+        assert len(batches[0]) == 1
+
+        manager.unsubscribe_batch("bulk", batches.append)
+        manager.emit_many("bulk", [{"n": 2}])
+        assert len(batches) == 1
+
+    def test_callback_exceptions_do_not_skip_later_callbacks(self, capsys):
+        """Test that every callback after a failing one still runs."""
+        manager = EventManager()
+        calls = []
+
+        def failing_callback(event):
+            calls.append("failing")
+            raise RuntimeError(f"boom {event.data['n']}")
+
+        manager.subscribe("test_event", failing_callback)
+        manager.subscribe("test_event", lambda event: calls.append("first"))
+        manager.subscribe("test_event", failing_callback)
+        manager.subscribe("test_event", lambda event: calls.append("last"))
+
+        manager.emit("test_event", {"n": 1})
+
+        assert calls == ["failing", "first", "failing", "last"]
+        captured = capsys.readouterr()
+        assert captured.out.count("Error in event callback: boom 1") == 2
+
+    def test_publisher_tracks_subscription_changes(self):
+        """Test that a publisher sees listeners added after it was created."""
+        manager = EventManager()
+        received_events = []
+        publish = manager.get_publisher("test_event")
+
+        publish({"n": 1})
+        manager.subscribe("test_event", received_events.append)
+        publish({"n": 2}, "publisher")
+        manager.unsubscribe("test_event", received_events.append)
+        publish({"n": 3})
+
+        assert [e.data["n"] for e in received_events] == [2]
+        assert received_events[0].source == "publisher"
+        assert [e.data["n"] for e in manager.get_event_history("test_event")] == [
+            1,
+            2,
+            3,
+        ]
+
 
 class TestUserService:
     """Test the UserService implementation."""
@@ -839,6 +1162,32 @@ class TestObserverPatternEdgeCases:
         subject.set_state("second")
         assert len(observer.updates) == 1  # Still only one update
 
+    def test_observer_registering_during_notification(self):
+        """Test that observers added mid-notification wait for the next round."""
+        subject = ConcreteSubject()
+        late_observer = Mock(spec=Observer)
+
+        class RegisteringObserver(Observer):
+            def update(self, state):
+                subject.register_observer(late_observer)
+
+        subject.register_observer(RegisteringObserver())
+        subject.set_state("first")
+        late_observer.update.assert_not_called()
+
+        subject.set_state("second")
+        late_observer.update.assert_called_once_with("second")
+
+    def test_concurrent_registration(self, thread_pool):
+        """Test that concurrent registrations are never lost."""
+        subject = ConcreteSubject()
+        observers = [ConcreteObserver(f"Observer_{i}") for i in range(200)]
+
+        list(thread_pool.map(subject.register_observer, observers))
+
+        assert len(subject._observers) == 200
+        assert all(observer in subject._observers for observer in observers)
+
     def test_notification_with_no_observers(self):
         """Test notification when no observers are registered."""
         subject = ConcreteSubject()
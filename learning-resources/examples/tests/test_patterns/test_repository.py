@@ -27,6 +27,21 @@ from implementations.patterns.repository import (  # Domain Models; Repository I
     UserService,
 )
 
+# Pre-serialized fixture for the existing-file JSON repository test
+_EXISTING_USERS_JSON = json.dumps(
+    {
+        "users": [
+            {
+                "id": 1,
+                "name": "Alice",
+                "email": "alice@example.com",
+                "created_at": "2023-01-01T12:00:00",
+            }
+        ],
+        "next_id": 2,
+    }
+).encode()
+
 
 class TestDomainModels:
     """Test domain model implementations."""
@@ -457,86 +472,58 @@ class TestInMemoryOrderRepository:
 class TestJsonFileUserRepository:
     """Test JSON file user repository implementation."""
 
-    def test_repository_creation_new_file(self):
+    def test_repository_creation_new_file(self, tmp_path):
         """Test creating repository with new file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            temp_path = f.name
+        temp_path = tmp_path / "new.json"
 
-        try:
-            repo = JsonFileUserRepository(temp_path)
+        repo = JsonFileUserRepository(str(temp_path))
 
-            assert len(repo._users) == 0
-            assert repo._next_id == 1
-            assert os.path.exists(temp_path)
-        finally:
-            os.unlink(temp_path)
+        assert len(repo._users) == 0
+        assert repo._next_id == 1
+        assert temp_path.exists()
 
-    def test_repository_creation_existing_file(self):
+    def test_repository_creation_existing_file(self, tmp_path):
         """Test creating repository with existing file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            # Write some test data
-            test_data = {
-                "users": [
-                    {
-                        "id": 1,
-                        "name": "Alice",
-                        "email": "alice@example.com",
-                        "created_at": "2023-01-01T12:00:00",
-                    }
-                ],
-                "next_id": 2,
-            }
-            json.dump(test_data, f)
-            temp_path = f.name
+        temp_path = tmp_path / "existing.json"
+        temp_path.write_bytes(_EXISTING_USERS_JSON)
 
-        try:
-            repo = JsonFileUserRepository(temp_path)
+        repo = JsonFileUserRepository(str(temp_path))
 
-            assert len(repo._users) == 1
-            assert repo._next_id == 2
-            assert repo._users[0].name == "Alice"
-        finally:
-            os.unlink(temp_path)
+        assert len(repo._users) == 1
+        assert repo._next_id == 2
+        assert repo._users[0].name == "Alice"
 
-    def test_save_and_load(self):
+    def test_save_and_load(self, tmp_path):
         """Test saving and loading from file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "save_and_load.json")
 
-        try:
-            repo = JsonFileUserRepository(temp_path)
+        repo = JsonFileUserRepository(temp_path)
 
-            # Save a user
-            user = User(id=None, name="Alice", email="alice@example.com")
-            saved_user = repo.save(user)
+        # Save a user
+        user = User(id=None, name="Alice", email="alice@example.com")
+        saved_user = repo.save(user)
 
-            # Create new repository instance to test loading
-            repo2 = JsonFileUserRepository(temp_path)
+        # Create new repository instance to test loading
+        repo2 = JsonFileUserRepository(temp_path)
 
-            assert len(repo2._users) == 1
-            assert repo2._next_id == 2
+        assert len(repo2._users) == 1
+        assert repo2._next_id == 2
 
-            found_user = repo2.find_by_id(saved_user.id)
-            assert found_user is not None
-            assert found_user.name == "Alice"
-            assert found_user.email == "alice@example.com"
-        finally:
-            os.unlink(temp_path)
+        found_user = repo2.find_by_id(saved_user.id)
+        assert found_user is not None
+        assert found_user.name == "Alice"
+        assert found_user.email == "alice@example.com"
 
-    def test_corrupted_file_handling(self):
+    def test_corrupted_file_handling(self, tmp_path):
         """Test handling of corrupted JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            f.write("invalid json content")
-            temp_path = f.name
+        temp_path = tmp_path / "corrupted.json"
+        temp_path.write_text("invalid json content")
 
-        try:
-            repo = JsonFileUserRepository(temp_path)
+        repo = JsonFileUserRepository(str(temp_path))
 
-            # Should start with empty state
-            assert len(repo._users) == 0
-            assert repo._next_id == 1
-        finally:
-            os.unlink(temp_path)
+        # Should start with empty state
+        assert len(repo._users) == 0
+        assert repo._next_id == 1
 
     def test_missing_file_handling(self):
         """Test handling of missing file."""
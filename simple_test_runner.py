@@ -7,12 +7,17 @@ import sys
 import os
 import traceback
 import tempfile
-import json
 from pathlib import Path
 
 # Add implementations to path
 sys.path.insert(0, 'learning-resources/examples/implementations')
 
+# Pre-serialized repository file with one existing user
+_EXISTING_USERS_JSON = (
+    b'{"users": [{"id": 1, "name": "Alice", "email": "alice@example.com", '
+    b'"created_at": "2023-01-01T12:00:00"}], "next_id": 2}'
+)
+
 def test_singleton_basic():
     """Test singleton pattern basic functionality."""
     print("Testing singleton pattern...")
@@ -79,31 +84,14 @@ def test_repository_json_file():
             
             print("✅ JSON file repository new file test passed")
             
-            # Test with existing file
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-                test_data = {
-                    'users': [
-                        {
-                            'id': 1,
-                            'name': 'Alice',
-                            'email': 'alice@example.com',
-                            'created_at': '2023-01-01T12:00:00',
-                        }
-                    ],
-                    'next_id': 2,
-                }
-                json.dump(test_data, f)
-                temp_path2 = f.name
+            # Test with existing file, reusing the same temp file
+            Path(temp_path).write_bytes(_EXISTING_USERS_JSON)
             
-            try:
-                repo2 = JsonFileUserRepository(temp_path2)
-                assert len(repo2._users) == 1
-                assert repo2._next_id == 2
-                assert repo2._users[0].name == 'Alice'
-                print("✅ JSON file repository existing file test passed")
-                
-            finally:
-                os.unlink(temp_path2)
+            repo2 = JsonFileUserRepository(temp_path)
+            assert len(repo2._users) == 1
+            assert repo2._next_id == 2
+            assert repo2._users[0].name == 'Alice'
+            print("✅ JSON file repository existing file test passed")
             
         finally:
             os.unlink(temp_path)